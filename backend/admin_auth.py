@@ -0,0 +1,36 @@
+import os
+import hmac
+from typing import Optional
+from fastapi import Header, HTTPException, status
+
+def admin_token() -> str:
+    return os.environ.get('ADMIN_API_TOKEN', '').strip()
+
+async def require_admin(
+    authorization: Optional[str] = Header(None),
+    x_admin_token: Optional[str] = Header(None)
+):
+    """
+    Guard for admin routes: the request must carry ADMIN_API_TOKEN, either as
+    "Authorization: Bearer <token>" or in an X-Admin-Token header. With no
+    token configured the routes are disabled rather than left open.
+    """
+    expected = admin_token()
+    if not expected:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Admin API is disabled (ADMIN_API_TOKEN is not set)"
+        )
+
+    supplied = x_admin_token or ""
+    if authorization:
+        scheme, _, credentials = authorization.partition(" ")
+        if scheme.lower() == "bearer":
+            supplied = credentials.strip()
+
+    if not supplied or not hmac.compare_digest(supplied.encode(), expected.encode()):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid or missing admin token",
+            headers={"WWW-Authenticate": "Bearer"}
+        )
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Documents per second for turning Mongo documents into response models.
+
+Compares, on synthetic service documents:
+  - BSON decode of the full document vs. the projected one
+  - the old hand-written dict copy + Service(**dict) vs. Service.from_document
+No database is needed; the documents are encoded and decoded locally.
+
+    cd backend && python benchmarks/document_mapping.py [--docs 2000] [--rounds 5]
+"""
+
+import argparse
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+
+import bson
+from bson import ObjectId
+
+from models import Service
+
+def make_documents(count: int):
+    now = datetime.utcnow()
+    return [
+        {
+            "_id": ObjectId(),
+            "name": f"Service {i}",
+            "description": "Professional exterior cleaning for homes and businesses. " * 4,
+            "icon": "droplets",
+            "features": [f"Feature {n}" for n in range(8)],
+            "pricing": {"starting": 150 + i % 50, "unit": "per visit"},
+            "duration": "2-4 hours",
+            "availability": "Year-round",
+            "active": True,
+            "created_at": now,
+            "updated_at": now,
+            # Fields the API never returns but full fetches still pay for
+            "internal_notes": "x" * 2048,
+            "revision_history": [{"at": now, "by": "admin", "change": "y" * 200} for _ in range(10)],
+        }
+        for i in range(count)
+    ]
+
+def legacy_from_doc(service_doc: dict) -> Service:
+    service_dict = {
+        "id": str(service_doc.get("_id", service_doc.get("id", ""))),
+        "name": service_doc["name"],
+        "description": service_doc["description"],
+        "icon": service_doc["icon"],
+        "features": service_doc["features"],
+        "pricing": service_doc["pricing"],
+        "duration": service_doc["duration"],
+        "availability": service_doc["availability"],
+        "active": service_doc.get("active", True),
+        "created_at": service_doc.get("created_at", datetime.utcnow()),
+        "updated_at": service_doc.get("updated_at", datetime.utcnow())
+    }
+    return Service(**service_dict)
+
+def rate(label: str, func, items, rounds: int):
+    best = float("inf")
+    for _ in range(rounds):
+        started = time.perf_counter()
+        for item in items:
+            func(item)
+        best = min(best, time.perf_counter() - started)
+    per_second = len(items) / best
+    print(f"  {label:<38} {per_second:>12,.0f} docs/s")
+    return per_second
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--docs", type=int, default=2000)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    documents = make_documents(args.docs)
+    projection = Service.projection()
+    full_bson = [bson.encode(doc) for doc in documents]
+    projected_bson = [
+        bson.encode({key: value for key, value in doc.items() if key in projection})
+        for doc in documents
+    ]
+    full_size = sum(len(raw) for raw in full_bson) / len(full_bson)
+    projected_size = sum(len(raw) for raw in projected_bson) / len(projected_bson)
+
+    print(f"{args.docs} service documents, best of {args.rounds} rounds")
+    print(f"  average BSON size: full {full_size:,.0f} B, projected {projected_size:,.0f} B")
+    print("BSON decode")
+    full_rate = rate("full document", bson.decode, full_bson, args.rounds)
+    projected_rate = rate("projected document", bson.decode, projected_bson, args.rounds)
+    print(f"  speedup {projected_rate / full_rate:.2f}x")
+
+    decoded = [bson.decode(raw) for raw in projected_bson]
+    print("Model mapping")
+    legacy_rate = rate("dict copy + Service(**dict)", legacy_from_doc, decoded, args.rounds)
+    mapped_rate = rate("Service.from_document", Service.from_document, decoded, args.rounds)
+    print(f"  speedup {mapped_rate / legacy_rate:.2f}x")
+
+    print("End to end (decode + map)")
+    before = rate("full fetch + dict copy", lambda raw: legacy_from_doc(bson.decode(raw)), full_bson, args.rounds)
+    after = rate("projected fetch + from_document", lambda raw: Service.from_document(bson.decode(raw)), projected_bson, args.rounds)
+    print(f"  speedup {after / before:.2f}x")
+
+if __name__ == "__main__":
+    main()
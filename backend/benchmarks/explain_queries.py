@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Check that every query the API issues is served by an index.
+
+Connects to MONGO_URL / DB_NAME (backend/.env is loaded), applies the index
+registry from database.py and runs explain() on each query shape. Exits
+non-zero if any winning plan falls back to a collection scan.
+
+    cd backend && python benchmarks/explain_queries.py
+"""
+
+import asyncio
+import os
+import sys
+from datetime import datetime
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+
+from bson import ObjectId
+from dotenv import load_dotenv
+from motor.motor_asyncio import AsyncIOMotorClient
+
+load_dotenv(BACKEND_DIR / '.env')
+
+from database import Database
+
+def query_shapes():
+    now = datetime.utcnow()
+    # (collection, filter, sort, label)
+    return [
+        ("services", {"active": True}, None, "get_services"),
+        ("testimonials", {"approved": True}, [("created_at", -1)], "get_testimonials"),
+        ("quote_requests", {}, [("created_at", -1), ("_id", -1)], "get_quote_requests"),
+        (
+            "quote_requests",
+            {"status": "pending", "$or": [
+                {"created_at": {"$lt": now}},
+                {"created_at": now, "_id": {"$lt": ObjectId()}}
+            ]},
+            [("created_at", -1), ("_id", -1)],
+            "get_quote_requests (status page)"
+        ),
+        ("quote_requests", {"service": "Pressure Washing"}, [("created_at", -1), ("_id", -1)], "get_quote_requests (service)"),
+        ("contact_submissions", {}, [("created_at", -1)], "contact submissions by date"),
+        (
+            "email_outbox",
+            {"status": {"$in": ["pending", "retry"]}, "next_attempt_at": {"$lte": now}},
+            [("next_attempt_at", 1)],
+            "claim_email_job (due jobs)"
+        ),
+        (
+            "email_outbox",
+            {"status": "sending", "locked_at": {"$lte": now}},
+            None,
+            "claim_email_job (stale jobs)"
+        ),
+    ]
+
+def plan_stages(plan: dict):
+    """Yield every stage name in a (possibly nested) query plan"""
+    yield plan.get("stage")
+    for key in ("inputStage", "queryPlan"):
+        if key in plan:
+            yield from plan_stages(plan[key])
+    for child in plan.get("inputStages", []):
+        yield from plan_stages(child)
+
+async def explain_plans(database: Database):
+    """(label, collection, winning plan stages) for every query shape"""
+    results = []
+    for collection, query, sort, label in query_shapes():
+        cursor = database.db[collection].find(query)
+        if sort:
+            cursor = cursor.sort(sort)
+        explain = await cursor.explain()
+        stages = [stage for stage in plan_stages(explain["queryPlanner"]["winningPlan"]) if stage]
+        results.append((label, collection, stages))
+    return results
+
+async def main() -> int:
+    database = Database()
+    database.client = AsyncIOMotorClient(os.environ['MONGO_URL'])
+    database.db = database.client[os.environ.get('DB_NAME', 'cleanpro_services')]
+    await database.ensure_indexes()
+
+    failures = 0
+    for label, collection, stages in await explain_plans(database):
+        ok = "COLLSCAN" not in stages
+        failures += not ok
+        print(f"{'ok  ' if ok else 'FAIL'} {label:32} {collection:20} {' <- '.join(stages)}")
+
+    database.client.close()
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Photo pipeline benchmark: bytes on the wire and SMTP send time for a contact
+email with and without the image processing stage.
+
+Mail goes to an in-process aiosmtpd sink, so nothing leaves the machine.
+Requires Pillow and aiosmtpd.
+
+    cd backend && python benchmarks/image_pipeline.py --photos 3
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from aiosmtpd.controller import Controller
+from aiosmtpd.smtp import AuthResult
+from PIL import Image
+
+class SinkHandler:
+    def __init__(self):
+        self.sizes = []
+
+    async def handle_DATA(self, server, session, envelope):
+        self.sizes.append(len(envelope.content))
+        return '250 OK'
+
+def make_photo(path: Path, width: int, height: int):
+    """Write a camera-like JPEG: smooth gradients plus sensor noise, with EXIF"""
+    gradient = Image.linear_gradient("L").resize((width, height))
+    noise = Image.effect_noise((width, height), 24)
+    image = Image.merge("RGB", (gradient, noise, gradient.transpose(Image.Transpose.FLIP_LEFT_RIGHT)))
+    exif = Image.Exif()
+    exif[0x0112] = 6  # Orientation: rotate 90
+    exif[0x010F] = "BenchmarkCam"
+    image.save(path, "JPEG", quality=95, exif=exif)
+
+async def run(args):
+    handler = SinkHandler()
+    controller = Controller(
+        handler, hostname="127.0.0.1", port=args.port,
+        auth_require_tls=False, authenticator=lambda *a: AuthResult(success=True)
+    )
+    controller.start()
+
+    os.environ.update({
+        "SMTP_SERVER": "127.0.0.1",
+        "SMTP_PORT": str(args.port),
+        "SMTP_STARTTLS": "false",
+        "SMTP_USERNAME": "bench",
+        "SMTP_PASSWORD": "bench",
+        "SENDER_EMAIL": "bench@example.com",
+        "RECIPIENT_EMAIL": "sink@example.com",
+        "IMAGE_PROCESSING_ENABLED": "true",
+        "IMAGE_MAX_DIMENSION": str(args.max_dimension),
+        "IMAGE_OUTPUT_FORMAT": args.format,
+        "IMAGE_QUALITY": str(args.quality),
+    })
+    from email_service import EmailService
+    from image_processing import ImageProcessor
+
+    service = EmailService()
+    processor = ImageProcessor()
+    workdir = Path(tempfile.mkdtemp(prefix="image-bench-"))
+    results = {}
+    try:
+        originals = []
+        for n in range(args.photos):
+            path = workdir / f"photo{n}.jpg"
+            make_photo(path, args.width, args.height)
+            originals.append({"filename": path.name, "content_type": "image/jpeg", "path": str(path), "size": path.stat().st_size})
+
+        for label in ("original", "processed"):
+            attachments = []
+            process_start = time.perf_counter()
+            for original in originals:
+                copy = workdir / f"{label}-{original['filename']}"
+                shutil.copy(original["path"], copy)
+                attachment = dict(original, path=str(copy))
+                if label == "processed":
+                    attachment = await processor.optimize(attachment)
+                attachments.append(attachment)
+            process_seconds = time.perf_counter() - process_start
+
+            send_times = []
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                await service.deliver_contact_email(
+                    name="Bench", email="bench@example.com", phone=None,
+                    service="Pressure Washing", message="Benchmark run", attachments=attachments
+                )
+                send_times.append((time.perf_counter() - start) * 1000)
+
+            results[label] = {
+                "attachment_bytes": sum(os.path.getsize(a["path"]) for a in attachments),
+                "wire_bytes": handler.sizes[-1],
+                "send_ms_median": round(sorted(send_times)[len(send_times) // 2], 2),
+                "processing_ms": round(process_seconds * 1000, 2) if label == "processed" else 0.0,
+            }
+    finally:
+        processor.close()
+        service.close()
+        controller.stop()
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    results["wire_bytes_saved_pct"] = round(
+        100 * (1 - results["processed"]["wire_bytes"] / results["original"]["wire_bytes"]), 1
+    )
+    print(json.dumps({"params": vars(args), "results": results}, indent=2))
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--photos", type=int, default=3)
+    parser.add_argument("--width", type=int, default=4032)
+    parser.add_argument("--height", type=int, default=3024)
+    parser.add_argument("--max-dimension", type=int, default=2048)
+    parser.add_argument("--format", choices=["jpeg", "webp"], default="jpeg")
+    parser.add_argument("--quality", type=int, default=82)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--port", type=int, default=8725)
+    asyncio.run(run(parser.parse_args()))
+
+if __name__ == "__main__":
+    main()
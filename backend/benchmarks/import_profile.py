@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Cold-start import profile for server.py.
+
+Imports the server module in fresh interpreters with -X importtime and
+reports the median cumulative import time, plus the top-level packages that
+contribute the most. With --without-email-config the SMTP variables are
+blanked (load_dotenv does not override them) to show the import no longer
+depends on email configuration.
+
+    cd backend && python benchmarks/import_profile.py [--runs 7] [--top 15] [--without-email-config]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+EMAIL_VARIABLES = ("SMTP_USERNAME", "SMTP_PASSWORD", "SENDER_EMAIL", "RECIPIENT_EMAIL")
+
+def profile_once(module: str, env: dict):
+    """(cumulative microseconds per module, stderr) for one cold import"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=BACKEND_DIR, env=env, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{result.stderr[-2000:]}")
+
+    self_times = {}
+    cumulative = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        name = name.strip()
+        self_times[name] = int(self_us)
+        cumulative[name] = int(cumulative_us)
+    return self_times, cumulative
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--module", default="server")
+    parser.add_argument("--runs", type=int, default=7)
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--without-email-config", action="store_true")
+    args = parser.parse_args()
+
+    env = os.environ.copy()
+    if args.without_email_config:
+        env.update({name: "" for name in EMAIL_VARIABLES})
+
+    totals = []
+    package_times = defaultdict(list)
+    for _ in range(args.runs):
+        self_times, cumulative = profile_once(args.module, env)
+        totals.append(cumulative[args.module])
+        per_package = defaultdict(int)
+        for name, self_us in self_times.items():
+            per_package[name.split(".")[0]] += self_us
+        for package, self_us in per_package.items():
+            package_times[package].append(self_us)
+
+    print(f"import {args.module}: median {statistics.median(totals) / 1000:.1f} ms "
+          f"(min {min(totals) / 1000:.1f}, max {max(totals) / 1000:.1f}) over {args.runs} runs")
+    print(f"top {args.top} packages by self time (median ms):")
+    ranked = sorted(package_times.items(), key=lambda item: statistics.median(item[1]), reverse=True)
+    for package, samples in ranked[:args.top]:
+        print(f"  {package:<28} {statistics.median(samples) / 1000:8.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Serialization cost per request for /api/services and /api/testimonials.
+
+Times only turning the handler's response model into body bytes, for:
+  response_model + JSONResponse      FastAPI's stock path: validate against
+                                     response_model, jsonable_encoder, json.dumps
+  response_model + FastJSONResponse  the same with orjson rendering (what any
+                                     route returning a model now gets)
+  model_dump_json                    pydantic's own encoder, used to render the
+                                     cached catalog bodies before
+  model_response                     the bypass: the built model straight to
+                                     its compiled serializer, no second validation
+No database is needed; the models are built from synthetic documents.
+
+    cd backend && python benchmarks/json_serialization.py [--services 8] [--testimonials 30] [--iterations 2000]
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+
+from bson import ObjectId
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+
+from json_response import FastJSONResponse, model_response
+from models import Service, ServicesResponse, Testimonial, TestimonialsResponse
+
+def make_services(count: int) -> ServicesResponse:
+    now = datetime.utcnow()
+    services = [
+        Service.from_document({
+            "_id": ObjectId(),
+            "name": f"Service {i}",
+            "description": "Professional exterior cleaning for homes and businesses. " * 4,
+            "icon": "droplets",
+            "features": [f"Feature {n}" for n in range(8)],
+            "pricing": {"starting": 150 + i, "unit": "per visit"},
+            "duration": "2-4 hours",
+            "availability": "Year-round",
+            "created_at": now,
+            "updated_at": now
+        })
+        for i in range(count)
+    ]
+    return ServicesResponse(success=True, message="Services retrieved successfully", data=services)
+
+def make_testimonials(count: int) -> TestimonialsResponse:
+    now = datetime.utcnow()
+    testimonials = [
+        Testimonial.from_document({
+            "_id": ObjectId(),
+            "name": f"Customer {i}",
+            "service": "House Washing",
+            "rating": 1 + i % 5,
+            "text": "Fantastic job, the house looks brand new and the team was on time. " * 2,
+            "location": "Canberra, ACT",
+            "date": now - timedelta(days=i),
+            "created_at": now
+        })
+        for i in range(count)
+    ]
+    return TestimonialsResponse(success=True, message="Testimonials retrieved successfully", data=testimonials)
+
+def paths(response_model):
+    field = create_response_field(name=f"Response_{response_model.__name__}", type_=response_model)
+
+    async def stock(model):
+        content = await serialize_response(field=field, response_content=model)
+        return JSONResponse(content).body
+
+    async def stock_orjson(model):
+        content = await serialize_response(field=field, response_content=model)
+        return FastJSONResponse(content).body
+
+    return {
+        "response_model + JSONResponse": stock,
+        "response_model + FastJSONResponse": stock_orjson,
+        "model_dump_json": lambda model: model.model_dump_json().encode(),
+        "model_response": lambda model: model_response(model).body
+    }
+
+async def time_path(func, model, iterations: int) -> float:
+    is_async = asyncio.iscoroutinefunction(func)
+    for _ in range(min(200, iterations)):
+        body = func(model)
+        if is_async:
+            body = await body
+    started = time.perf_counter()
+    for _ in range(iterations):
+        body = func(model)
+        if is_async:
+            body = await body
+    return (time.perf_counter() - started) / iterations * 1e6
+
+async def run(args):
+    results = {}
+    for route, model in (
+        ("/api/services", make_services(args.services)),
+        ("/api/testimonials", make_testimonials(args.testimonials)),
+    ):
+        route_results = {}
+        bodies = {}
+        for label, func in paths(type(model)).items():
+            body = await func(model) if asyncio.iscoroutinefunction(func) else func(model)
+            bodies[label] = json.loads(body)
+            route_results[label] = {"us_per_request": round(await time_path(func, model, args.iterations), 1)}
+        # Every path must produce the same document
+        reference = bodies["response_model + JSONResponse"]
+        for label, body in bodies.items():
+            route_results[label]["same_output"] = body == reference
+        baseline = route_results["response_model + JSONResponse"]["us_per_request"]
+        for label in route_results:
+            route_results[label]["speedup"] = round(baseline / route_results[label]["us_per_request"], 2)
+        results[route] = route_results
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--services", type=int, default=8)
+    parser.add_argument("--testimonials", type=int, default=30)
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args))
+    print(json.dumps({
+        "services": args.services,
+        "testimonials": args.testimonials,
+        "iterations": args.iterations,
+        "results": results
+    }, indent=2))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,376 @@
+#!/usr/bin/env python3
+"""
+Load test for the backend API.
+
+Starts the app under uvicorn in a subprocess, pointed at a local aiosmtpd
+sink (nothing leaves the machine) and either a MongoDB server (--mongo-url,
+default MONGO_URL) or an in-memory stand-in (--in-memory, needs the
+mongomock-motor package). It then drives a weighted request mix at a fixed
+concurrency and prints machine-readable JSON: throughput, per-scenario
+latency percentiles and status codes, and server RSS.
+
+Scenarios:
+  catalog  GET /api/services, /api/services/{id}, /api/testimonials, /api/company-info
+  quote    POST /api/quote-request
+  contact  POST /api/contact (multipart, with --photos photos of --photo-kb each)
+
+    cd backend && python benchmarks/load_test.py --in-memory --concurrency 32 --duration 30 \\
+        --mix catalog=80,quote=15,contact=5 --output run.json
+
+Compare against an earlier run; exits non-zero if any scenario's RPS drops or
+p95 latency rises by more than --max-regression-pct:
+
+    python benchmarks/load_test.py --in-memory --baseline run.json
+"""
+
+import argparse
+import asyncio
+import io
+import json
+import os
+import platform
+import random
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import httpx
+from aiosmtpd.controller import Controller
+from aiosmtpd.smtp import AuthResult
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+# Launcher pieces, run with `python -c <code> <port>`
+USE_MONGOMOCK = """
+import mongomock_motor
+import motor.motor_asyncio
+motor.motor_asyncio.AsyncIOMotorClient = mongomock_motor.AsyncMongoMockClient
+"""
+
+# The app does not create company info itself, but the catalog mix requests
+# it; seeding it during startup keeps that path from answering 404
+SEED_COMPANY_INFO = """
+import database
+initialize_data = database.Database._initialize_data
+async def _initialize_data(self):
+    await initialize_data(self)
+    if await self.db.company_info.count_documents({}) == 0:
+        await self._init_company_info()
+database.Database._initialize_data = _initialize_data
+"""
+
+RUN_UVICORN = """
+import sys
+import uvicorn
+uvicorn.run("server:app", host="127.0.0.1", port=int(sys.argv[1]), log_level="warning")
+"""
+
+# Runs the app with Motor swapped for mongomock-motor
+IN_MEMORY_LAUNCHER = USE_MONGOMOCK + RUN_UVICORN
+
+CATALOG_PATHS = ("/api/services", "/api/services/{service_id}", "/api/testimonials", "/api/company-info")
+
+class SinkHandler:
+    def __init__(self):
+        self.received = 0
+        self.bytes = 0
+
+    async def handle_DATA(self, server, session, envelope):
+        self.received += 1
+        self.bytes += len(envelope.content)
+        return '250 OK'
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+def rss_kb(pid: int) -> int:
+    """Resident set size of a process in KiB (Linux /proc; 0 where unavailable)"""
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return 0
+
+def make_photo(size_kb: int) -> bytes:
+    """A JPEG of roughly size_kb (Pillow if available, otherwise JPEG-framed noise)"""
+    try:
+        from PIL import Image
+    except ImportError:
+        return b"\xff\xd8\xff\xe0" + os.urandom(size_kb * 1024) + b"\xff\xd9"
+    side = 64
+    while True:
+        buffer = io.BytesIO()
+        Image.effect_noise((side, side), 40).convert("RGB").save(buffer, "JPEG", quality=90)
+        if buffer.tell() >= size_kb * 1024 or side >= 8192:
+            return buffer.getvalue()
+        side = int(side * 1.5)
+
+def parse_mix(text: str) -> dict:
+    mix = {}
+    for part in text.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in ("catalog", "quote", "contact"):
+            raise argparse.ArgumentTypeError(f"unknown scenario {name!r}")
+        mix[name] = float(weight or 1)
+    return mix
+
+def percentile(ordered, p: float):
+    if not ordered:
+        return None
+    return round(ordered[min(len(ordered) - 1, int(p * len(ordered)))], 2)
+
+def summarize(samples: list, statuses: dict, errors: int, seconds: float) -> dict:
+    ordered = sorted(samples)
+    return {
+        "requests": len(ordered),
+        "errors": errors,
+        "rps": round(len(ordered) / seconds, 1) if seconds else None,
+        "statuses": dict(sorted(statuses.items())),
+        "latency_ms": {
+            "avg": round(sum(ordered) / len(ordered), 2) if ordered else None,
+            "p50": percentile(ordered, 0.50),
+            "p90": percentile(ordered, 0.90),
+            "p95": percentile(ordered, 0.95),
+            "p99": percentile(ordered, 0.99),
+            "max": round(ordered[-1], 2) if ordered else None
+        }
+    }
+
+class LoadDriver:
+    def __init__(self, client: httpx.AsyncClient, args, service_ids: list, photo: bytes):
+        self.client = client
+        self.args = args
+        self.service_ids = service_ids or ["missing"]
+        self.photo = photo
+        self.scenarios = list(args.mix)
+        self.weights = [args.mix[name] for name in self.scenarios]
+        self.reset()
+
+    def reset(self):
+        self.samples = {name: [] for name in self.scenarios}
+        self.statuses = {name: {} for name in self.scenarios}
+        self.errors = {name: 0 for name in self.scenarios}
+
+    async def catalog(self, rng: random.Random):
+        path = rng.choice(CATALOG_PATHS).format(service_id=rng.choice(self.service_ids))
+        return await self.client.get(path)
+
+    async def quote(self, rng: random.Random):
+        return await self.client.post("/api/quote-request", json={
+            "name": f"Load Test {rng.randrange(1_000_000)}",
+            "email": "load@example.com",
+            "phone": "555-010-0000",
+            "service": "Pressure Washing",
+            "message": "Load test quote request"
+        })
+
+    async def contact(self, rng: random.Random):
+        files = [("photos", (f"photo{n}.jpg", self.photo, "image/jpeg")) for n in range(self.args.photos)]
+        return await self.client.post("/api/contact", data={
+            "name": "Load Test",
+            "email": "load@example.com",
+            "service": "Pressure Washing",
+            "message": "Load test contact submission"
+        }, files=files or None)
+
+    async def worker(self, seed: int, stop_at: float):
+        rng = random.Random(seed)
+        while time.perf_counter() < stop_at:
+            scenario = rng.choices(self.scenarios, self.weights)[0]
+            started = time.perf_counter()
+            try:
+                response = await getattr(self, scenario)(rng)
+            except httpx.HTTPError:
+                self.errors[scenario] += 1
+                continue
+            self.samples[scenario].append((time.perf_counter() - started) * 1000)
+            code = str(response.status_code)
+            self.statuses[scenario][code] = self.statuses[scenario].get(code, 0) + 1
+            if response.status_code >= 500:
+                self.errors[scenario] += 1
+
+    async def run(self, seconds: float, seed: int) -> float:
+        started = time.perf_counter()
+        stop_at = started + seconds
+        await asyncio.gather(*(self.worker(seed + n, stop_at) for n in range(self.args.concurrency)))
+        return time.perf_counter() - started
+
+async def wait_until_ready(client: httpx.AsyncClient, server: subprocess.Popen, timeout: float):
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        if server.poll() is not None:
+            raise RuntimeError(f"server exited with code {server.returncode}")
+        try:
+            if (await client.get("/api/ready")).status_code == 200:
+                return
+        except httpx.HTTPError:
+            pass
+        await asyncio.sleep(0.1)
+    raise TimeoutError("server did not become ready")
+
+def start_server(args, port: int, smtp_port: int) -> subprocess.Popen:
+    env = os.environ.copy()
+    env.update({
+        "SMTP_SERVER": "127.0.0.1",
+        "SMTP_PORT": str(smtp_port),
+        "SMTP_STARTTLS": "false",
+        "SMTP_USERNAME": "load",
+        "SMTP_PASSWORD": "load",
+        "SENDER_EMAIL": "load@example.com",
+        "RECIPIENT_EMAIL": "sink@example.com",
+        "DB_NAME": args.db_name,
+        "PHOTO_STORE_DIR": str(Path(args.workdir) / "photo_store"),
+    })
+    launcher = SEED_COMPANY_INFO + RUN_UVICORN
+    if args.in_memory:
+        env.setdefault("MONGO_URL", "mongodb://in-memory")
+        launcher = USE_MONGOMOCK + launcher
+    elif args.mongo_url:
+        env["MONGO_URL"] = args.mongo_url
+    return subprocess.Popen([sys.executable, "-c", launcher, str(port)], cwd=BACKEND_DIR, env=env)
+
+async def run(args) -> dict:
+    sink = SinkHandler()
+    smtp_port = free_port()
+    controller = Controller(
+        sink, hostname="127.0.0.1", port=smtp_port,
+        auth_require_tls=False, authenticator=lambda *a: AuthResult(success=True)
+    )
+    controller.start()
+    port = free_port()
+    server = start_server(args, port, smtp_port)
+    rss_samples = []
+
+    async def sample_rss():
+        while True:
+            rss_samples.append(rss_kb(server.pid))
+            await asyncio.sleep(0.5)
+
+    try:
+        limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+        async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{port}", limits=limits, timeout=args.request_timeout) as client:
+            await wait_until_ready(client, server, args.startup_timeout)
+            services = (await client.get("/api/services")).json().get("data") or []
+            driver = LoadDriver(client, args, [service["id"] for service in services], make_photo(args.photo_kb))
+
+            rss_start = rss_kb(server.pid)
+            if args.warmup > 0:
+                await driver.run(args.warmup, args.seed + 10_000)
+                driver.reset()
+
+            sampler = asyncio.create_task(sample_rss())
+            elapsed = await driver.run(args.duration, args.seed)
+            sampler.cancel()
+            rss_end = rss_kb(server.pid)
+    finally:
+        server.terminate()
+        try:
+            server.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            server.kill()
+        controller.stop()
+
+    all_samples = [sample for samples in driver.samples.values() for sample in samples]
+    all_statuses = {}
+    for statuses in driver.statuses.values():
+        for code, count in statuses.items():
+            all_statuses[code] = all_statuses.get(code, 0) + count
+
+    return {
+        "params": {key: value for key, value in vars(args).items() if key not in ("baseline", "output")},
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+            "commit": _git_commit(),
+            "backend": "in-memory" if args.in_memory else "mongod"
+        },
+        "duration_s": round(elapsed, 2),
+        "total": summarize(all_samples, all_statuses, sum(driver.errors.values()), elapsed),
+        "scenarios": {
+            name: summarize(driver.samples[name], driver.statuses[name], driver.errors[name], elapsed)
+            for name in driver.scenarios
+        },
+        "server_rss_kb": {
+            "start": rss_start,
+            "end": rss_end,
+            "peak": max(rss_samples + [rss_end])
+        },
+        "smtp_sink": {"messages": sink.received, "bytes": sink.bytes}
+    }
+
+def _git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=BACKEND_DIR, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def compare(result: dict, baseline: dict, max_regression_pct: float) -> bool:
+    """Print per-scenario changes against a baseline run; True if within the limit"""
+    ok = True
+    print(f"{'scenario':<10} {'rps':>20} {'p95 ms':>22}", file=sys.stderr)
+    for name in ["total"] + sorted(result["scenarios"]):
+        current = result["total"] if name == "total" else result["scenarios"][name]
+        previous = baseline["total"] if name == "total" else baseline.get("scenarios", {}).get(name)
+        if not previous or not previous["rps"] or not current["rps"]:
+            continue
+        rps_change = 100 * (current["rps"] / previous["rps"] - 1)
+        p95_now, p95_before = current["latency_ms"]["p95"], previous["latency_ms"]["p95"]
+        p95_change = 100 * (p95_now / p95_before - 1) if p95_before else 0.0
+        regressed = rps_change < -max_regression_pct or p95_change > max_regression_pct
+        ok = ok and not regressed
+        print(
+            f"{name:<10} {previous['rps']:>8} -> {current['rps']:<8} ({rps_change:+.1f}%)"
+            f" {p95_before:>8} -> {p95_now:<8} ({p95_change:+.1f}%){'  REGRESSION' if regressed else ''}",
+            file=sys.stderr
+        )
+    return ok
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--mongo-url", default=None, help="MongoDB to test against (default: MONGO_URL)")
+    parser.add_argument("--in-memory", action="store_true", help="use mongomock-motor instead of a MongoDB server")
+    parser.add_argument("--db-name", default="load_test")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=20, help="measured seconds")
+    parser.add_argument("--warmup", type=float, default=3, help="unmeasured seconds before the run")
+    parser.add_argument("--mix", type=parse_mix, default=parse_mix("catalog=80,quote=15,contact=5"))
+    parser.add_argument("--photos", type=int, default=2, help="photos per contact request")
+    parser.add_argument("--photo-kb", type=int, default=300)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--request-timeout", type=float, default=30)
+    parser.add_argument("--startup-timeout", type=float, default=60)
+    parser.add_argument("--workdir", default=None, help="photo store location (default: a temp dir)")
+    parser.add_argument("--output", default=None, help="write the JSON result here instead of stdout")
+    parser.add_argument("--baseline", default=None, help="earlier JSON result to compare against")
+    parser.add_argument("--max-regression-pct", type=float, default=10)
+    args = parser.parse_args()
+
+    import tempfile
+    with tempfile.TemporaryDirectory(prefix="load-test-") as workdir:
+        args.workdir = args.workdir or workdir
+        result = asyncio.run(run(args))
+
+    output = json.dumps(result, indent=2)
+    if args.output:
+        Path(args.output).write_text(output + "\n")
+    else:
+        print(output)
+
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text())
+        if not compare(result, baseline, args.max_regression_pct):
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Handler throughput with the old and new logging setups.
+
+Runs the body of the company-info and contact handlers (model rendering
+plus their log calls) in a tight loop, with log output going to a real file
+as it would when stdout/stderr is redirected:
+
+  before  basicConfig stream handler, eager f-strings, the old INFO lines
+          (company info logged the address twice; contact logged 3x INFO)
+  after   queue handler + background listener, lazy %-formatting, the
+          company-info debug lines removed and contact lines at DEBUG
+  after-info  as "after" but with the contact lines forced to INFO, to show
+          the queue's cost when lines are actually emitted
+
+Each mode runs in a fresh interpreter so logging state does not leak.
+
+    cd backend && python benchmarks/logging_throughput.py [--iterations 20000]
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+MODES = ("before", "after", "after-info")
+
+WORKER = r'''
+import logging, os, sys, tempfile, time
+sys.path.insert(0, sys.argv[3])
+mode, iterations = sys.argv[1], int(sys.argv[2])
+log_file = tempfile.NamedTemporaryFile("w", prefix="log-bench-", delete=False)
+sys.stderr = log_file
+
+if mode == "before":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+else:
+    os.environ["LOG_LEVEL"] = "INFO"
+    from logging_config import configure_logging, stop_logging
+    configure_logging()
+
+from models import CompanyInfo, CompanyInfoResponse
+logger = logging.getLogger("server")
+contact_level = logging.INFO if mode == "after-info" else logging.DEBUG
+
+company = {
+    "name": "Aurex Exteriors", "tagline": "Professional Exterior Services You Can Trust",
+    "phone": "0424 910 154", "email": "info@example.com",
+    "address": "Canberra, Australian Capital Territory (ACT)", "service_radius": "2600-2617 postcode areas",
+    "business_hours": {"weekdays": "7AM - 7PM", "saturday": "7AM - 7PM", "sunday": "9AM - 5PM"},
+    "features": ["Fully Insured", "Same Day Service"],
+    "stats": {"customers": "50+", "experience": "2+", "satisfaction": "100%", "support": "24/7"},
+    "social_media": {"facebook": "#", "twitter": "#", "instagram": "#"}
+}
+name, email = "Jane Doe", "jane@example.com"
+
+def company_info_handler():
+    if mode == "before":
+        logger.info(f"Retrieved company data from DB: address={company.get('address') if company else 'None'}")
+    info = CompanyInfo(**company)
+    if mode == "before":
+        logger.info(f"Rendering company info: address={info.address}")
+    return CompanyInfoResponse(success=True, message="ok", data=info).model_dump_json()
+
+def contact_handler():
+    if mode == "before":
+        logger.info(f"Received contact form submission from {name} ({email})")
+        logger.info(f"Contact submission saved to database")
+        logger.info(f"Email notification queued")
+    else:
+        logger.log(contact_level, "Received contact form submission from %s (%s)", name, email)
+        logger.log(contact_level, "Contact submission saved to database")
+        logger.log(contact_level, "Email notification queued")
+
+results = {}
+for label, handler in (("company_info", company_info_handler), ("contact_logging", contact_handler)):
+    for _ in range(min(1000, iterations)):
+        handler()
+    started = time.perf_counter()
+    for _ in range(iterations):
+        handler()
+    elapsed = time.perf_counter() - started
+    results[label] = {"ops_per_s": round(iterations / elapsed), "us_per_op": round(elapsed / iterations * 1e6, 2)}
+
+if mode != "before":
+    drain_started = time.perf_counter()
+    stop_logging()
+    results["queue_drain_ms"] = round((time.perf_counter() - drain_started) * 1000, 1)
+log_file.flush()
+results["log_bytes"] = os.path.getsize(log_file.name)
+os.remove(log_file.name)
+print(__import__("json").dumps(results), file=sys.__stdout__)
+'''
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args()
+
+    results = {}
+    for mode in MODES:
+        completed = subprocess.run(
+            [sys.executable, "-c", WORKER, mode, str(args.iterations), str(BACKEND_DIR)],
+            capture_output=True, text=True
+        )
+        if completed.returncode != 0:
+            sys.exit(f"{mode} run failed:\n{completed.stderr}")
+        results[mode] = json.loads(completed.stdout)
+
+    before = results["before"]
+    for label in ("company_info", "contact_logging"):
+        results.setdefault("speedup", {})[label] = round(
+            results["after"][label]["ops_per_s"] / before[label]["ops_per_s"], 2
+        )
+    print(json.dumps({"iterations": args.iterations, "results": results}, indent=2))
+
+if __name__ == "__main__":
+    main()
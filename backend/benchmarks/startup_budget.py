@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Enforce the startup-to-first-byte budget.
+
+Starts the API under uvicorn in a subprocess and measures how long it takes
+until the liveness endpoint (/api/) answers, and until /api/ready reports
+200. Exits non-zero if the first byte takes longer than --budget-ms, or, with
+--ready-budget-ms, if readiness does.
+
+The app environment comes from backend/.env as usual; point MONGO_URL at a
+test database, or pass --in-memory to run on mongomock-motor with the
+load test's launcher. To check that a slow or unreachable mail server no
+longer delays startup, run with e.g. SMTP_SERVER=10.255.255.1.
+
+    cd backend && python benchmarks/startup_budget.py [--in-memory] [--budget-ms 3000] [--ready-budget-ms 10000]
+
+tests/test_startup_budget.py runs the in-memory variant under pytest.
+"""
+
+import argparse
+import os
+import socket
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+from pathlib import Path
+from typing import Optional, Tuple
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR / "benchmarks"))
+
+DEFAULT_BUDGET_MS = 3000
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+def status_of(url: str) -> int:
+    try:
+        with urllib.request.urlopen(url, timeout=1) as response:
+            return response.status
+    except urllib.error.HTTPError as e:
+        return e.code
+
+def wait_for(url: str, started: float, deadline: float, want_status=None) -> float:
+    """Seconds from start until url answers (with want_status, if given)"""
+    while time.perf_counter() < deadline:
+        try:
+            answered = status_of(url)
+            if want_status is None or answered == want_status:
+                return time.perf_counter() - started
+        except (urllib.error.URLError, ConnectionError, socket.timeout):
+            pass
+        time.sleep(0.01)
+    raise TimeoutError(f"{url} did not answer in time")
+
+def start_server(port: int, in_memory: bool = False, env: Optional[dict] = None) -> subprocess.Popen:
+    env = dict(os.environ if env is None else env)
+    if in_memory:
+        from load_test import IN_MEMORY_LAUNCHER
+        env.setdefault("MONGO_URL", "mongodb://in-memory")
+        command = [sys.executable, "-c", IN_MEMORY_LAUNCHER, str(port)]
+    else:
+        command = [
+            sys.executable, "-m", "uvicorn", "server:app",
+            "--host", "127.0.0.1", "--port", str(port), "--log-level", "warning"
+        ]
+    return subprocess.Popen(command, cwd=BACKEND_DIR, env=env)
+
+def stop_server(server: subprocess.Popen):
+    server.terminate()
+    try:
+        server.wait(timeout=10)
+    except subprocess.TimeoutExpired:
+        server.kill()
+
+def measure_startup(in_memory: bool = False, env: Optional[dict] = None, timeout: float = 60) -> Tuple[float, Optional[float]]:
+    """(seconds to first byte, seconds to ready or None if it never got there)"""
+    port = free_port()
+    base = f"http://127.0.0.1:{port}/api"
+    started = time.perf_counter()
+    server = start_server(port, in_memory, env)
+    try:
+        deadline = started + timeout
+        first_byte = wait_for(f"{base}/", started, deadline)
+        try:
+            ready = wait_for(f"{base}/ready", started, deadline, want_status=200)
+        except TimeoutError:
+            ready = None
+    finally:
+        stop_server(server)
+    return first_byte, ready
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS, help="max startup to first byte")
+    parser.add_argument("--ready-budget-ms", type=float, default=None, help="max startup to /api/ready 200")
+    parser.add_argument("--timeout", type=float, default=60, help="give up after this many seconds")
+    parser.add_argument("--in-memory", action="store_true", help="use mongomock-motor instead of a MongoDB server")
+    args = parser.parse_args()
+
+    first_byte, ready = measure_startup(args.in_memory, timeout=args.timeout)
+    failed = False
+    print(f"startup to first byte: {first_byte * 1000:8.0f} ms (budget {args.budget_ms:.0f} ms)")
+    if first_byte * 1000 > args.budget_ms:
+        print("FAIL: first byte over budget")
+        failed = True
+
+    if ready is None:
+        print(f"not ready after {args.timeout:.0f}s")
+        failed = failed or args.ready_budget_ms is not None
+    else:
+        print(f"startup to ready:      {ready * 1000:8.0f} ms", end="")
+        if args.ready_budget_ms is not None:
+            print(f" (budget {args.ready_budget_ms:.0f} ms)")
+            if ready * 1000 > args.ready_budget_ms:
+                print("FAIL: readiness over budget")
+                failed = True
+        else:
+            print()
+
+    sys.exit(1 if failed else 0)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+import os
+import re
+import uuid
+import hashlib
+import asyncio
+import logging
+from pathlib import Path
+from typing import Optional
+from fastapi import UploadFile
+from uploads import copy_upload_bounded
+
+logger = logging.getLogger(__name__)
+
+ROOT_DIR = Path(__file__).parent
+
+DIGEST_RE = re.compile(r"^[0-9a-f]{64}$")
+
+# Leading bytes of the image formats we accept, for serving stored blobs
+IMAGE_SIGNATURES = (
+    (b"\xff\xd8\xff", "image/jpeg"),
+    (b"\x89PNG\r\n\x1a\n", "image/png"),
+    (b"GIF87a", "image/gif"),
+    (b"GIF89a", "image/gif"),
+)
+
+def sniff_image_type(head: bytes) -> str:
+    for signature, content_type in IMAGE_SIGNATURES:
+        if head.startswith(signature):
+            return content_type
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return "image/webp"
+    if head[4:12] in (b"ftypheic", b"ftypheix", b"ftypmif1"):
+        return "image/heic"
+    return "application/octet-stream"
+
+class FilesystemBlobStore:
+    """
+    Content-addressed blob store on the local filesystem.
+
+    Blobs live at <root>/<aa>/<bb>/<sha256>. Storing bytes that are already
+    present costs nothing beyond hashing them. Aliases record which stored
+    blob an upload digest turned into (e.g. after recompression), so a
+    repeated upload can skip processing altogether.
+    """
+
+    def __init__(self):
+        self.root: Optional[Path] = None
+
+    def configure(self):
+        self.root = Path(os.environ.get('PHOTO_STORE_DIR', str(ROOT_DIR / 'photo_store')))
+        for sub in ("tmp", "aliases"):
+            (self.root / sub).mkdir(parents=True, exist_ok=True)
+
+    def path_for(self, digest: str) -> Path:
+        if not DIGEST_RE.match(digest):
+            raise ValueError(f"Invalid blob digest: {digest!r}")
+        return self.root / digest[:2] / digest[2:4] / digest
+
+    def exists(self, digest: str) -> bool:
+        return self.path_for(digest).exists()
+
+    def _temp_path(self, suffix: str = "") -> Path:
+        return self.root / "tmp" / f"{uuid.uuid4().hex}{suffix}"
+
+    async def receive_upload(self, upload: UploadFile, max_bytes: int) -> Optional[dict]:
+        """
+        Spool an upload into the store's temp area, hashing it as it streams.
+        Returns None if it exceeds max_bytes. The result still has to be
+        passed to commit().
+        """
+        path = self._temp_path(Path(upload.filename).suffix)
+        hasher = hashlib.sha256()
+        size = await asyncio.to_thread(copy_upload_bounded, upload, path, max_bytes, hasher=hasher)
+        if size is None:
+            return None
+        return {
+            "filename": upload.filename,
+            "content_type": upload.content_type,
+            "path": str(path),
+            "size": size,
+            "upload_digest": hasher.hexdigest()
+        }
+
+    async def commit(self, path: str, digest: Optional[str] = None) -> str:
+        """Move a temp file into the store under its digest, dropping it if already stored"""
+        return await asyncio.to_thread(self._commit, Path(path), digest)
+
+    def _commit(self, path: Path, digest: Optional[str]) -> str:
+        if digest is None:
+            digest = self._hash_file(path)
+        final = self.path_for(digest)
+        if final.exists():
+            path.unlink()
+        else:
+            final.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(path, final)
+        return digest
+
+    @staticmethod
+    def _hash_file(path: Path) -> str:
+        hasher = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                hasher.update(chunk)
+        return hasher.hexdigest()
+
+    def discard(self, path: str):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def resolve_alias(self, upload_digest: str) -> Optional[str]:
+        """Stored digest previously produced from an upload digest, if the blob still exists"""
+        try:
+            digest = (self.root / "aliases" / upload_digest).read_text().strip()
+        except (OSError, ValueError):
+            return None
+        return digest if DIGEST_RE.match(digest) and self.exists(digest) else None
+
+    def add_alias(self, upload_digest: str, digest: str):
+        if upload_digest == digest or not DIGEST_RE.match(upload_digest):
+            return
+        alias = self.root / "aliases" / upload_digest
+        temp = self._temp_path()
+        temp.write_text(digest)
+        os.replace(temp, alias)
+
+    def content_type(self, digest: str) -> str:
+        with open(self.path_for(digest), 'rb') as f:
+            return sniff_image_type(f.read(16))
+
+    def size(self, digest: str) -> int:
+        return self.path_for(digest).stat().st_size
+
+# Global photo store instance
+photo_store = FilesystemBlobStore()
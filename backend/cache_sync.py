@@ -0,0 +1,93 @@
+import os
+import time
+import asyncio
+import logging
+from typing import Dict, List, Optional
+from database import CATALOG_DATASETS
+
+logger = logging.getLogger(__name__)
+
+class CacheSync:
+    """
+    Keeps every worker process's catalog cache coherent.
+
+    Each catalog dataset has a version counter in the cache_versions
+    collection, which writers bump through Database.publish_invalidation.
+    Every worker polls the counters and drops its cached copy of any dataset
+    whose version moved, so workers serve the new data within one poll
+    interval and no broker beyond the database itself is needed. The first
+    poll drops everything, covering whatever was cached before it ran.
+    """
+
+    def __init__(self):
+        self.database = None
+        self.interval = 2.0
+        self.last_poll: Optional[float] = None
+        self._versions: Optional[Dict[str, int]] = None
+        self._task: Optional[asyncio.Task] = None
+        self._failing = False
+
+    def _configure(self):
+        # 0 disables polling (single-process deployments relying on CATALOG_CACHE_TTL alone)
+        self.interval = float(os.environ.get('CACHE_SYNC_INTERVAL_SECONDS', '2'))
+
+    async def start(self, database):
+        self._configure()
+        self.database = database
+        self._versions = None
+        if self.interval <= 0:
+            logger.info("Catalog cache sync disabled")
+            return
+        self._task = asyncio.create_task(self._run())
+        logger.info("Catalog cache sync polling every %.1fs", self.interval)
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def poll(self) -> List[str]:
+        """Read the version counters once and invalidate datasets that changed"""
+        versions = await self.database.get_cache_versions()
+        if self._versions is None:
+            changed = list(CATALOG_DATASETS)
+        else:
+            changed = [
+                dataset for dataset in CATALOG_DATASETS
+                if versions.get(dataset, 0) != self._versions.get(dataset, 0)
+            ]
+        for dataset in changed:
+            self.database.invalidate_dataset(dataset)
+        if changed and self._versions is not None:
+            logger.info("Catalog data changed elsewhere, dropped cached %s", ", ".join(changed))
+        self._versions = versions
+        self.last_poll = time.time()
+        return changed
+
+    async def _run(self):
+        while True:
+            try:
+                await self.poll()
+                if self._failing:
+                    logger.info("Catalog cache sync recovered")
+                self._failing = False
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # Logged once per outage; the database is usually just not up yet
+                if not self._failing:
+                    logger.warning("Catalog cache sync poll failed: %s", e)
+                self._failing = True
+            await asyncio.sleep(self.interval)
+
+    def snapshot(self) -> dict:
+        return {
+            "interval_seconds": self.interval,
+            "versions": dict(self._versions or {}),
+            "last_poll": self.last_poll,
+            "healthy": not self._failing
+        }
+
+# Global cache sync instance
+cache_sync = CacheSync()
@@ -0,0 +1,224 @@
+import os
+import time
+import asyncio
+import logging
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+from pymongo.errors import OperationFailure, PyMongoError
+
+logger = logging.getLogger(__name__)
+
+# Catalog collections: small, read on every page view, rarely written
+CATALOG_DATASETS = ("services", "testimonials", "company_info")
+
+# Server error codes meaning change streams are unavailable on this deployment
+# (40573: standalone server, not a replica set)
+CHANGE_STREAMS_UNSUPPORTED = {40573, 40415}
+
+# The services query caps results at 100; a full list may hide further services
+SNAPSHOT_LIST_LIMIT = 100
+
+def apply_projection(doc: dict, projection: Optional[dict]) -> dict:
+    """Top-level inclusion projection (the only kind the models produce) applied in memory"""
+    if not projection:
+        return doc
+    include_id = bool(projection.get("_id", 1))
+    return {
+        key: value for key, value in doc.items()
+        if (key == "_id" and include_id) or (key != "_id" and projection.get(key))
+    }
+
+class CatalogSnapshot:
+    """
+    In-memory copy of the catalog collections' query results.
+
+    Holds exactly what Database loads for services, testimonials and company
+    info, unprojected. Projected views are built once per data version and
+    handed out as the same objects until the dataset is replaced, which keeps
+    the rendered response cache hitting. Values are shared and read-only.
+    """
+
+    def __init__(self):
+        self._data: Dict[str, Any] = {}
+        self._views: Dict[Tuple[str, str], Any] = {}
+        self._generations: Dict[str, int] = {}
+        self.loaded_at: Dict[str, float] = {}
+
+    def ready(self, dataset: str) -> bool:
+        return dataset in self._data
+
+    def generation(self, dataset: str) -> int:
+        """Bumped by discard(), so a reload that raced with a write can tell"""
+        return self._generations.get(dataset, 0)
+
+    def replace(self, dataset: str, value: Any):
+        self._data[dataset] = value
+        self._drop_views(dataset)
+        self.loaded_at[dataset] = time.time()
+
+    def discard(self, dataset: str):
+        """Forget a dataset so reads fall back to the database until it is reloaded"""
+        self._data.pop(dataset, None)
+        self._drop_views(dataset)
+        self.loaded_at.pop(dataset, None)
+        self._generations[dataset] = self.generation(dataset) + 1
+
+    def _drop_views(self, dataset: str):
+        for key in [key for key in self._views if key[0] == dataset]:
+            del self._views[key]
+
+    def _view(self, dataset: str, key: str, build) -> Any:
+        view_key = (dataset, key)
+        if view_key not in self._views:
+            self._views[view_key] = build()
+        return self._views[view_key]
+
+    def get(self, dataset: str, projection: Optional[dict] = None, cache_key: str = "") -> Any:
+        """A list or single document, projected; cache_key identifies the projection"""
+        value = self._data[dataset]
+        if not projection:
+            return value
+        if isinstance(value, list):
+            return self._view(dataset, cache_key, lambda: [apply_projection(doc, projection) for doc in value])
+        if value is None:
+            return None
+        return self._view(dataset, cache_key, lambda: apply_projection(value, projection))
+
+    def find_service(self, service_id: str, projection: Optional[dict] = None, cache_key: str = "") -> Tuple[bool, Optional[dict]]:
+        """
+        (found_or_known_missing, doc) for one active service. When the list is
+        at its query limit a miss proves nothing, so (False, None) is returned
+        and the caller should ask the database.
+        """
+        services = self._data["services"]
+        index = self._view("services", "by_id", lambda: {str(doc.get("_id")): doc for doc in services})
+        doc = index.get(service_id)
+        if doc is None:
+            return len(services) < SNAPSHOT_LIST_LIMIT, None
+        if not projection:
+            return True, doc
+        return True, self._view("services", f"{service_id}|{cache_key}", lambda: apply_projection(doc, projection))
+
+class CatalogWatcher:
+    """
+    Keeps the database's catalog snapshot current.
+
+    With a replica set, a change stream on the catalog collections reloads a
+    dataset as soon as it changes. Without one (a standalone server), edits
+    are picked up through the cache_versions counters polled by cache_sync,
+    which end up in Database.invalidate_dataset and so in request_reload.
+    Either way every dataset is also reloaded every refresh_seconds, as a
+    backstop for hand edits that bump no counter.
+
+    Reloads are whole-dataset re-queries: the collections are small, and a
+    re-query cannot drift the way applied deltas can.
+    """
+
+    def __init__(self):
+        self.database = None
+        self.enabled = False
+        self.mode = "off"
+        self.refresh_seconds = 300.0
+        self._pending: Set[str] = set()
+        self._wakeup = asyncio.Event()
+        self._tasks: List[asyncio.Task] = []
+
+    def _configure(self):
+        # off (default), auto (change streams, else version polling) or poll
+        self.mode = os.environ.get('CATALOG_SNAPSHOT', 'off').lower()
+        self.enabled = self.mode in ("auto", "poll")
+        self.refresh_seconds = float(os.environ.get('CATALOG_SNAPSHOT_REFRESH_SECONDS', '300'))
+        self.retry_seconds = float(os.environ.get('CATALOG_SNAPSHOT_RETRY_SECONDS', '5'))
+
+    async def start(self, database):
+        self._configure()
+        self.database = database
+        if not self.enabled:
+            return
+        database.snapshot_watcher = self
+        self._wakeup = asyncio.Event()
+        self.request_reload(*CATALOG_DATASETS)
+        self._tasks = [asyncio.create_task(self._reloader())]
+        if self.mode == "auto":
+            self._tasks.append(asyncio.create_task(self._watch()))
+        logger.info("Catalog snapshot enabled (%s)", self.mode)
+
+    async def stop(self):
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        if self.database is not None:
+            self.database.snapshot_watcher = None
+
+    def request_reload(self, *datasets: str):
+        self._pending.update(datasets)
+        self._wakeup.set()
+
+    async def _reloader(self):
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.refresh_seconds)
+            except asyncio.TimeoutError:
+                self._pending.update(CATALOG_DATASETS)
+            self._wakeup.clear()
+            datasets, self._pending = self._pending, set()
+            failed = await self._reload(datasets)
+            if failed:
+                # Usually the database is not up yet; reads fall back to it meanwhile
+                self._pending.update(failed)
+                await asyncio.sleep(self.retry_seconds)
+                self._wakeup.set()
+
+    async def _reload(self, datasets: Iterable[str]) -> Set[str]:
+        failed = set()
+        snapshot = self.database.snapshot
+        for dataset in datasets:
+            generation = snapshot.generation(dataset)
+            try:
+                value = await self.database.load_dataset(dataset)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.debug("Catalog snapshot reload of %s failed: %s", dataset, e)
+                failed.add(dataset)
+                continue
+            # A discard during the query means a write landed after it; the
+            # dataset is queued again, so keep serving from the database
+            if snapshot.generation(dataset) == generation:
+                snapshot.replace(dataset, value)
+        return failed
+
+    async def _watch(self):
+        pipeline = [{"$match": {"ns.coll": {"$in": list(CATALOG_DATASETS)}}}]
+        while True:
+            try:
+                async with self.database.db.watch(pipeline) as stream:
+                    # Anything that changed while the stream was down is reloaded
+                    self.request_reload(*CATALOG_DATASETS)
+                    async for change in stream:
+                        self.request_reload(change["ns"]["coll"])
+            except asyncio.CancelledError:
+                raise
+            except (OperationFailure, NotImplementedError) as e:
+                if isinstance(e, NotImplementedError) or e.code in CHANGE_STREAMS_UNSUPPORTED:
+                    self.mode = "poll"
+                    logger.info("Change streams unavailable (%s); catalog snapshot follows cache_versions polling", e)
+                    return
+                logger.warning("Catalog change stream failed, retrying in %.0fs: %s", self.retry_seconds, e)
+            except PyMongoError as e:
+                logger.warning("Catalog change stream failed, retrying in %.0fs: %s", self.retry_seconds, e)
+            except Exception as e:
+                self.mode = "poll"
+                logger.error("Catalog change stream stopped; following cache_versions polling instead: %s", e)
+                return
+            await asyncio.sleep(self.retry_seconds)
+
+    def snapshot(self) -> dict:
+        return {
+            "mode": self.mode,
+            "refresh_seconds": self.refresh_seconds,
+            "loaded_at": dict(self.database.snapshot.loaded_at) if self.database else {}
+        }
+
+# Global catalog watcher instance
+catalog_watcher = CatalogWatcher()
@@ -0,0 +1,148 @@
+import gzip
+import importlib.util
+from typing import Dict, Optional, Tuple
+
+# brotli is optional; without it only gzip is offered
+BROTLI_AVAILABLE = importlib.util.find_spec("brotli") is not None
+
+# Preferred first when a client accepts several equally
+ENCODINGS: Tuple[str, ...] = ("br", "gzip") if BROTLI_AVAILABLE else ("gzip",)
+
+COMPRESSIBLE_TYPES = (
+    "application/json",
+    "application/x-ndjson",
+    "application/javascript",
+    "application/xml",
+    "image/svg+xml",
+    "text/",
+)
+
+# Levels for bodies compressed per request, and for bodies compressed once
+# and cached, where the slowest setting is paid only once per data version
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 4
+BEST_GZIP_LEVEL = 9
+BEST_BROTLI_QUALITY = 11
+
+def parse_accept_encoding(header: Optional[str]) -> Dict[str, float]:
+    """'gzip, br;q=0.8, *;q=0' -> {coding: q-value}"""
+    accepted = {}
+    for part in (header or "").split(","):
+        coding, _, params = part.partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        accepted[coding] = q
+    return accepted
+
+def choose_encoding(header: Optional[str], available: Tuple[str, ...] = ENCODINGS) -> Optional[str]:
+    """Best content coding the client accepts, or None for identity"""
+    accepted = parse_accept_encoding(header)
+    if not accepted:
+        return None
+    wildcard = accepted.get("*", 0.0)
+    best, best_q = None, 0.0
+    for coding in available:
+        q = accepted.get(coding, wildcard)
+        if q > best_q:
+            best, best_q = coding, q
+    return best
+
+def is_compressible(content_type: Optional[str]) -> bool:
+    return bool(content_type) and content_type.lower().startswith(COMPRESSIBLE_TYPES)
+
+def compress(body: bytes, encoding: str, best: bool = False) -> bytes:
+    """Compress body with gzip or brotli; best trades CPU for size"""
+    if encoding == "gzip":
+        # mtime=0 keeps the output identical for identical input
+        return gzip.compress(body, compresslevel=BEST_GZIP_LEVEL if best else GZIP_LEVEL, mtime=0)
+    if encoding == "br" and BROTLI_AVAILABLE:
+        import brotli
+        return brotli.compress(body, quality=BEST_BROTLI_QUALITY if best else BROTLI_QUALITY)
+    raise ValueError(f"Unsupported content coding: {encoding}")
+
+def _add_vary(headers: list) -> list:
+    for index, (name, value) in enumerate(headers):
+        if name.lower() == b"vary":
+            if b"accept-encoding" not in value.lower() and value.strip() != b"*":
+                headers[index] = (name, value + b", Accept-Encoding")
+            return headers
+    headers.append((b"vary", b"Accept-Encoding"))
+    return headers
+
+class CompressionMiddleware:
+    """
+    Compress response bodies the client accepts in gzip or brotli form.
+
+    Only single-message bodies of a compressible type and at least
+    minimum_size bytes are compressed; streamed bodies (exports) and
+    responses that already carry a Content-Encoding, such as the
+    precompressed catalog entries, pass through untouched. Eligible
+    responses get Vary: Accept-Encoding whether or not they were compressed.
+    """
+
+    def __init__(self, app, minimum_size: int = 1024):
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        accept_encoding = None
+        for name, value in scope["headers"]:
+            if name == b"accept-encoding":
+                accept_encoding = value.decode("latin-1")
+                break
+        encoding = choose_encoding(accept_encoding)
+        start = None
+
+        async def compressing_send(message):
+            nonlocal start
+            if message["type"] == "http.response.start":
+                start = message
+                return
+            if start is None:
+                await send(message)
+                return
+
+            response_start, start = start, None
+            headers = list(response_start.get("headers", []))
+            content_type = content_encoding = None
+            for name, value in headers:
+                lowered = name.lower()
+                if lowered == b"content-type":
+                    content_type = value.decode("latin-1")
+                elif lowered == b"content-encoding":
+                    content_encoding = value
+            if content_encoding is not None or not is_compressible(content_type):
+                await send(response_start)
+                await send(message)
+                return
+
+            headers = _add_vary(headers)
+            body = message.get("body", b"")
+            if encoding is None or message.get("more_body", False) or len(body) < self.minimum_size:
+                await send(dict(response_start, headers=headers))
+                await send(message)
+                return
+
+            compressed = compress(body, encoding)
+            headers = [(name, value) for name, value in headers if name.lower() != b"content-length"]
+            headers += [
+                (b"content-encoding", encoding.encode()),
+                (b"content-length", str(len(compressed)).encode())
+            ]
+            await send(dict(response_start, headers=headers))
+            await send(dict(message, body=compressed))
+
+        await self.app(scope, receive, compressing_send)
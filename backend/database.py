@@ -1,51 +1,306 @@
 import os
-from motor.motor_asyncio import AsyncIOMotorClient
+import json
+import base64
+import asyncio
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from pymongo import ASCENDING, DESCENDING, IndexModel, ReturnDocument
+from pymongo.errors import BulkWriteError, DuplicateKeyError, OperationFailure
+from mongo_metrics import CommandMetrics, PoolMetrics
+from catalog_snapshot import CATALOG_DATASETS, CatalogSnapshot
 from models import Service, Testimonial, QuoteRequest, ContactSubmission, CompanyInfo
-from typing import List, Optional
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple
+from bson import ObjectId
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Cache keys for catalog data (projected reads get a suffix, see projected_key)
+SERVICES_CACHE_KEY = "services"
+TESTIMONIALS_CACHE_KEY = "testimonials"
+SERVICE_CACHE_PREFIX = "service:"
+COMPANY_INFO_CACHE_KEY = "company_info"
+# Under the testimonials prefix, so testimonial invalidations drop it too
+TESTIMONIAL_STATS_CACHE_KEY = "testimonials:stats"
+
+# A seed_runs claim older than this that never finished is taken over
+SEED_CLAIM_TIMEOUT_SECONDS = 300
+
+# The one document in testimonial_stats
+TESTIMONIAL_STATS_ID = "approved"
+
+def stats_service_key(service: str) -> str:
+    """Service name usable as a field name in the stats document"""
+    return service.replace(".", "_").replace("$", "_") or "_"
+
+def testimonial_stats_recent() -> int:
+    """Most recent testimonials kept per service in the stats document"""
+    return int(os.environ.get('TESTIMONIAL_STATS_RECENT', '3'))
+
+def testimonial_preview(testimonial: dict) -> dict:
+    """The fields of a testimonial kept in the stats document's recent lists"""
+    return {
+        "id": str(testimonial["_id"]),
+        "name": testimonial.get("name"),
+        "rating": testimonial.get("rating"),
+        "text": testimonial.get("text"),
+        "location": testimonial.get("location"),
+        "date": testimonial.get("date") or testimonial.get("created_at")
+    }
+
+def projected_key(key: str, projection: Optional[dict]) -> str:
+    if not projection:
+        return key
+    return f"{key}|{json.dumps(projection, sort_keys=True)}"
+
+# Index registry: every collection's indexes, each backing a specific query.
+# Applied idempotently by Database.ensure_indexes() at startup.
+INDEXES = {
+    "services": [
+        # get_services: {"active": True}
+        IndexModel([("active", ASCENDING)], name="active"),
+    ],
+    "testimonials": [
+        # get_testimonials: {"approved": True} sorted by created_at desc
+        IndexModel(
+            [("created_at", DESCENDING)],
+            name="approved_created_at",
+            partialFilterExpression={"approved": True}
+        ),
+    ],
+    "quote_requests": [
+        # get_quote_requests: keyset pages on (created_at, _id) desc, optionally filtered
+        IndexModel([("created_at", DESCENDING), ("_id", DESCENDING)], name="created_at_id"),
+        IndexModel(
+            [("status", ASCENDING), ("created_at", DESCENDING), ("_id", DESCENDING)],
+            name="status_created_at_id"
+        ),
+        IndexModel(
+            [("service", ASCENDING), ("created_at", DESCENDING), ("_id", DESCENDING)],
+            name="service_created_at_id"
+        ),
+    ],
+    "contact_submissions": [
+        IndexModel([("created_at", DESCENDING)], name="created_at"),
+    ],
+    "email_outbox": [
+        # claim_email_job: due pending/retry jobs, and stale sending jobs
+        IndexModel([("status", ASCENDING), ("next_attempt_at", ASCENDING)], name="status_next_attempt_at"),
+        IndexModel([("status", ASCENDING), ("locked_at", ASCENDING)], name="status_locked_at"),
+    ],
+}
+
+# Motor client options read from the environment; unset ones keep the driver default
+MONGO_CLIENT_OPTIONS = (
+    # (environment variable, client option, type)
+    ("MONGO_MAX_POOL_SIZE", "maxPoolSize", int),
+    ("MONGO_MIN_POOL_SIZE", "minPoolSize", int),
+    ("MONGO_MAX_IDLE_TIME_MS", "maxIdleTimeMS", int),
+    ("MONGO_MAX_CONNECTING", "maxConnecting", int),
+    ("MONGO_WAIT_QUEUE_TIMEOUT_MS", "waitQueueTimeoutMS", int),
+    ("MONGO_SERVER_SELECTION_TIMEOUT_MS", "serverSelectionTimeoutMS", int),
+    ("MONGO_CONNECT_TIMEOUT_MS", "connectTimeoutMS", int),
+    # Wire compression in order of preference, e.g. "zstd,snappy,zlib". zstd and
+    # snappy need the zstandard / python-snappy packages; the driver skips
+    # (with a warning) any it cannot load and the server picks from the rest.
+    ("MONGO_COMPRESSORS", "compressors", str),
+    ("MONGO_ZLIB_COMPRESSION_LEVEL", "zlibCompressionLevel", int),
+)
+
+def mongo_client_options() -> dict:
+    options = {}
+    for variable, option, cast in MONGO_CLIENT_OPTIONS:
+        value = os.environ.get(variable, '').strip()
+        if value:
+            options[option] = cast(value)
+    return options
+
+class InvalidCursor(ValueError):
+    """A pagination cursor that was not produced by encode_page_cursor"""
+
+def encode_page_cursor(created_at: datetime, doc_id: Any) -> str:
+    """Opaque cursor for the (created_at, _id) position of the last document on a page"""
+    position = {"c": created_at.isoformat(), "i": str(doc_id), "o": isinstance(doc_id, ObjectId)}
+    return base64.urlsafe_b64encode(json.dumps(position).encode()).decode().rstrip("=")
+
+def decode_page_cursor(cursor: str) -> Tuple[datetime, Any]:
+    """Inverse of encode_page_cursor; raises InvalidCursor for anything malformed"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        position = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        created_at = datetime.fromisoformat(position["c"])
+        doc_id = ObjectId(position["i"]) if position["o"] else position["i"]
+    except Exception as e:
+        raise InvalidCursor("Invalid pagination cursor") from e
+    return created_at, doc_id
+
+class TTLCache:
+    """
+    In-process LRU cache with per-entry TTL and single-flight loading.
+
+    Concurrent misses for the same key share one loader call. Cached values
+    are shared between callers and must be treated as read-only.
+    """
+
+    def __init__(self, ttl: float = 300.0, max_entries: int = 128):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._inflight: Dict[str, asyncio.Task] = {}
+
+    async def get_or_load(self, key: str, loader: Callable[[], Awaitable[Any]], cache_none: bool = True) -> Any:
+        """
+        Return the cached value for key, calling loader once on a miss. With
+        cache_none=False a None result is shared with concurrent waiters but
+        not stored.
+        """
+        if self.ttl <= 0 or self.max_entries <= 0:
+            return await loader()
+
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, value = entry
+            if expires_at > time.monotonic():
+                self._entries.move_to_end(key)
+                return value
+            del self._entries[key]
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._load(key, loader, cache_none))
+            self._inflight[key] = task
+        # Shield so a cancelled request doesn't cancel the load for other waiters
+        return await asyncio.shield(task)
+
+    async def _load(self, key: str, loader: Callable[[], Awaitable[Any]], cache_none: bool = True) -> Any:
+        task = asyncio.current_task()
+        try:
+            value = await loader()
+        finally:
+            # An invalidation during the load unregisters the task; its result is stale
+            registered = self._inflight.get(key) is task
+            if registered:
+                del self._inflight[key]
+        if registered and (value is not None or cache_none):
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return value
+
+    def invalidate(self, *keys: str):
+        """Drop cached values (and any in-flight loads) for the given keys"""
+        for key in keys:
+            self._entries.pop(key, None)
+            self._inflight.pop(key, None)
+
+    def invalidate_prefix(self, prefix: str):
+        """Drop every cached value whose key starts with prefix"""
+        self.invalidate(*[key for key in list(self._entries) + list(self._inflight) if key.startswith(prefix)])
+
+    def clear(self):
+        self._entries.clear()
+        self._inflight.clear()
+
 class Database:
     def __init__(self):
         self.client = None
         self.db = None
+        self.cache = TTLCache()
+        self.service_cache = TTLCache()
+        # Filled and kept current by catalog_snapshot.catalog_watcher when enabled
+        self.snapshot = CatalogSnapshot()
+        self.snapshot_watcher = None
+        self.client_options: Dict[str, Any] = {}
+        self.pool_metrics = PoolMetrics()
         
     async def connect(self):
+        """
+        Create the client. Motor connects lazily, so this does no network
+        I/O; prepare() checks the server and sets up the collections.
+        """
         try:
             mongo_url = os.environ.get('MONGO_URL')
             db_name = os.environ.get('DB_NAME', 'cleanpro_services')
             
-            self.client = AsyncIOMotorClient(mongo_url)
-            self.db = self.client[db_name]
-            
-            # Test connection
-            await self.db.command('ping')
-            logger.info("Successfully connected to MongoDB")
+            # Catalog cache settings (TTL of 0 disables caching)
+            self.cache = TTLCache(
+                ttl=float(os.environ.get('CATALOG_CACHE_TTL', '300')),
+                max_entries=int(os.environ.get('CATALOG_CACHE_MAX_ENTRIES', '128'))
+            )
+            # Single services by id live apart, so lookups of many ids can't evict the lists
+            self.service_cache = TTLCache(
+                ttl=self.cache.ttl,
+                max_entries=int(os.environ.get('SERVICE_CACHE_MAX_ENTRIES', '256'))
+            )
             
-            # Initialize collections with sample data if empty
-            await self._initialize_data()
+            # Imported here: motor (and gridfs) are slow to import and only needed once connecting
+            from motor.motor_asyncio import AsyncIOMotorClient
+            self.client_options = mongo_client_options()
+            self.pool_metrics = PoolMetrics()
+            self.client = AsyncIOMotorClient(
+                mongo_url,
+                event_listeners=[self.pool_metrics, CommandMetrics()],
+                **self.client_options
+            )
+            logger.info("MongoDB client options: %s", self.client_options or 'driver defaults')
+            self.db = self.client[db_name]
             
         except Exception as e:
-            logger.error(f"Failed to connect to MongoDB: {e}")
+            logger.error("Failed to create MongoDB client: %s", e)
             raise
 
+    def pool_stats(self) -> dict:
+        """Client pool options plus per-server pool metrics"""
+        return {
+            "options": self.client_options,
+            "servers": self.pool_metrics.snapshot()
+        }
+
+    async def prepare(self):
+        """Ping the server, create indexes and seed empty collections"""
+        # Test connection
+        await self.db.command('ping')
+        logger.info("Successfully connected to MongoDB")
+        
+        await self.ensure_indexes()
+        
+        # Initialize collections with sample data if empty
+        await self._initialize_data()
+
     async def close(self):
         if self.client:
             self.client.close()
 
+    async def ensure_indexes(self):
+        """Create every registered index; existing identical indexes are left alone"""
+        for collection, indexes in INDEXES.items():
+            try:
+                await self.db[collection].create_indexes(indexes)
+            except OperationFailure as e:
+                # Usually an index with the same name but different options
+                logger.error("Failed to create indexes on %s: %s", collection, e)
+
     async def _initialize_data(self):
         """Initialize database with sample data if collections are empty"""
         try:
             # Initialize Services
             services_count = await self.db.services.count_documents({})
             if services_count == 0:
-                await self._init_services()
+                await self._seed("services", self._init_services)
                 
             # Initialize Testimonials
             testimonials_count = await self.db.testimonials.count_documents({})
             if testimonials_count == 0:
-                await self._init_testimonials()
+                await self._seed("testimonials", self._init_testimonials)
+            
+            # Build the testimonial stats once for testimonials that predate them;
+            # seeding builds its own, and writes keep them current after that.
+            # An empty count means another process may be seeding right now, and
+            # a rebuild from the empty collection could land after its rebuild.
+            if testimonials_count > 0 and await self.db.testimonial_stats.count_documents({"_id": TESTIMONIAL_STATS_ID}) == 0:
+                await self._seed("testimonial_stats", self.rebuild_testimonial_stats)
                 
             # TEMPORARILY DISABLE COMPANY INFO AUTO-INIT
             # Initialize Company Info
@@ -56,7 +311,53 @@ class Database:
             #     logger.info(f"Company info already exists ({company_count} documents), skipping initialization")
                 
         except Exception as e:
-            logger.error(f"Error initializing data: {e}")
+            logger.error("Error initializing data: %s", e)
+
+    async def _seed(self, collection: str, init: Callable[[], Awaitable[Any]]) -> bool:
+        """
+        Run a collection's seeding in exactly one process. Every worker starts
+        with the same empty database, so the count check alone lets several
+        seed it at once; the seed_runs claim lets one of them through. A failed
+        seed gives its claim back so the next start retries.
+        """
+        if not await self._claim_seed(collection):
+            logger.info("%s already seeded by another process, skipping", collection)
+            return False
+        try:
+            await init()
+        except Exception as e:
+            logger.error("Seeding %s failed, will retry on next start: %s", collection, e)
+            await self.db.seed_runs.delete_one({"_id": collection, "status": "seeding", "pid": os.getpid()})
+            return False
+        await self.db.seed_runs.update_one(
+            {"_id": collection},
+            {"$set": {"status": "done", "seeded_at": datetime.utcnow()}}
+        )
+        return True
+
+    async def _claim_seed(self, collection: str) -> bool:
+        now = datetime.utcnow()
+        try:
+            await self.db.seed_runs.insert_one({
+                "_id": collection,
+                "status": "seeding",
+                "pid": os.getpid(),
+                "claimed_at": now
+            })
+            return True
+        except DuplicateKeyError:
+            pass
+        # A claim still seeding after SEED_CLAIM_TIMEOUT_SECONDS belongs to a
+        # process that died mid-seed; take it over
+        stale = await self.db.seed_runs.find_one_and_update(
+            {
+                "_id": collection,
+                "status": "seeding",
+                "claimed_at": {"$lt": now - timedelta(seconds=SEED_CLAIM_TIMEOUT_SECONDS)}
+            },
+            {"$set": {"pid": os.getpid(), "claimed_at": now}}
+        )
+        return stale is not None
 
     async def _init_services(self):
         """Initialize default services if collection is empty"""
@@ -200,11 +501,13 @@ class Database:
                 ]
                 
                 result = await self.db.services.insert_many(default_services)
-                logger.info(f"Initialized {len(result.inserted_ids)} default services")
+                await self.publish_invalidation("services")
+                logger.info("Initialized %s default services", len(result.inserted_ids))
             else:
-                logger.info(f"Services collection already has {existing_count} services")
+                logger.info("Services collection already has %s services", existing_count)
         except Exception as e:
-            logger.error(f"Error initializing services: {e}")
+            logger.error("Error initializing services: %s", e)
+            raise
 
     async def _init_testimonials(self):
         """Initialize testimonials collection with sample data"""
@@ -259,6 +562,8 @@ class Database:
         ]
         
         await self.db.testimonials.insert_many(testimonials_data)
+        await self.rebuild_testimonial_stats()
+        await self.publish_invalidation("testimonials")
         logger.info("Initialized testimonials data")
 
     async def _init_company_info(self):
@@ -306,43 +611,264 @@ class Database:
         }
         
         await self.db.company_info.insert_one(company_data)
+        await self.publish_invalidation("company_info")
         logger.info("Initialized company info data")
 
+    # Cache invalidation hooks (call after any write to the collection)
+    def invalidate_services(self):
+        self.cache.invalidate_prefix(SERVICES_CACHE_KEY)
+        self.service_cache.clear()
+
+    def invalidate_testimonials(self):
+        self.cache.invalidate_prefix(TESTIMONIALS_CACHE_KEY)
+
+    def invalidate_company_info(self):
+        self.cache.invalidate_prefix(COMPANY_INFO_CACHE_KEY)
+
+    def invalidate_dataset(self, dataset: str):
+        {
+            "services": self.invalidate_services,
+            "testimonials": self.invalidate_testimonials,
+            "company_info": self.invalidate_company_info
+        }[dataset]()
+        # Reads go back to the database until the snapshot has been reloaded
+        self.snapshot.discard(dataset)
+        if self.snapshot_watcher is not None:
+            self.snapshot_watcher.request_reload(dataset)
+
+    async def load_dataset(self, dataset: str) -> Any:
+        """Unprojected catalog query result, for the in-memory snapshot"""
+        loaders = {
+            "services": self._load_services,
+            "testimonials": self._load_testimonials,
+            "company_info": self._load_company_info
+        }
+        return await loaders[dataset]()
+
+    async def publish_invalidation(self, *datasets: str):
+        """
+        Drop this process's cached copies and bump the shared version
+        counters, so every other worker drops theirs on its next poll
+        """
+        for dataset in datasets:
+            self.invalidate_dataset(dataset)
+            await self.db.cache_versions.update_one(
+                {"_id": dataset},
+                {"$inc": {"version": 1}, "$set": {"updated_at": datetime.utcnow()}},
+                upsert=True
+            )
+
+    async def get_cache_versions(self) -> Dict[str, int]:
+        cursor = self.db.cache_versions.find({}, {"version": 1})
+        return {doc["_id"]: doc.get("version", 0) async for doc in cursor}
+
     # Services CRUD
-    async def get_services(self) -> List[dict]:
-        cursor = self.db.services.find({"active": True})
+    async def get_services(self, projection: Optional[dict] = None) -> List[dict]:
+        key = projected_key(SERVICES_CACHE_KEY, projection)
+        if self.snapshot.ready("services"):
+            return self.snapshot.get("services", projection, key)
+        return await self.cache.get_or_load(
+            key,
+            lambda: self._load_services(projection)
+        )
+
+    async def _load_services(self, projection: Optional[dict] = None) -> List[dict]:
+        cursor = self.db.services.find({"active": True}, projection)
         services = await cursor.to_list(length=100)
         return services
 
-    async def get_service_by_id(self, service_id: str) -> Optional[dict]:
-        from bson import ObjectId
+    async def get_service_by_id(self, service_id: str, projection: Optional[dict] = None) -> Optional[dict]:
+        key = projected_key(SERVICE_CACHE_PREFIX + service_id, projection)
+        if self.snapshot.ready("services"):
+            known, service = self.snapshot.find_service(service_id, projection, key)
+            if known:
+                return service
+        # Unknown ids are not cached: they would only crowd out real services
+        return await self.service_cache.get_or_load(
+            key,
+            lambda: self._load_service_by_id(service_id, projection),
+            cache_none=False
+        )
+
+    async def _load_service_by_id(self, service_id: str, projection: Optional[dict] = None) -> Optional[dict]:
         try:
             # Try to convert to ObjectId if it's a valid ObjectId string
             if ObjectId.is_valid(service_id):
-                service = await self.db.services.find_one({"_id": ObjectId(service_id), "active": True})
+                service = await self.db.services.find_one({"_id": ObjectId(service_id), "active": True}, projection)
             else:
                 # Fallback to string search for UUID-based IDs
-                service = await self.db.services.find_one({"_id": service_id, "active": True})
+                service = await self.db.services.find_one({"_id": service_id, "active": True}, projection)
             return service
         except Exception:
             return None
 
     # Testimonials CRUD
-    async def get_testimonials(self) -> List[dict]:
-        cursor = self.db.testimonials.find({"approved": True}).sort("created_at", -1)
+    async def get_testimonials(self, projection: Optional[dict] = None) -> List[dict]:
+        key = projected_key(TESTIMONIALS_CACHE_KEY, projection)
+        if self.snapshot.ready("testimonials"):
+            return self.snapshot.get("testimonials", projection, key)
+        return await self.cache.get_or_load(
+            key,
+            lambda: self._load_testimonials(projection)
+        )
+
+    async def _load_testimonials(self, projection: Optional[dict] = None) -> List[dict]:
+        cursor = self.db.testimonials.find({"approved": True}, projection).sort("created_at", -1)
         testimonials = await cursor.to_list(length=100)
         return testimonials
 
+    async def create_testimonial(self, testimonial_data: dict) -> dict:
+        """Insert a testimonial and fold it into the stats if it is approved"""
+        result = await self.db.testimonials.insert_one(testimonial_data)
+        if testimonial_data.get("approved", True):
+            await self._add_to_testimonial_stats(testimonial_data)
+        await self.publish_invalidation("testimonials")
+        testimonial_data['_id'] = str(result.inserted_id)
+        return testimonial_data
+
+    # Testimonial stats: one summary document, updated in place on each write
+    # so the summary endpoint never aggregates the collection
+    async def _add_to_testimonial_stats(self, testimonial: dict):
+        rating = testimonial["rating"]
+        service = testimonial["service"]
+        service_path = f"services.{stats_service_key(service)}"
+        result = await self.db.testimonial_stats.update_one(
+            {"_id": TESTIMONIAL_STATS_ID},
+            {
+                "$inc": {
+                    "count": 1,
+                    "rating_total": rating,
+                    f"ratings.{rating}": 1,
+                    f"{service_path}.count": 1,
+                    f"{service_path}.rating_total": rating
+                },
+                "$set": {f"{service_path}.service": service, "updated_at": datetime.utcnow()},
+                "$push": {
+                    f"{service_path}.recent": {
+                        "$each": [testimonial_preview(testimonial)],
+                        "$sort": {"date": -1},
+                        "$slice": testimonial_stats_recent()
+                    }
+                }
+            }
+        )
+        if result.matched_count == 0:
+            # No stats yet: an upsert would hold only this testimonial, so
+            # count everything (this one is already inserted)
+            await self.rebuild_testimonial_stats()
+
+    async def rebuild_testimonial_stats(self) -> dict:
+        """
+        Recompute the stats document from the approved testimonials. Needed
+        only after writes that bypass create_testimonial (hand edits,
+        deletions, approvals).
+        """
+        recent = testimonial_stats_recent()
+        stats: Dict[str, Any] = {
+            "_id": TESTIMONIAL_STATS_ID,
+            "count": 0,
+            "rating_total": 0,
+            "ratings": {},
+            "services": {},
+            "updated_at": datetime.utcnow()
+        }
+        cursor = self.db.testimonials.find(
+            {"approved": True},
+            {"name": 1, "service": 1, "rating": 1, "text": 1, "location": 1, "date": 1, "created_at": 1}
+        ).sort("date", DESCENDING)
+        async for testimonial in cursor:
+            rating = testimonial.get("rating")
+            service = testimonial.get("service")
+            if not isinstance(rating, int) or not service:
+                continue
+            stats["count"] += 1
+            stats["rating_total"] += rating
+            stats["ratings"][str(rating)] = stats["ratings"].get(str(rating), 0) + 1
+            entry = stats["services"].setdefault(
+                stats_service_key(service),
+                {"service": service, "count": 0, "rating_total": 0, "recent": []}
+            )
+            entry["count"] += 1
+            entry["rating_total"] += rating
+            if len(entry["recent"]) < recent:
+                entry["recent"].append(testimonial_preview(testimonial))
+        
+        await self.db.testimonial_stats.replace_one({"_id": TESTIMONIAL_STATS_ID}, stats, upsert=True)
+        self.cache.invalidate(TESTIMONIAL_STATS_CACHE_KEY)
+        logger.info("Rebuilt testimonial stats from %s approved testimonials", stats["count"])
+        return stats
+
+    async def get_testimonial_stats(self) -> Optional[dict]:
+        return await self.cache.get_or_load(
+            TESTIMONIAL_STATS_CACHE_KEY,
+            lambda: self.db.testimonial_stats.find_one({"_id": TESTIMONIAL_STATS_ID})
+        )
+
     # Quote Requests CRUD
     async def create_quote_request(self, quote_data: dict) -> dict:
         result = await self.db.quote_requests.insert_one(quote_data)
         quote_data['_id'] = str(result.inserted_id)
         return quote_data
 
-    async def get_quote_requests(self) -> List[dict]:
-        cursor = self.db.quote_requests.find().sort("created_at", -1)
-        requests = await cursor.to_list(length=1000)
-        return requests
+    async def create_quote_requests(self, quotes: List[dict]) -> Dict[int, str]:
+        """
+        Insert a batch of quote requests with one unordered insert_many.
+
+        Each document gets its _id up front (returned as a string, like
+        create_quote_request) so outcomes map back by position. Returns the
+        per-document write errors by index; documents without one were
+        inserted, since an unordered insert carries on past failures.
+        """
+        for quote in quotes:
+            quote['_id'] = ObjectId()
+        errors: Dict[int, str] = {}
+        try:
+            await self.db.quote_requests.insert_many(quotes, ordered=False)
+        except BulkWriteError as e:
+            for error in e.details.get("writeErrors", []):
+                errors[error["index"]] = error.get("errmsg", "Write failed")
+            if e.details.get("writeConcernErrors"):
+                logger.warning("Bulk quote insert reported write concern errors: %s", e.details["writeConcernErrors"])
+        for quote in quotes:
+            quote['_id'] = str(quote['_id'])
+        return errors
+
+    async def get_quote_requests(
+        self,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        status: Optional[str] = None,
+        service: Optional[str] = None,
+        projection: Optional[dict] = None
+    ) -> Tuple[List[dict], Optional[str]]:
+        """
+        One page of quote requests, newest first, plus the cursor for the
+        next page (None on the last page). Keyset pagination on
+        (created_at, _id) keeps every page an index range scan.
+        """
+        query: Dict[str, Any] = {}
+        if status:
+            query["status"] = status
+        if service:
+            query["service"] = service
+        if cursor:
+            created_at, doc_id = decode_page_cursor(cursor)
+            query["$or"] = [
+                {"created_at": {"$lt": created_at}},
+                {"created_at": created_at, "_id": {"$lt": doc_id}}
+            ]
+        
+        find_cursor = self.db.quote_requests.find(query, projection).sort(
+            [("created_at", DESCENDING), ("_id", DESCENDING)]
+        ).limit(limit + 1)
+        requests = await find_cursor.to_list(length=limit + 1)
+        
+        next_cursor = None
+        if len(requests) > limit:
+            requests = requests[:limit]
+            last = requests[-1]
+            next_cursor = encode_page_cursor(last["created_at"], last["_id"])
+        return requests, next_cursor
 
     # Contact Submissions CRUD
     async def create_contact_submission(self, contact_data: dict) -> dict:
@@ -350,9 +876,72 @@ class Database:
         contact_data['_id'] = str(result.inserted_id)
         return contact_data
 
+    async def update_contact_email_status(self, submission_id: str, email_status: str):
+        query_id = ObjectId(submission_id) if ObjectId.is_valid(submission_id) else submission_id
+        await self.db.contact_submissions.update_one(
+            {"_id": query_id},
+            {"$set": {"email_status": email_status, "updated_at": datetime.utcnow()}}
+        )
+
+    # Email Outbox
+    async def enqueue_email_job(self, job_data: dict) -> dict:
+        result = await self.db.email_outbox.insert_one(job_data)
+        job_data['_id'] = result.inserted_id
+        return job_data
+
+    async def claim_email_job(self, lock_timeout: float) -> Optional[dict]:
+        """Atomically claim the next due job, including ones whose worker died mid-send"""
+        now = datetime.utcnow()
+        return await self.db.email_outbox.find_one_and_update(
+            {"$or": [
+                {"status": {"$in": ["pending", "retry"]}, "next_attempt_at": {"$lte": now}},
+                {"status": "sending", "locked_at": {"$lte": now - timedelta(seconds=lock_timeout)}}
+            ]},
+            {"$set": {"status": "sending", "locked_at": now, "updated_at": now}, "$inc": {"attempts": 1}},
+            sort=[("next_attempt_at", 1)],
+            return_document=ReturnDocument.AFTER
+        )
+
+    async def update_email_job(self, job_id, fields: dict):
+        fields["updated_at"] = datetime.utcnow()
+        await self.db.email_outbox.update_one({"_id": job_id}, {"$set": fields})
+
+    # Exports
+    async def iter_documents(
+        self,
+        collection: str,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        projection: Optional[dict] = None,
+        batch_size: int = 500
+    ) -> AsyncIterator[dict]:
+        """Stream a collection oldest first, fetching batch_size documents per round-trip"""
+        query: Dict[str, Any] = {}
+        if start or end:
+            query["created_at"] = {}
+            if start:
+                query["created_at"]["$gte"] = start
+            if end:
+                query["created_at"]["$lt"] = end
+        
+        cursor = self.db[collection].find(query, projection).sort(
+            "created_at", ASCENDING
+        ).batch_size(batch_size)
+        async for doc in cursor:
+            yield doc
+
     # Company Info
-    async def get_company_info(self) -> Optional[dict]:
-        company_info = await self.db.company_info.find_one()
+    async def get_company_info(self, projection: Optional[dict] = None) -> Optional[dict]:
+        key = projected_key(COMPANY_INFO_CACHE_KEY, projection)
+        if self.snapshot.ready("company_info"):
+            return self.snapshot.get("company_info", projection, key)
+        return await self.cache.get_or_load(
+            key,
+            lambda: self._load_company_info(projection)
+        )
+
+    async def _load_company_info(self, projection: Optional[dict] = None) -> Optional[dict]:
+        company_info = await self.db.company_info.find_one({}, projection)
         return company_info
 
 # Global database instance
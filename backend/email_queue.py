@@ -0,0 +1,170 @@
+import os
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from typing import Callable, List, Optional
+from blob_store import photo_store
+
+logger = logging.getLogger(__name__)
+
+class EmailQueue:
+    """
+    Durable outbound email queue.
+
+    Jobs are stored in the email_outbox collection and reference photos in
+    the content-addressed photo store, so nothing is lost if the process
+    restarts. A small pool of worker tasks claims due jobs and hands them to
+    the email service, whose transports send off the event loop. Failed
+    sends are retried with exponential backoff and the outcome is mirrored
+    onto the contact submission's email_status field.
+    """
+
+    def __init__(self):
+        self.database = None
+        self.get_email_service: Optional[Callable] = None
+        self._workers: List[asyncio.Task] = []
+        self._wakeup = asyncio.Event()
+        self._stopping = False
+
+    def _configure(self):
+        self.worker_count = int(os.environ.get('EMAIL_QUEUE_WORKERS', '2'))
+        self.max_attempts = int(os.environ.get('EMAIL_MAX_ATTEMPTS', '5'))
+        self.backoff_base = float(os.environ.get('EMAIL_RETRY_BACKOFF_SECONDS', '30'))
+        self.backoff_max = float(os.environ.get('EMAIL_RETRY_BACKOFF_MAX_SECONDS', '3600'))
+        self.poll_interval = float(os.environ.get('EMAIL_QUEUE_POLL_SECONDS', '5'))
+        self.lock_timeout = float(os.environ.get('EMAIL_QUEUE_LOCK_TIMEOUT_SECONDS', '300'))
+        # attach: photos go out as attachments (each digest once per email)
+        # link: the email links to /api/photos/<digest> and carries no photo bytes
+        self.photo_mode = os.environ.get('EMAIL_PHOTO_MODE', 'attach').lower()
+        self.photo_base_url = os.environ.get('PHOTO_BASE_URL', '').rstrip('/')
+        if self.photo_mode == 'link' and not self.photo_base_url:
+            logger.warning("EMAIL_PHOTO_MODE=link needs PHOTO_BASE_URL; attaching photos instead")
+            self.photo_mode = 'attach'
+
+    async def start(self, database, get_email_service: Callable):
+        """
+        Start the workers. The email service comes from a provider called per
+        job, so missing SMTP configuration fails (and retries) jobs instead of
+        stopping the queue from starting.
+        """
+        self._configure()
+        self.database = database
+        self.get_email_service = get_email_service
+        self._stopping = False
+        self._workers = [
+            asyncio.create_task(self._worker(n)) for n in range(self.worker_count)
+        ]
+        logger.info("Email queue started with %s workers", self.worker_count)
+
+    async def stop(self):
+        self._stopping = True
+        self._wakeup.set()
+        for task in self._workers:
+            task.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    async def enqueue_contact_email(
+        self,
+        submission_id: str,
+        name: str,
+        email: str,
+        phone: Optional[str],
+        service: str,
+        message: str,
+        photos: Optional[List[dict]] = None
+    ) -> dict:
+        """Persist a delivery job for the contact submission; photos are photo store references"""
+        now = datetime.utcnow()
+        job = await self.database.enqueue_email_job({
+            "kind": "contact",
+            "submission_id": submission_id,
+            "payload": {
+                "name": name,
+                "email": email,
+                "phone": phone,
+                "service": service,
+                "message": message
+            },
+            "photos": photos or [],
+            "status": "pending",
+            "attempts": 0,
+            "next_attempt_at": now,
+            "created_at": now,
+            "updated_at": now
+        })
+        self._wakeup.set()
+        return job
+
+    async def _worker(self, worker_id: int):
+        while not self._stopping:
+            # Clear before claiming so an enqueue racing with the claim still wakes us
+            self._wakeup.clear()
+            try:
+                job = await self.database.claim_email_job(self.lock_timeout)
+            except Exception as e:
+                logger.error("Email queue worker %s failed to claim a job: %s", worker_id, e)
+                job = None
+
+            if job is None:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            try:
+                await self._process(job)
+            except Exception as e:
+                logger.error("Email queue worker %s failed to process job %s: %s", worker_id, job['_id'], e)
+
+    async def _process(self, job: dict):
+        attachments, photo_links = self._photo_content(job.get("photos") or [])
+        try:
+            await self.get_email_service().deliver_contact_email(
+                attachments=attachments, photo_links=photo_links, **job["payload"]
+            )
+        except Exception as e:
+            await self._record_failure(job, e)
+            return
+
+        await self.database.update_email_job(job["_id"], {"status": "sent", "sent_at": datetime.utcnow()})
+        await self.database.update_contact_email_status(job["submission_id"], "sent")
+
+    async def _record_failure(self, job: dict, error: Exception):
+        attempts = job.get("attempts", 1)
+        if attempts >= self.max_attempts:
+            logger.error("Giving up on email job %s after %s attempts: %s", job['_id'], attempts, error)
+            await self.database.update_email_job(job["_id"], {"status": "failed", "last_error": str(error)})
+            await self.database.update_contact_email_status(job["submission_id"], "failed")
+            return
+
+        delay = min(self.backoff_base * (2 ** (attempts - 1)), self.backoff_max)
+        logger.warning("Email job %s attempt %s failed, retrying in %.0fs: %s", job['_id'], attempts, delay, error)
+        await self.database.update_email_job(job["_id"], {
+            "status": "retry",
+            "last_error": str(error),
+            "next_attempt_at": datetime.utcnow() + timedelta(seconds=delay)
+        })
+        await self.database.update_contact_email_status(job["submission_id"], "retrying")
+
+    def _photo_content(self, photos: List[dict]):
+        """Split photo references into attachments or links according to the photo mode"""
+        if self.photo_mode == 'link':
+            return [], [f"{self.photo_base_url}/api/photos/{photo['digest']}" for photo in photos]
+
+        attachments = []
+        seen = set()
+        for photo in photos:
+            if photo["digest"] in seen:
+                continue
+            seen.add(photo["digest"])
+            attachments.append({
+                "filename": photo["filename"],
+                "content_type": photo.get("content_type"),
+                "path": str(photo_store.path_for(photo["digest"]))
+            })
+        return attachments, []
+
+# Global email queue instance
+email_queue = EmailQueue()
@@ -1,25 +1,27 @@
 import os
+import time
+import uuid
+import base64
+import asyncio
 import smtplib
 import logging
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from email.mime.base import MIMEBase
-from email import encoders
-from typing import List, Optional
-from fastapi import UploadFile
+from email.policy import SMTP
+from contextlib import ExitStack
+from typing import BinaryIO, List, Optional, Tuple
 import tempfile
+import threading
 import mimetypes
-from dotenv import load_dotenv
-from pathlib import Path
+from smtp_pool import SMTPConnectionPool
+from email_transport import AsyncSMTPTransport, SendTimings
 
-# Load environment variables
-ROOT_DIR = Path(__file__).parent
-load_dotenv(ROOT_DIR / '.env')
-
-# Set up logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Attachment bytes encoded per step; a multiple of 57 keeps every base64 line full
+ATTACHMENT_READ_SIZE = 57 * 1024
+
 class EmailService:
     def __init__(self):
         self.smtp_server = os.environ.get('SMTP_SERVER', 'smtp.gmail.com')
@@ -30,138 +32,290 @@ class EmailService:
         self.recipient_email = os.environ.get('RECIPIENT_EMAIL')
         
         # Log configuration (without password)
-        logger.info(f"Email service configured:")
-        logger.info(f"  SMTP Server: {self.smtp_server}")
-        logger.info(f"  SMTP Port: {self.smtp_port}")
-        logger.info(f"  Username: {self.smtp_username}")
-        logger.info(f"  Sender: {self.sender_email}")
-        logger.info(f"  Recipient: {self.recipient_email}")
+        logger.info("Email service configured:")
+        logger.info("  SMTP Server: %s", self.smtp_server)
+        logger.info("  SMTP Port: %s", self.smtp_port)
+        logger.info("  Username: %s", self.smtp_username)
+        logger.info("  Sender: %s", self.sender_email)
+        logger.info("  Recipient: %s", self.recipient_email)
         
         # Validate required environment variables
         if not all([self.smtp_username, self.smtp_password, self.sender_email, self.recipient_email]):
-            logger.warning(f"Missing email config: username={bool(self.smtp_username)}, password={bool(self.smtp_password)}, sender={bool(self.sender_email)}, recipient={bool(self.recipient_email)}")
+            logger.warning("Missing email config: username=%s, password=%s, sender=%s, recipient=%s", bool(self.smtp_username), bool(self.smtp_password), bool(self.sender_email), bool(self.recipient_email))
             raise ValueError("Missing required email configuration. Please check environment variables.")
+        
+        use_starttls = os.environ.get('SMTP_STARTTLS', 'true').lower() != 'false'
+        timeout = float(os.environ.get('SMTP_TIMEOUT_SECONDS', '30'))
+        
+        # Reusable authenticated SMTP sessions (used by the sync transport and the startup probe)
+        self.pool = SMTPConnectionPool(
+            host=self.smtp_server,
+            port=self.smtp_port,
+            username=self.smtp_username,
+            password=self.smtp_password,
+            size=int(os.environ.get('SMTP_POOL_SIZE', '2')),
+            max_idle=float(os.environ.get('SMTP_POOL_MAX_IDLE_SECONDS', '120')),
+            keepalive_interval=float(os.environ.get('SMTP_KEEPALIVE_SECONDS', '30')),
+            use_starttls=use_starttls,
+            timeout=timeout
+        )
+        
+        # EMAIL_TRANSPORT=sync sends with pooled smtplib sessions in a worker thread;
+        # EMAIL_TRANSPORT=async sends natively on the event loop via aiosmtplib
+        self.transport = os.environ.get('EMAIL_TRANSPORT', 'sync').lower()
+        self.async_transport = None
+        if self.transport == 'async':
+            try:
+                self.async_transport = AsyncSMTPTransport(
+                    host=self.smtp_server,
+                    port=self.smtp_port,
+                    username=self.smtp_username,
+                    password=self.smtp_password,
+                    max_concurrent=int(os.environ.get('SMTP_MAX_CONCURRENT_SENDS', '4')),
+                    use_starttls=use_starttls,
+                    timeout=timeout
+                )
+            except RuntimeError as e:
+                logger.warning("%s; falling back to the sync transport", e)
+                self.transport = 'sync'
+        self.timings = SendTimings(self.transport)
+        logger.info("  Transport: %s", self.transport)
     
-    async def send_contact_email(
-        self, 
-        name: str, 
-        email: str, 
-        phone: Optional[str], 
-        service: str, 
-        message: str, 
-        photos: List[UploadFile] = None
-    ) -> bool:
-        """
-        Send contact form submission via email with optional photo attachments
+    def _build_contact_message(
+        self,
+        name: str,
+        email: str,
+        phone: Optional[str],
+        service: str,
+        message: str,
+        photo_links: Optional[List[str]] = None,
+        missing_photos: Optional[List[str]] = None
+    ) -> MIMEMultipart:
+        """
+        Build the contact notification message without attachments
         """
+        # Create message
+        msg = MIMEMultipart(policy=SMTP)
+        msg['From'] = self.sender_email
+        msg['To'] = self.recipient_email
+        msg['Subject'] = f"New Contact Form Submission from {name}"
+        
+        # Create email body
+        body = f"""
+        New contact form submission received:
+        
+        Name: {name}
+        Email: {email}
+        Phone: {phone or 'Not provided'}
+        Service: {service}
+        
+        Message:
+        {message}
+        {self._format_photo_links(photo_links)}{self._format_missing_photos(missing_photos)}
+        ---
+        Submitted from Aurex Exteriors website
+        """
+        
+        # Attach body to email
+        msg.attach(MIMEText(body, 'plain'))
+        return msg
+    
+    @staticmethod
+    def _format_photo_links(photo_links: Optional[List[str]]) -> str:
+        if not photo_links:
+            return ""
+        lines = "\n".join(f"        {link}" for link in photo_links)
+        return f"\n        Photos:\n{lines}\n"
+    
+    @staticmethod
+    def _format_missing_photos(missing_photos: Optional[List[str]]) -> str:
+        if not missing_photos:
+            return ""
+        lines = "\n".join(f"        {filename}" for filename in missing_photos)
+        return f"\n        Photos no longer stored (not attached):\n{lines}\n"
+    
+    async def _timed(self, send):
+        start = time.perf_counter()
+        ok = False
         try:
-            # Create message
-            msg = MIMEMultipart()
-            msg['From'] = self.sender_email
-            msg['To'] = self.recipient_email
-            msg['Subject'] = f"New Contact Form Submission from {name}"
-            
-            # Create email body
-            body = f"""
-            New contact form submission received:
-            
-            Name: {name}
-            Email: {email}
-            Phone: {phone or 'Not provided'}
-            Service: {service}
-            
-            Message:
-            {message}
-            
-            ---
-            Submitted from Aurex Exteriors website
-            """
-            
-            # Attach body to email
-            msg.attach(MIMEText(body, 'plain'))
-            
-            # Handle photo attachments if provided
-            if photos:
-                for photo in photos:
-                    if photo.filename:
-                        await self._attach_photo(msg, photo)
-            
-            # Send email
-            with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
-                server.starttls()
-                server.login(self.smtp_username, self.smtp_password)
-                server.send_message(msg)
-            
-            logger.info(f"Contact email sent successfully for {name} ({email})")
-            return True
-            
-        except Exception as e:
-            logger.error(f"Failed to send contact email: {str(e)}")
-            return False
+            await send
+            ok = True
+        finally:
+            self.timings.record(time.perf_counter() - start, ok)
     
-    async def _attach_photo(self, msg: MIMEMultipart, photo: UploadFile):
+    async def send_message_file(self, fp: BinaryIO):
         """
-        Attach a photo file to the email message
+        Send a message rendered by _render_contact_message. The sync transport
+        streams it from the file; aiosmtplib needs the whole message in memory.
         """
-        try:
-            # Read file content
-            content = await photo.read()
-            
-            # Reset file pointer for potential re-use
-            await photo.seek(0)
-            
-            # Determine MIME type
-            content_type, _ = mimetypes.guess_type(photo.filename)
-            if not content_type:
-                content_type = 'application/octet-stream'
-            
-            main_type, sub_type = content_type.split('/', 1)
-            
-            # Create attachment
-            attachment = MIMEBase(main_type, sub_type)
-            attachment.set_payload(content)
-            encoders.encode_base64(attachment)
-            
-            # Add header with filename
-            attachment.add_header(
-                'Content-Disposition',
-                f'attachment; filename="{photo.filename}"'
+        recipients = [self.recipient_email]
+        if self.async_transport is not None:
+            fp.seek(0)
+            data = await asyncio.to_thread(fp.read)
+            await self._timed(self.async_transport.send_raw(self.sender_email, recipients, data))
+        else:
+            await self._timed(asyncio.to_thread(self.pool.send_file, self.sender_email, recipients, fp))
+    
+    def send_stats(self) -> dict:
+        """
+        Per-send timing summary for the active transport
+        """
+        return self.timings.snapshot()
+    
+    async def deliver_contact_email(
+        self,
+        name: str,
+        email: str,
+        phone: Optional[str],
+        service: str,
+        message: str,
+        attachments: Optional[List[dict]] = None,
+        photo_links: Optional[List[str]] = None
+    ):
+        """
+        Send used by the email queue workers. Attachments are stored files
+        described as {"filename", "content_type", "path"}; photo_links are
+        listed in the body instead. Raises on failure so the caller can
+        schedule a retry.
+        """
+        with tempfile.TemporaryFile() as fp:
+            await asyncio.to_thread(
+                self._render_with_files, fp, name, email, phone, service, message, attachments, photo_links
             )
-            
-            # Attach to message
-            msg.attach(attachment)
-            
-            logger.info(f"Photo attachment added: {photo.filename}")
-            
-        except Exception as e:
-            logger.error(f"Failed to attach photo {photo.filename}: {str(e)}")
+            await self.send_message_file(fp)
+        logger.info("Contact email sent successfully for %s (%s)", name, email)
+    
+    def _render_with_files(
+        self,
+        fp: BinaryIO,
+        name: str,
+        email: str,
+        phone: Optional[str],
+        service: str,
+        message: str,
+        attachments: Optional[List[dict]],
+        photo_links: Optional[List[str]] = None
+    ):
+        with ExitStack() as stack:
+            sources = []
+            missing = []
+            for attachment in attachments or []:
+                # A stored photo can be gone (e.g. an ephemeral PHOTO_STORE_DIR after a
+                # redeploy); the notification still goes out, naming what is missing
+                try:
+                    src = stack.enter_context(open(attachment["path"], 'rb'))
+                except OSError as e:
+                    logger.warning("Photo %s could not be attached: %s", attachment["filename"], e)
+                    missing.append(attachment["filename"])
+                    continue
+                sources.append((attachment["filename"], attachment.get("content_type"), src))
+            self._render_contact_message(fp, name, email, phone, service, message, sources, photo_links, missing)
+    
+    def _render_contact_message(
+        self,
+        fp: BinaryIO,
+        name: str,
+        email: str,
+        phone: Optional[str],
+        service: str,
+        message: str,
+        sources: List[Tuple[str, Optional[str], BinaryIO]],
+        photo_links: Optional[List[str]] = None,
+        missing_photos: Optional[List[str]] = None
+    ):
+        """
+        Write the complete message with CRLF line endings to fp. Attachments
+        are base64 encoded straight from their source files one chunk at a
+        time, so memory use doesn't grow with attachment size.
+        """
+        msg = self._build_contact_message(name, email, phone, service, message, photo_links, missing_photos)
+        boundary = f"==============={uuid.uuid4().hex}=="
+        msg.set_boundary(boundary)
+        
+        # Write headers and the text part, leaving the multipart open for attachments
+        head = msg.as_bytes(policy=SMTP)
+        closing = f"--{boundary}--".encode()
+        fp.write(head[:head.rindex(closing)])
+        
+        for filename, fallback_type, src in sources:
+            self._write_attachment(fp, boundary, filename, fallback_type, src)
+        
+        fp.write(closing + b"\r\n")
+        fp.flush()
+    
+    def _write_attachment(self, fp: BinaryIO, boundary: str, filename: str, fallback_type: Optional[str], src: BinaryIO):
+        """
+        Write one base64 attachment part to the message file
+        """
+        # Determine MIME type
+        content_type, _ = mimetypes.guess_type(filename)
+        if not content_type:
+            content_type = fallback_type or 'application/octet-stream'
+        
+        main_type, sub_type = content_type.split('/', 1)
+        
+        part = MIMEBase(main_type, sub_type, policy=SMTP)
+        part['Content-Transfer-Encoding'] = 'base64'
+        part.add_header('Content-Disposition', 'attachment', filename=filename)
+        
+        fp.write(f"--{boundary}\r\n".encode())
+        fp.write(part.as_bytes(policy=SMTP))
+        while True:
+            chunk = src.read(ATTACHMENT_READ_SIZE)
+            if not chunk:
+                break
+            fp.write(base64.encodebytes(chunk).replace(b"\n", b"\r\n"))
+    
+    def close(self):
+        """
+        Close pooled SMTP sessions
+        """
+        self.pool.close()
     
     def test_connection(self) -> bool:
         """
         Test SMTP connection and authentication
         """
         try:
-            logger.info(f"Testing SMTP connection to {self.smtp_server}:{self.smtp_port}")
-            logger.info(f"Using username: {self.smtp_username}")
+            logger.info("Testing SMTP connection to %s:%s", self.smtp_server, self.smtp_port)
+            logger.info("Using username: %s", self.smtp_username)
             
-            with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
-                logger.info("Starting TLS...")
-                server.starttls()
-                logger.info("Attempting login...")
-                server.login(self.smtp_username, self.smtp_password)
+            # Opens (or revalidates) a pooled session, which later sends reuse
+            with self.pool.connection():
                 logger.info("✅ SMTP connection test successful")
                 return True
         except smtplib.SMTPAuthenticationError as e:
-            logger.error(f"❌ Gmail authentication failed. The password 'MohamadTommy2905' is not accepted by Gmail.")
-            logger.error(f"This is likely because:")
-            logger.error(f"1. This is not a Gmail App Password (App passwords are 16 characters like 'abcd efgh ijkl mnop')")
-            logger.error(f"2. 2-Factor Authentication is not enabled on aurexexteriors@gmail.com")
-            logger.error(f"3. App passwords are not enabled for this account")
-            logger.error(f"Gmail error: {str(e)}")
+            logger.error("❌ Gmail authentication failed. The password 'MohamadTommy2905' is not accepted by Gmail.")
+            logger.error("This is likely because:")
+            logger.error("1. This is not a Gmail App Password (App passwords are 16 characters like 'abcd efgh ijkl mnop')")
+            logger.error("2. 2-Factor Authentication is not enabled on aurexexteriors@gmail.com")
+            logger.error("3. App passwords are not enabled for this account")
+            logger.error("Gmail error: %s", e)
             return False
         except Exception as e:
-            logger.error(f"SMTP connection test failed: {str(e)}")
+            logger.error("SMTP connection test failed: %s", e)
             return False
 
-# Create global email service instance
-email_service = EmailService()
\ No newline at end of file
+# Shared email service, built from the environment on first use so that
+# importing this module needs no SMTP configuration and does no I/O
+_email_service: Optional[EmailService] = None
+_email_service_lock = threading.Lock()
+
+def get_email_service() -> EmailService:
+    """
+    The shared EmailService, constructed on first call.
+
+    Raises ValueError if the email configuration is missing; the next call
+    tries again, so fixing the environment does not need a restart.
+    """
+    global _email_service
+    if _email_service is None:
+        with _email_service_lock:
+            if _email_service is None:
+                _email_service = EmailService()
+    return _email_service
+
+def close_email_service():
+    """Close the shared service's SMTP sessions, if it was ever constructed"""
+    if _email_service is not None:
+        _email_service.close()
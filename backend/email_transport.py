@@ -0,0 +1,93 @@
+import asyncio
+import logging
+from collections import deque
+from typing import List, Optional
+from metrics import SMTP_SEND_SECONDS
+
+logger = logging.getLogger(__name__)
+
+class SendTimings:
+    """Rolling per-send latency samples for one transport"""
+
+    def __init__(self, transport: str, window: int = 500):
+        self.transport = transport
+        self.samples = deque(maxlen=window)
+        self.sent = 0
+        self.failed = 0
+        self.last_ms: Optional[float] = None
+
+    def record(self, seconds: float, ok: bool):
+        self.last_ms = seconds * 1000
+        self.samples.append(self.last_ms)
+        SMTP_SEND_SECONDS.observe((self.transport, "ok" if ok else "error"), seconds)
+        if ok:
+            self.sent += 1
+        else:
+            self.failed += 1
+
+    def snapshot(self) -> dict:
+        ordered = sorted(self.samples)
+
+        def percentile(p: float) -> Optional[float]:
+            if not ordered:
+                return None
+            return round(ordered[min(len(ordered) - 1, int(p * len(ordered)))], 2)
+
+        return {
+            "transport": self.transport,
+            "sent": self.sent,
+            "failed": self.failed,
+            "samples": len(ordered),
+            "last_ms": round(self.last_ms, 2) if self.last_ms is not None else None,
+            "avg_ms": round(sum(ordered) / len(ordered), 2) if ordered else None,
+            "p50_ms": percentile(0.50),
+            "p95_ms": percentile(0.95),
+            "max_ms": round(ordered[-1], 2) if ordered else None
+        }
+
+class AsyncSMTPTransport:
+    """
+    Native asyncio SMTP transport built on aiosmtplib.
+
+    Each send runs on the event loop with its own session; a semaphore caps
+    how many sends are in flight at once.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        username: Optional[str],
+        password: Optional[str],
+        max_concurrent: int = 4,
+        use_starttls: bool = True,
+        timeout: float = 30.0
+    ):
+        # Optional dependency, only needed (and imported) for EMAIL_TRANSPORT=async
+        try:
+            import aiosmtplib
+        except ImportError:
+            raise RuntimeError("aiosmtplib is not installed; it is required for EMAIL_TRANSPORT=async")
+        self._smtp = aiosmtplib
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.use_starttls = use_starttls
+        self.timeout = timeout
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+
+    async def send_raw(self, sender: str, recipients: List[str], data: bytes):
+        """Send an already rendered message"""
+        async with self._semaphore:
+            await self._smtp.send(data, sender=sender, recipients=recipients, **self._connection_kwargs())
+
+    def _connection_kwargs(self) -> dict:
+        return {
+            "hostname": self.host,
+            "port": self.port,
+            "username": self.username or None,
+            "password": self.password if self.username else None,
+            "start_tls": self.use_starttls,
+            "timeout": self.timeout
+        }
@@ -0,0 +1,92 @@
+import io
+import csv
+import json
+from datetime import datetime
+from typing import Any, AsyncIterator, List
+from bson import ObjectId
+
+# Exportable collections and the fields each may project ("id" is the Mongo _id)
+EXPORTS = {
+    "quote-requests": {
+        "collection": "quote_requests",
+        "fields": [
+            "id", "name", "email", "phone", "service", "message", "status",
+            "estimated_price", "notes", "created_at", "updated_at"
+        ],
+    },
+    "contact-submissions": {
+        "collection": "contact_submissions",
+        "fields": [
+            "id", "name", "email", "phone", "service", "message", "status",
+            "email_status", "photos", "created_at"
+        ],
+    },
+}
+
+# Leading characters that make spreadsheet apps evaluate a cell as a formula
+CSV_FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+# Rows buffered per chunk written to the response
+ROWS_PER_CHUNK = 200
+
+def mongo_projection(fields: List[str]) -> dict:
+    projection = {field: 1 for field in fields if field != "id"}
+    if "id" not in fields:
+        projection["_id"] = 0
+    return projection
+
+def _json_default(value: Any):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, ObjectId):
+        return str(value)
+    raise TypeError(f"Cannot serialize {type(value).__name__}")
+
+def _row(doc: dict, fields: List[str]) -> dict:
+    return {field: doc.get("_id" if field == "id" else field) for field in fields}
+
+async def ndjson_chunks(docs: AsyncIterator[dict], fields: List[str]) -> AsyncIterator[bytes]:
+    """One JSON object per line, flushed every ROWS_PER_CHUNK rows"""
+    lines = []
+    async for doc in docs:
+        lines.append(json.dumps(_row(doc, fields), default=_json_default))
+        if len(lines) >= ROWS_PER_CHUNK:
+            yield ("\n".join(lines) + "\n").encode()
+            lines = []
+    if lines:
+        yield ("\n".join(lines) + "\n").encode()
+
+def _csv_text(value: str) -> str:
+    """Quote submitted text that a spreadsheet would otherwise run as a formula"""
+    if value.startswith(CSV_FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+def _csv_cell(value: Any) -> Any:
+    if value is None:
+        return ""
+    if isinstance(value, (list, dict)):
+        return _csv_text(json.dumps(value, default=_json_default))
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, str):
+        return _csv_text(value)
+    return value
+
+async def csv_chunks(docs: AsyncIterator[dict], fields: List[str]) -> AsyncIterator[bytes]:
+    """Header row then one row per document, flushed every ROWS_PER_CHUNK rows"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(fields)
+    rows = 0
+    async for doc in docs:
+        row = _row(doc, fields)
+        writer.writerow([_csv_cell(row[field]) for field in fields])
+        rows += 1
+        if rows >= ROWS_PER_CHUNK:
+            yield buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate()
+            rows = 0
+    if buffer.tell():
+        yield buffer.getvalue().encode()
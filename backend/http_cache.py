@@ -0,0 +1,97 @@
+import hashlib
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional
+from fastapi import Request, Response
+from compression import choose_encoding, compress
+
+class RenderedResponse:
+    """
+    JSON response body rendered once, with its strong ETag.
+
+    Compressed forms are produced on first request for each content coding
+    and kept with the entry, so each data version is compressed at most
+    once per coding. Bodies under compress_min_bytes are always sent as-is.
+    """
+
+    __slots__ = ("source", "body", "etag", "compress_min_bytes", "_encoded")
+
+    def __init__(self, source: Any, body: bytes, compress_min_bytes: int = 1024):
+        self.source = source
+        self.body = body
+        self.etag = '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+        self.compress_min_bytes = compress_min_bytes
+        self._encoded: Dict[str, bytes] = {}
+
+    def encoded(self, encoding: Optional[str]) -> Optional[bytes]:
+        """Body in the given content coding, or None if it is sent uncompressed"""
+        if encoding is None or len(self.body) < self.compress_min_bytes:
+            return None
+        body = self._encoded.get(encoding)
+        if body is None:
+            body = self._encoded[encoding] = compress(self.body, encoding, best=True)
+        return body
+
+    def etag_for(self, encoding: str) -> str:
+        # Each coding is a different representation, so it gets its own ETag
+        return self.etag[:-1] + "-" + encoding + '"'
+
+class ResponseCache:
+    """
+    Rendered response bodies keyed by name.
+
+    An entry is reused for as long as it was rendered from the very same
+    source object. The database cache hands out the same object until the
+    data is reloaded or invalidated, so each data version is rendered once.
+    """
+
+    def __init__(self, max_entries: int = 256, compress_min_bytes: int = 1024):
+        self.max_entries = max_entries
+        self.compress_min_bytes = compress_min_bytes
+        self._entries: "OrderedDict[str, RenderedResponse]" = OrderedDict()
+
+    def get(self, key: str, source: Any, render: Callable[[], bytes]) -> RenderedResponse:
+        entry = self._entries.get(key)
+        if entry is not None and entry.source is source:
+            self._entries.move_to_end(key)
+            return entry
+
+        entry = RenderedResponse(source, render(), self.compress_min_bytes)
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return entry
+
+    def clear(self):
+        self._entries.clear()
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against an ETag (RFC 7232)"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+def cached_json_response(request: Request, rendered: RenderedResponse, cache_control: str) -> Response:
+    """
+    Serve a rendered body, compressed if the client accepts it, or a bodyless
+    304 if the client already has it
+    """
+    encoding = choose_encoding(request.headers.get("accept-encoding"))
+    body = rendered.encoded(encoding)
+    etag = rendered.etag if body is None else rendered.etag_for(encoding)
+    headers = {"ETag": etag, "Cache-Control": cache_control, "Vary": "Accept-Encoding"}
+    if_none_match = request.headers.get("if-none-match")
+    if etag_matches(if_none_match, etag) or etag_matches(if_none_match, rendered.etag):
+        return Response(status_code=304, headers=headers)
+    if body is None:
+        return Response(content=rendered.body, media_type="application/json", headers=headers)
+    headers["Content-Encoding"] = encoding
+    return Response(content=body, media_type="application/json", headers=headers)
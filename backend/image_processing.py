@@ -0,0 +1,113 @@
+import os
+import asyncio
+import logging
+import importlib.util
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+OUTPUT_FORMATS = {
+    "jpeg": ("JPEG", ".jpg", "image/jpeg"),
+    "webp": ("WEBP", ".webp", "image/webp"),
+}
+
+def process_image_file(src_path: str, dest_path: str, max_dimension: int, output_format: str, quality: int) -> int:
+    """
+    Downscale and recompress one image (runs in a worker process).
+
+    The EXIF orientation is applied to the pixels and all metadata is
+    dropped. Returns the size of the written file. The copy is kept even
+    when it is not smaller than the original, since the original may carry
+    location and device metadata.
+    """
+    # Pillow is optional (only needed with IMAGE_PROCESSING_ENABLED=true) and
+    # slow to import, so only worker processes load it
+    from PIL import Image, ImageOps
+
+    pil_format = OUTPUT_FORMATS[output_format][0]
+    with Image.open(src_path) as image:
+        image = ImageOps.exif_transpose(image)
+        image.thumbnail((max_dimension, max_dimension))
+        if image.mode not in ("RGB", "L") and not (pil_format == "WEBP" and image.mode == "RGBA"):
+            image = image.convert("RGB")
+        image.save(dest_path, pil_format, quality=quality, optimize=True)
+
+    return os.path.getsize(dest_path)
+
+class ImageProcessor:
+    """
+    Optional resize/recompress stage for uploaded photos.
+
+    Work is done in a process pool so large decodes never block the event
+    loop. Any photo that cannot be processed is passed through unchanged.
+    """
+
+    def __init__(self):
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._configured = False
+
+    def _configure(self):
+        self.enabled = os.environ.get('IMAGE_PROCESSING_ENABLED', 'false').lower() == 'true'
+        self.max_dimension = int(os.environ.get('IMAGE_MAX_DIMENSION', '2048'))
+        self.output_format = os.environ.get('IMAGE_OUTPUT_FORMAT', 'jpeg').lower()
+        self.quality = int(os.environ.get('IMAGE_QUALITY', '82'))
+        self.workers = int(os.environ.get('IMAGE_PROCESS_WORKERS', '2'))
+        if self.output_format not in OUTPUT_FORMATS:
+            logger.warning("Unknown IMAGE_OUTPUT_FORMAT %r, using jpeg", self.output_format)
+            self.output_format = 'jpeg'
+        if self.enabled and importlib.util.find_spec("PIL") is None:
+            logger.warning("IMAGE_PROCESSING_ENABLED is set but Pillow is not installed; photos will be sent unchanged")
+            self.enabled = False
+        self._configured = True
+
+    async def optimize(self, attachment: dict) -> dict:
+        """Return a resized, metadata-free copy of a spooled photo attachment, or the original"""
+        if not self._configured:
+            self._configure()
+        if not self.enabled:
+            return attachment
+
+        _, suffix, content_type = OUTPUT_FORMATS[self.output_format]
+        src_path = Path(attachment["path"])
+        dest_path = src_path.with_name(f"{src_path.stem}.processed{suffix}")
+
+        if self._executor is None:
+            # Spawned, not forked: the server process already runs threads
+            # (log listener, SMTP keepalive, Motor) that a fork could deadlock on
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        loop = asyncio.get_running_loop()
+        try:
+            size = await loop.run_in_executor(
+                self._executor, process_image_file,
+                str(src_path), str(dest_path), self.max_dimension, self.output_format, self.quality
+            )
+        except Exception as e:
+            logger.warning("Could not process photo %s, sending original: %s", attachment['filename'], e)
+            try:
+                os.remove(dest_path)
+            except OSError:
+                pass
+            return attachment
+
+        os.remove(src_path)
+        return {
+            "filename": f"{Path(attachment['filename']).stem}{suffix}",
+            "content_type": content_type,
+            "path": str(dest_path),
+            "size": size,
+            "original_size": attachment.get("size")
+        }
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+# Global image processor instance
+image_processor = ImageProcessor()
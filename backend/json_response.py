@@ -0,0 +1,51 @@
+from typing import Any, Mapping, Optional
+import orjson
+from bson import ObjectId
+from pydantic import BaseModel
+from fastapi.responses import JSONResponse
+
+# Mongo documents and export rows may carry non-string keys (e.g. ints)
+JSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+def _default(obj: Any) -> Any:
+    """Types orjson does not encode itself; datetime, date and UUID it does"""
+    if isinstance(obj, ObjectId):
+        return str(obj)
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(by_alias=True)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def dumps(content: Any) -> bytes:
+    """Encode to compact JSON bytes, accepting models, ObjectIds and datetimes"""
+    return orjson.dumps(content, default=_default, option=JSON_OPTIONS)
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSONResponse rendered with orjson.
+
+    Installed as the app's default_response_class, so routes returning plain
+    data or a response_model get it after FastAPI's usual validation and
+    jsonable_encoder pass. A model handed over directly (see model_response)
+    is encoded by pydantic's compiled serializer, which beats a model_dump()
+    followed by orjson.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, BaseModel):
+            return content.model_dump_json(by_alias=True).encode()
+        return dumps(content)
+
+def model_response(
+    model: BaseModel,
+    status_code: int = 200,
+    headers: Optional[Mapping[str, str]] = None
+) -> FastJSONResponse:
+    """
+    Serve a model the handler built itself, skipping the response_model pass.
+
+    Returning a Response from a route makes FastAPI send it untouched, so the
+    model is neither validated a second time nor run through
+    jsonable_encoder. Only use it for models built from validated data; the
+    route's response_model still documents the shape.
+    """
+    return FastJSONResponse(model, status_code=status_code, headers=headers)
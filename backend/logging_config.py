@@ -0,0 +1,108 @@
+import os
+import sys
+import json
+import queue
+import atexit
+import logging
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, Optional
+
+TEXT_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+# Attributes every LogRecord has; anything else came in through extra={...}
+_RECORD_ATTRIBUTES = set(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime"}
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line, including any extra={...} fields"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage()
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRIBUTES:
+                entry[key] = value
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+class DeferredQueueHandler(QueueHandler):
+    """
+    Queue handler that leaves all formatting to the listener thread.
+
+    The stock QueueHandler.prepare() formats the message in the logging
+    thread so records can be pickled to another process; our queue never
+    leaves the process, so the record is enqueued as-is.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+def parse_levels(spec: str) -> Dict[str, str]:
+    """'email_service=WARNING,database=DEBUG' -> {logger name: level name}"""
+    levels = {}
+    for part in spec.split(","):
+        name, _, level = part.partition("=")
+        if name.strip() and level.strip():
+            levels[name.strip()] = level.strip().upper()
+    return levels
+
+# Loggers that uvicorn gives their own stream handlers (with propagate off)
+# before the app is imported
+SERVER_LOGGERS = ("uvicorn", "uvicorn.error", "uvicorn.access")
+
+_listener: Optional[QueueListener] = None
+
+def configure_logging():
+    """
+    Route all logging through an in-process queue drained by one background
+    thread, so request handlers never block on stream I/O.
+
+    LOG_LEVEL        root level (default INFO)
+    LOG_LEVELS       per-logger overrides, e.g. "email_service=WARNING,uvicorn.access=ERROR"
+    LOG_FORMAT       text (default) or json
+    LOG_QUEUE        false writes synchronously from the calling thread instead
+    """
+    global _listener
+    if _listener is not None:
+        return
+
+    output = logging.StreamHandler(sys.stderr)
+    if os.environ.get('LOG_FORMAT', 'text').lower() == 'json':
+        output.setFormatter(JsonFormatter())
+    else:
+        output.setFormatter(logging.Formatter(TEXT_FORMAT))
+
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.setLevel(os.environ.get('LOG_LEVEL', 'INFO').upper())
+    # Hand uvicorn's records to the root handler too, so they are queued and
+    # formatted like everything else instead of written inline
+    for name in SERVER_LOGGERS:
+        server_logger = logging.getLogger(name)
+        for handler in list(server_logger.handlers):
+            server_logger.removeHandler(handler)
+        server_logger.propagate = True
+    for name, level in parse_levels(os.environ.get('LOG_LEVELS', '')).items():
+        logging.getLogger(name).setLevel(level)
+
+    if os.environ.get('LOG_QUEUE', 'true').lower() == 'false':
+        root.addHandler(output)
+        return
+
+    log_queue = queue.SimpleQueue()
+    root.addHandler(DeferredQueueHandler(log_queue))
+    _listener = QueueListener(log_queue, output, respect_handler_level=True)
+    _listener.start()
+    atexit.register(stop_logging)
+
+def stop_logging():
+    """Flush queued records and stop the listener thread"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
@@ -1,15 +1,45 @@
-from pydantic import BaseModel, Field, EmailStr, validator
-from typing import List, Optional
+from pydantic import AliasChoices, BaseModel, Field, EmailStr, validator
+from typing import Dict, List, Optional
 from datetime import datetime
+from bson import ObjectId
 import uuid
 
+# Mongo document mapping
+class DocumentModel(BaseModel):
+    """
+    Model that can be built straight from a Mongo document: "_id" feeds the
+    id field (ObjectIds become strings) and unknown keys are ignored.
+    """
+
+    @classmethod
+    def from_document(cls, doc: dict):
+        return cls.model_validate(doc)
+
+    @classmethod
+    def projection(cls) -> dict:
+        """Mongo projection fetching only the fields this model uses"""
+        projection = {("_id" if name == "id" else name): 1 for name in cls.model_fields}
+        if "id" not in cls.model_fields:
+            projection["_id"] = 0
+        return projection
+
+    @validator('id', pre=True, check_fields=False, allow_reuse=True)
+    def stringify_object_id(cls, v):
+        return str(v) if isinstance(v, ObjectId) else v
+
+def document_id_field():
+    return Field(
+        default_factory=lambda: str(uuid.uuid4()),
+        validation_alias=AliasChoices("_id", "id")
+    )
+
 # Service Models
 class ServicePricing(BaseModel):
     starting: int
     unit: str
 
-class Service(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+class Service(DocumentModel):
+    id: str = document_id_field()
     name: str
     description: str
     icon: str
@@ -31,8 +61,8 @@ class ServiceCreate(BaseModel):
     availability: str
 
 # Testimonial Models
-class Testimonial(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+class Testimonial(DocumentModel):
+    id: str = document_id_field()
     name: str
     service: str
     rating: int = Field(ge=1, le=5)
@@ -43,6 +73,52 @@ class Testimonial(BaseModel):
     approved: bool = True
     created_at: datetime = Field(default_factory=datetime.utcnow)
 
+class TestimonialPreview(BaseModel):
+    id: str
+    name: str
+    rating: int
+    text: str
+    location: Optional[str] = None
+    date: datetime
+
+class ServiceTestimonialStats(BaseModel):
+    service: str
+    count: int
+    average_rating: float
+    recent: List[TestimonialPreview] = []
+
+class TestimonialStats(BaseModel):
+    count: int
+    average_rating: Optional[float] = None
+    ratings: Dict[int, int]
+    services: List[ServiceTestimonialStats]
+    updated_at: Optional[datetime] = None
+
+    @classmethod
+    def from_document(cls, doc: Optional[dict]):
+        """Build from the testimonial_stats document, deriving the averages"""
+        doc = doc or {}
+        ratings = {rating: 0 for rating in range(1, 6)}
+        ratings.update({int(rating): count for rating, count in doc.get("ratings", {}).items()})
+        services = [
+            ServiceTestimonialStats(
+                service=entry["service"],
+                count=entry["count"],
+                average_rating=round(entry["rating_total"] / entry["count"], 2),
+                recent=entry.get("recent", [])
+            )
+            for entry in doc.get("services", {}).values() if entry.get("count")
+        ]
+        services.sort(key=lambda entry: (-entry.count, entry.service))
+        count = doc.get("count", 0)
+        return cls(
+            count=count,
+            average_rating=round(doc["rating_total"] / count, 2) if count else None,
+            ratings=ratings,
+            services=services,
+            updated_at=doc.get("updated_at")
+        )
+
 class TestimonialCreate(BaseModel):
     name: str
     service: str
@@ -56,8 +132,8 @@ class TestimonialCreate(BaseModel):
         return v or datetime.utcnow()
 
 # Quote Request Models  
-class QuoteRequest(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+class QuoteRequest(DocumentModel):
+    id: str = document_id_field()
     name: str
     email: EmailStr
     phone: Optional[str] = None
@@ -69,6 +145,19 @@ class QuoteRequest(BaseModel):
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
 
+class BulkQuoteItemResult(BaseModel):
+    index: int
+    success: bool
+    id: Optional[str] = None
+    estimated_price: Optional[int] = None
+    errors: Optional[List[str]] = None
+
+class BulkQuoteResult(BaseModel):
+    submitted: int
+    created: int
+    failed: int
+    results: List[BulkQuoteItemResult]
+
 class QuoteRequestCreate(BaseModel):
     name: str
     email: EmailStr
@@ -86,14 +175,22 @@ class QuoteRequestCreate(BaseModel):
         return v
 
 # Contact Submission Models
-class ContactSubmission(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+class PhotoReference(BaseModel):
+    digest: str
+    filename: str
+    content_type: Optional[str] = None
+    size: int
+
+class ContactSubmission(DocumentModel):
+    id: str = document_id_field()
     name: str
     email: EmailStr
     phone: Optional[str] = None
     service: Optional[str] = None
     message: str
     status: str = "new"
+    email_status: str = "queued"
+    photos: List[PhotoReference] = []
     created_at: datetime = Field(default_factory=datetime.utcnow)
 
 class ContactSubmissionCreate(BaseModel):
@@ -129,7 +226,7 @@ class CompanyStats(BaseModel):
     satisfaction: str
     support: str
 
-class CompanyInfo(BaseModel):
+class CompanyInfo(DocumentModel):
     name: str
     tagline: str
     phone: str
@@ -156,8 +253,17 @@ class ServicesResponse(APIResponse):
 class TestimonialsResponse(APIResponse):
     data: Optional[List[Testimonial]] = None
 
+class TestimonialStatsResponse(APIResponse):
+    data: Optional[TestimonialStats] = None
+
+class TestimonialResponse(APIResponse):
+    data: Optional[Testimonial] = None
+
 class QuoteRequestResponse(APIResponse):
     data: Optional[QuoteRequest] = None
 
+class BulkQuoteResponse(APIResponse):
+    data: Optional[BulkQuoteResult] = None
+
 class CompanyInfoResponse(APIResponse):
     data: Optional[CompanyInfo] = None
\ No newline at end of file
@@ -0,0 +1,157 @@
+import time
+import threading
+from collections import defaultdict, deque
+from typing import Dict, Optional
+from pymongo import monitoring
+from metrics import MONGO_COMMAND_SECONDS, MONGO_POOL_CHECKOUT_SECONDS, MONGO_POOL_CONNECTIONS
+
+def _server_key(address) -> str:
+    return f"{address[0]}:{address[1]}"
+
+class CommandMetrics(monitoring.CommandListener):
+    """Feed driver-reported command durations into the metrics registry"""
+
+    def started(self, event):
+        pass
+
+    def succeeded(self, event):
+        MONGO_COMMAND_SECONDS.observe((event.command_name, "ok"), event.duration_micros / 1e6)
+
+    def failed(self, event):
+        MONGO_COMMAND_SECONDS.observe((event.command_name, "error"), event.duration_micros / 1e6)
+
+class PoolMetrics(monitoring.ConnectionPoolListener):
+    """
+    CMAP listener tracking each server's connection pool.
+
+    Records pool size, connections in use, checkout counts and failures,
+    and a rolling window of checkout wait times. pymongo emits the events on
+    the thread doing the checkout (Motor's executor threads), so the start of
+    a checkout is remembered per thread and matched when it completes.
+    """
+
+    def __init__(self, window: int = 1000):
+        self.window = window
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._servers: Dict[str, dict] = {}
+
+    def _server(self, address) -> dict:
+        key = _server_key(address)
+        server = self._servers.get(key)
+        if server is None:
+            server = self._servers[key] = {
+                "size": 0,
+                "in_use": 0,
+                "checkouts": 0,
+                "checkout_failures": defaultdict(int),
+                "cleared": 0,
+                "wait_ms": deque(maxlen=self.window)
+            }
+        return server
+
+    def _wait_ms(self) -> Optional[float]:
+        started = getattr(self._local, "checkout_started", None)
+        self._local.checkout_started = None
+        return (time.perf_counter() - started) * 1000 if started is not None else None
+
+    # Pool lifecycle
+    def pool_created(self, event):
+        with self._lock:
+            self._server(event.address)
+
+    def pool_ready(self, event):
+        pass
+
+    def pool_cleared(self, event):
+        with self._lock:
+            self._server(event.address)["cleared"] += 1
+
+    def pool_closed(self, event):
+        with self._lock:
+            self._servers.pop(_server_key(event.address), None)
+
+    # Connection lifecycle
+    def connection_created(self, event):
+        with self._lock:
+            self._server(event.address)["size"] += 1
+
+    def connection_ready(self, event):
+        pass
+
+    def connection_closed(self, event):
+        with self._lock:
+            server = self._server(event.address)
+            server["size"] = max(0, server["size"] - 1)
+
+    # Checkouts
+    def connection_check_out_started(self, event):
+        self._local.checkout_started = time.perf_counter()
+
+    def connection_checked_out(self, event):
+        wait_ms = self._wait_ms()
+        if wait_ms is not None:
+            MONGO_POOL_CHECKOUT_SECONDS.observe((_server_key(event.address), "ok"), wait_ms / 1000)
+        with self._lock:
+            server = self._server(event.address)
+            server["in_use"] += 1
+            server["checkouts"] += 1
+            if wait_ms is not None:
+                server["wait_ms"].append(wait_ms)
+
+    def connection_check_out_failed(self, event):
+        wait_ms = self._wait_ms()
+        if wait_ms is not None:
+            MONGO_POOL_CHECKOUT_SECONDS.observe((_server_key(event.address), event.reason), wait_ms / 1000)
+        with self._lock:
+            server = self._server(event.address)
+            server["checkout_failures"][event.reason] += 1
+            if wait_ms is not None:
+                server["wait_ms"].append(wait_ms)
+
+    def connection_checked_in(self, event):
+        with self._lock:
+            server = self._server(event.address)
+            server["in_use"] = max(0, server["in_use"] - 1)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            servers = {
+                key: {
+                    "size": server["size"],
+                    "in_use": server["in_use"],
+                    "available": max(0, server["size"] - server["in_use"]),
+                    "checkouts": server["checkouts"],
+                    "checkout_failures": dict(server["checkout_failures"]),
+                    "cleared": server["cleared"],
+                    "wait": _wait_summary(server["wait_ms"])
+                }
+                for key, server in self._servers.items()
+            }
+        return servers
+
+    def collect(self):
+        """Refresh the pool connection gauges (registered as a metrics collector)"""
+        with self._lock:
+            values = {}
+            for key, server in self._servers.items():
+                values[(key, "in_use")] = server["in_use"]
+                values[(key, "available")] = max(0, server["size"] - server["in_use"])
+        MONGO_POOL_CONNECTIONS.replace(values)
+
+def _wait_summary(samples) -> dict:
+    ordered = sorted(samples)
+
+    def percentile(p: float) -> Optional[float]:
+        if not ordered:
+            return None
+        return round(ordered[min(len(ordered) - 1, int(p * len(ordered)))], 3)
+
+    return {
+        "samples": len(ordered),
+        "avg_ms": round(sum(ordered) / len(ordered), 3) if ordered else None,
+        "p50_ms": percentile(0.50),
+        "p95_ms": percentile(0.95),
+        "p99_ms": percentile(0.99),
+        "max_ms": round(ordered[-1], 3) if ordered else None
+    }
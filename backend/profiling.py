@@ -0,0 +1,172 @@
+import io
+import os
+import re
+import hmac
+import json
+import time
+import uuid
+import random
+import pstats
+import asyncio
+import cProfile
+import logging
+import threading
+from pathlib import Path
+from typing import List, Optional
+
+logger = logging.getLogger(__name__)
+
+ROOT_DIR = Path(__file__).parent
+
+# Profile ids start with a microsecond UTC timestamp, so they sort by age
+PROFILE_ID_RE = re.compile(r"^[0-9]{20}-[0-9a-f]{8}$")
+
+def new_profile_id() -> str:
+    now = time.time()
+    stamp = time.strftime('%Y%m%d%H%M%S', time.gmtime(now)) + f"{int(now % 1 * 1_000_000):06d}"
+    return f"{stamp}-{uuid.uuid4().hex[:8]}"
+
+class ProfileStore:
+    """
+    Bounded ring buffer of request profiles on disk.
+
+    Each profile is a pstats dump (<id>.prof, loadable with pstats or
+    snakeviz) plus a small JSON sidecar describing the request. Once
+    max_profiles are stored, the oldest are deleted.
+    """
+
+    def __init__(self):
+        self.root: Optional[Path] = None
+        self.max_profiles = 50
+        self._lock = threading.Lock()
+
+    def configure(self, root: Optional[str] = None, max_profiles: int = 50):
+        self.root = Path(root or os.environ.get('PROFILING_DIR', str(ROOT_DIR / 'profiles')))
+        self.max_profiles = max_profiles
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    def _ids(self) -> List[str]:
+        return sorted(path.stem for path in self.root.glob("*.json") if PROFILE_ID_RE.match(path.stem))
+
+    def save(self, profiler: cProfile.Profile, meta: dict) -> str:
+        """Write a profile and its metadata, then trim the buffer (blocking)"""
+        profile_id = meta["id"]
+        profiler.dump_stats(str(self.root / f"{profile_id}.prof"))
+        (self.root / f"{profile_id}.json").write_text(json.dumps(meta))
+        with self._lock:
+            ids = self._ids()
+            for old_id in ids[:max(0, len(ids) - self.max_profiles)]:
+                for suffix in (".prof", ".json"):
+                    try:
+                        os.remove(self.root / f"{old_id}{suffix}")
+                    except OSError:
+                        pass
+        return profile_id
+
+    def list(self) -> List[dict]:
+        profiles = []
+        for profile_id in reversed(self._ids()):
+            try:
+                profiles.append(json.loads((self.root / f"{profile_id}.json").read_text()))
+            except (OSError, ValueError):
+                continue
+        return profiles
+
+    def path_for(self, profile_id: str) -> Optional[Path]:
+        if not PROFILE_ID_RE.match(profile_id):
+            return None
+        path = self.root / f"{profile_id}.prof"
+        return path if path.exists() else None
+
+    def render_text(self, profile_id: str, sort: str = "cumulative", limit: int = 50) -> Optional[str]:
+        """pstats report for a stored profile"""
+        path = self.path_for(profile_id)
+        if path is None:
+            return None
+        out = io.StringIO()
+        stats = pstats.Stats(str(path), stream=out)
+        stats.strip_dirs().sort_stats(sort).print_stats(limit)
+        return out.getvalue()
+
+class ProfilingMiddleware:
+    """
+    Opt-in cProfile capture for selected requests.
+
+    A request is profiled when it carries the profiling header with the
+    configured token as its value, or is picked by the sample rate. Without
+    a token the header trigger is off, so clients cannot start captures. Only one request is profiled at a time, because cProfile
+    hooks the whole thread: the profile covers everything the event loop
+    ran while the request was in flight, including other requests' work,
+    but not work handed to worker threads or processes. Profiled responses
+    carry an X-Profile-Id header naming the stored profile.
+
+    The middleware is only installed when profiling is enabled; otherwise
+    the cost is one header scan and, with sampling, one random() call.
+    """
+
+    def __init__(self, app, store: ProfileStore, header: str = "x-profile", token: str = "", sample_rate: float = 0.0):
+        self.app = app
+        self.store = store
+        self.header = header.lower().encode()
+        self.token = token.encode()
+        self.sample_rate = sample_rate
+        self._active = False
+
+    def _selected(self, scope) -> Optional[str]:
+        for name, value in scope["headers"]:
+            if name == self.header:
+                if self.token and hmac.compare_digest(value, self.token):
+                    return "header"
+                break
+        if self.sample_rate > 0 and random.random() < self.sample_rate:
+            return "sample"
+        return None
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or self._active:
+            await self.app(scope, receive, send)
+            return
+        trigger = self._selected(scope)
+        if trigger is None:
+            await self.app(scope, receive, send)
+            return
+
+        self._active = True
+        profile_id = new_profile_id()
+        status_code = 500
+
+        async def profiled_send(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                message = dict(message, headers=list(message.get("headers", [])) + [
+                    (b"x-profile-id", profile_id.encode())
+                ])
+            await send(message)
+
+        profiler = cProfile.Profile()
+        started = time.perf_counter()
+        profiler.enable()
+        try:
+            await self.app(scope, receive, profiled_send)
+        finally:
+            profiler.disable()
+            self._active = False
+            route = scope.get("route")
+            meta = {
+                "id": profile_id,
+                "method": scope["method"],
+                "path": scope["path"],
+                "route": getattr(route, "path", None),
+                "status": status_code,
+                "duration_ms": round((time.perf_counter() - started) * 1000, 2),
+                "trigger": trigger,
+                "created_at": time.time()
+            }
+            try:
+                await asyncio.to_thread(self.store.save, profiler, meta)
+            except Exception as e:
+                logger.warning("Could not store profile %s: %s", profile_id, e)
+
+# Global profile store instance
+profile_store = ProfileStore()
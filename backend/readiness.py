@@ -0,0 +1,47 @@
+import time
+from typing import Dict, Optional
+
+# Subsystem states
+STARTING = "starting"
+READY = "ready"
+FAILED = "failed"
+
+class Readiness:
+    """
+    Startup state of each subsystem, as reported by /api/ready.
+
+    The process is live as soon as it serves requests; it is ready once
+    every required subsystem has reported READY. Optional subsystems are
+    reported but never hold readiness back.
+    """
+
+    def __init__(self):
+        self._subsystems: Dict[str, dict] = {}
+
+    def register(self, name: str, required: bool = True):
+        self._subsystems[name] = {
+            "state": STARTING,
+            "required": required,
+            "detail": None,
+            "since": time.time()
+        }
+
+    def mark(self, name: str, state: str, detail: Optional[str] = None):
+        subsystem = self._subsystems[name]
+        if subsystem["state"] != state:
+            subsystem["since"] = time.time()
+        subsystem["state"] = state
+        subsystem["detail"] = detail
+
+    def is_ready(self) -> bool:
+        return all(
+            subsystem["state"] == READY
+            for subsystem in self._subsystems.values()
+            if subsystem["required"]
+        )
+
+    def snapshot(self) -> dict:
+        return {name: dict(subsystem) for name, subsystem in self._subsystems.items()}
+
+# Global readiness registry
+readiness = Readiness()
@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""
+Production entry point: serve server:app with one or more uvicorn worker
+processes.
+
+    cd backend && WEB_CONCURRENCY=4 python serve.py
+
+HOST             bind address (default 0.0.0.0)
+PORT             bind port (default 8000)
+WEB_CONCURRENCY  worker processes; "auto" uses one per CPU (default 1)
+
+Every worker is a full copy of the app with its own catalog cache, Mongo
+pool and email queue workers. Catalog caches stay coherent through
+cache_sync; the email outbox is claimed through Mongo, so jobs are never
+sent twice. Metrics and stored profiles are per worker.
+"""
+
+import os
+import uvicorn
+
+def worker_count(value: str) -> int:
+    if value.strip().lower() == "auto":
+        return os.cpu_count() or 1
+    return max(1, int(value))
+
+def main():
+    workers = worker_count(os.environ.get('WEB_CONCURRENCY', '1'))
+    uvicorn.run(
+        "server:app",
+        host=os.environ.get('HOST', '0.0.0.0'),
+        port=int(os.environ.get('PORT', '8000')),
+        # A single worker runs in-process; more are supervised by uvicorn
+        workers=workers if workers > 1 else None
+    )
+
+if __name__ == "__main__":
+    main()
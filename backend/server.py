@@ -1,55 +1,162 @@
-from fastapi import FastAPI, APIRouter, HTTPException, status, Form, UploadFile, File
+from fastapi import FastAPI, APIRouter, Body, Depends, HTTPException, Query, Request, status, Form, UploadFile, File
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import FileResponse, Response, StreamingResponse
 from dotenv import load_dotenv
 from pathlib import Path
 import os
+import asyncio
 import logging
+import threading
 from datetime import datetime
 import random
-from typing import List, Optional
+import mimetypes
+from typing import Any, List, Optional
+from pydantic import ValidationError
 
 # Import models and database
 from models import (
     Service, ServiceResponse, ServicesResponse,
-    Testimonial, TestimonialsResponse,
+    Testimonial, TestimonialsResponse, TestimonialCreate, TestimonialResponse,
+    TestimonialStats, TestimonialStatsResponse,
     QuoteRequest, QuoteRequestCreate, QuoteRequestResponse,
+    BulkQuoteItemResult, BulkQuoteResult, BulkQuoteResponse,
     ContactSubmission, ContactSubmissionCreate,
     CompanyInfo, CompanyInfoResponse,
     APIResponse
 )
-from database import database
-from email_service import email_service
+from database import database, CATALOG_DATASETS, InvalidCursor
+from cache_sync import cache_sync
+from catalog_snapshot import catalog_watcher
+from email_service import get_email_service, close_email_service
+from email_queue import email_queue
+from http_cache import ResponseCache, cached_json_response
+from compression import CompressionMiddleware
+from json_response import FastJSONResponse, model_response
+from uploads import RequestSizeLimitMiddleware
+from image_processing import image_processor
+from blob_store import photo_store
+from admin_auth import admin_token, require_admin
+from exports import EXPORTS, mongo_projection, ndjson_chunks, csv_chunks
+from readiness import readiness, READY, FAILED
+from logging_config import configure_logging
+from profiling import ProfilingMiddleware, profile_store
+from metrics import registry as metrics_registry, MetricsMiddleware, CONTENT_TYPE as METRICS_CONTENT_TYPE
 
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
 
+# Bodies smaller than this are not worth compressing
+COMPRESSION_MIN_BYTES = int(os.environ.get('COMPRESSION_MIN_BYTES', '1024'))
+
+# Rendered catalog payloads, re-rendered (and re-compressed) only when the cached data changes
+response_cache = ResponseCache(compress_min_bytes=COMPRESSION_MIN_BYTES)
+CATALOG_CACHE_CONTROL = os.environ.get('CATALOG_CACHE_CONTROL', 'public, max-age=60')
+
+# Upload limits for the contact form
+MAX_PHOTO_BYTES = int(os.environ.get('MAX_PHOTO_BYTES', str(10 * 1024 * 1024)))
+MAX_CONTACT_REQUEST_BYTES = int(os.environ.get('MAX_CONTACT_REQUEST_BYTES', str(60 * 1024 * 1024)))
+
+# Largest batch accepted by the bulk quote endpoint
+QUOTE_BULK_MAX_ITEMS = int(os.environ.get('QUOTE_BULK_MAX_ITEMS', '500'))
+
+# Retry delays while the database is unreachable at startup
+DB_PREPARE_RETRY_SECONDS = float(os.environ.get('DB_PREPARE_RETRY_SECONDS', '2'))
+DB_PREPARE_RETRY_MAX_SECONDS = float(os.environ.get('DB_PREPARE_RETRY_MAX_SECONDS', '60'))
+
+# Opt-in request profiling (see profiling.ProfilingMiddleware)
+PROFILING_ENABLED = os.environ.get('PROFILING_ENABLED', 'false').lower() == 'true'
+PROFILING_HEADER = os.environ.get('PROFILING_HEADER', 'X-Profile')
+# The header trigger needs a token; without PROFILING_TOKEN the admin token is used
+PROFILING_TOKEN = os.environ.get('PROFILING_TOKEN', '').strip() or admin_token()
+PROFILING_SAMPLE_RATE = float(os.environ.get('PROFILING_SAMPLE_RATE', '0'))
+PROFILING_MAX_PROFILES = int(os.environ.get('PROFILING_MAX_PROFILES', '50'))
+
 # Create the main app
-app = FastAPI(title="Aurex Exteriors API", version="1.0.0")
+# Responses render with orjson; handlers that build their own response model
+# return it through model_response to skip the second validation pass
+app = FastAPI(title="Aurex Exteriors API", version="1.0.0", default_response_class=FastJSONResponse)
 
 # Create a router with the /api prefix
 api_router = APIRouter(prefix="/api")
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+# Configure logging (queued, levels from LOG_LEVEL / LOG_LEVELS)
+configure_logging()
 logger = logging.getLogger(__name__)
 
+# Startup work that runs after the server is already accepting connections
+_background_tasks: List[asyncio.Task] = []
+
+async def _prepare_database():
+    delay = DB_PREPARE_RETRY_SECONDS
+    while True:
+        try:
+            await database.prepare()
+        except Exception as e:
+            logger.error("MongoDB not ready, retrying in %.0fs: %s", delay, e)
+            readiness.mark("database", FAILED, str(e))
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, DB_PREPARE_RETRY_MAX_SECONDS)
+            continue
+        readiness.mark("database", READY)
+        return
+
+async def _probe_email():
+    # The probe is a blocking TLS login; a daemon thread keeps a hung server
+    # from holding up shutdown the way a default-executor thread would
+    loop = asyncio.get_running_loop()
+    probed = loop.create_future()
+
+    def probe():
+        try:
+            result = (get_email_service().test_connection(), "SMTP connection test failed")
+        except ValueError as e:
+            result = (False, str(e))
+        try:
+            loop.call_soon_threadsafe(lambda: probed.done() or probed.set_result(result))
+        except RuntimeError:
+            pass  # Event loop already closed
+
+    threading.Thread(target=probe, name="smtp-probe", daemon=True).start()
+    ok, detail = await probed
+    if ok:
+        logger.info("Email service connection test successful")
+        readiness.mark("email", READY)
+    else:
+        logger.warning("Email service not available - email functionality may not work: %s", detail)
+        readiness.mark("email", FAILED, detail)
+
 @app.on_event("startup")
 async def startup_event():
+    # Email is optional for readiness: the queue keeps retrying delivery
+    readiness.register("database")
+    readiness.register("email", required=False)
+    
+    photo_store.configure()
+    if PROFILING_ENABLED:
+        profile_store.configure(max_profiles=PROFILING_MAX_PROFILES)
     await database.connect()
+    await email_queue.start(database, get_email_service)
+    await cache_sync.start(database)
+    await catalog_watcher.start(database)
     
-    # Test email connection
-    if email_service.test_connection():
-        logger.info("Email service connection test successful")
-    else:
-        logger.warning("Email service connection test failed - email functionality may not work")
+    _background_tasks.extend([
+        asyncio.create_task(_prepare_database()),
+        asyncio.create_task(_probe_email())
+    ])
     
     logger.info("Aurex Exteriors API started successfully")
 
 @app.on_event("shutdown")
 async def shutdown_event():
+    for task in _background_tasks:
+        task.cancel()
+    await asyncio.gather(*_background_tasks, return_exceptions=True)
+    _background_tasks.clear()
+    await catalog_watcher.stop()
+    await cache_sync.stop()
+    await email_queue.stop()
+    close_email_service()
+    image_processor.close()
     await database.close()
     logger.info("Aurex Exteriors API shut down")
 
@@ -58,46 +165,56 @@ async def shutdown_event():
 async def root():
     return {"message": "Aurex Exteriors API is running", "status": "healthy"}
 
+# Readiness endpoint: 503 until every required subsystem is up
+@api_router.get("/ready")
+async def ready():
+    is_ready = readiness.is_ready()
+    return FastJSONResponse(
+        status_code=status.HTTP_200_OK if is_ready else status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"ready": is_ready, "subsystems": readiness.snapshot()}
+    )
+
+# Fields each public model actually reads, so Mongo skips the rest
+SERVICE_PROJECTION = Service.projection()
+TESTIMONIAL_PROJECTION = Testimonial.projection()
+QUOTE_PROJECTION = QuoteRequest.projection()
+COMPANY_INFO_PROJECTION = CompanyInfo.projection()
+
 # Services endpoints
+def _render_services(services_data: List[dict]) -> bytes:
+    services = [Service.from_document(service_doc) for service_doc in services_data]
+    return ServicesResponse(
+        success=True,
+        message="Services retrieved successfully",
+        data=services
+    ).model_dump_json().encode()
+
+def _render_service(service_doc: dict) -> bytes:
+    return ServiceResponse(
+        success=True,
+        message="Service retrieved successfully",
+        data=Service.from_document(service_doc)
+    ).model_dump_json().encode()
+
 @api_router.get("/services", response_model=ServicesResponse)
-async def get_services():
+async def get_services(request: Request):
     try:
-        services_data = await database.get_services()
-        
-        services = []
-        for service_doc in services_data:
-            # Convert MongoDB document to Service model
-            service_dict = {
-                "id": str(service_doc.get("_id", service_doc.get("id", ""))),
-                "name": service_doc["name"],
-                "description": service_doc["description"],
-                "icon": service_doc["icon"],
-                "features": service_doc["features"],
-                "pricing": service_doc["pricing"],
-                "duration": service_doc["duration"],
-                "availability": service_doc["availability"],
-                "active": service_doc.get("active", True),
-                "created_at": service_doc.get("created_at", datetime.utcnow()),
-                "updated_at": service_doc.get("updated_at", datetime.utcnow())
-            }
-            services.append(Service(**service_dict))
-        
-        return ServicesResponse(
-            success=True,
-            message="Services retrieved successfully",
-            data=services
+        services_data = await database.get_services(SERVICE_PROJECTION)
+        rendered = response_cache.get(
+            "services", services_data, lambda: _render_services(services_data)
         )
+        return cached_json_response(request, rendered, CATALOG_CACHE_CONTROL)
     except Exception as e:
-        logger.error(f"Error getting services: {e}")
+        logger.error("Error getting services: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to retrieve services"
         )
 
 @api_router.get("/services/{service_id}", response_model=ServiceResponse)
-async def get_service(service_id: str):
+async def get_service(service_id: str, request: Request):
     try:
-        service_doc = await database.get_service_by_id(service_id)
+        service_doc = await database.get_service_by_id(service_id, SERVICE_PROJECTION)
         
         if not service_doc:
             raise HTTPException(
@@ -105,114 +222,217 @@ async def get_service(service_id: str):
                 detail="Service not found"
             )
         
-        service_dict = {
-            "id": str(service_doc.get("_id", service_doc.get("id", ""))),
-            "name": service_doc["name"],
-            "description": service_doc["description"],
-            "icon": service_doc["icon"],
-            "features": service_doc["features"],
-            "pricing": service_doc["pricing"],
-            "duration": service_doc["duration"],
-            "availability": service_doc["availability"],
-            "active": service_doc.get("active", True),
-            "created_at": service_doc.get("created_at", datetime.utcnow()),
-            "updated_at": service_doc.get("updated_at", datetime.utcnow())
-        }
-        
-        service = Service(**service_dict)
-        
-        return ServiceResponse(
-            success=True,
-            message="Service retrieved successfully",
-            data=service
+        rendered = response_cache.get(
+            f"service:{service_id}", service_doc, lambda: _render_service(service_doc)
         )
+        return cached_json_response(request, rendered, CATALOG_CACHE_CONTROL)
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error getting service {service_id}: {e}")
+        logger.error("Error getting service %s: %s", service_id, e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to retrieve service"
         )
 
 # Testimonials endpoints
+def _render_testimonials(testimonials_data: List[dict]) -> bytes:
+    testimonials = [Testimonial.from_document(testimonial_doc) for testimonial_doc in testimonials_data]
+    return TestimonialsResponse(
+        success=True,
+        message="Testimonials retrieved successfully",
+        data=testimonials
+    ).model_dump_json().encode()
+
 @api_router.get("/testimonials", response_model=TestimonialsResponse)
-async def get_testimonials():
+async def get_testimonials(request: Request):
     try:
-        testimonials_data = await database.get_testimonials()
-        
-        testimonials = []
-        for testimonial_doc in testimonials_data:
-            testimonial_dict = {
-                "id": str(testimonial_doc.get("_id", testimonial_doc.get("id", ""))),
-                "name": testimonial_doc["name"],
-                "service": testimonial_doc["service"],
-                "rating": testimonial_doc["rating"],
-                "text": testimonial_doc["text"],
-                "location": testimonial_doc["location"],
-                "date": testimonial_doc["date"],
-                "verified": testimonial_doc.get("verified", True),
-                "approved": testimonial_doc.get("approved", True),
-                "created_at": testimonial_doc.get("created_at", datetime.utcnow())
-            }
-            testimonials.append(Testimonial(**testimonial_dict))
-        
-        return TestimonialsResponse(
-            success=True,
-            message="Testimonials retrieved successfully",
-            data=testimonials
+        testimonials_data = await database.get_testimonials(TESTIMONIAL_PROJECTION)
+        rendered = response_cache.get(
+            "testimonials", testimonials_data, lambda: _render_testimonials(testimonials_data)
         )
+        return cached_json_response(request, rendered, CATALOG_CACHE_CONTROL)
     except Exception as e:
-        logger.error(f"Error getting testimonials: {e}")
+        logger.error("Error getting testimonials: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to retrieve testimonials"
         )
 
+def _render_testimonial_stats(stats_doc: dict) -> bytes:
+    return TestimonialStatsResponse(
+        success=True,
+        message="Testimonial summary retrieved successfully",
+        data=TestimonialStats.from_document(stats_doc)
+    ).model_dump_json().encode()
+
+@api_router.get("/testimonials/summary", response_model=TestimonialStatsResponse)
+async def get_testimonial_summary(request: Request):
+    """Average rating, rating histogram and per-service counts with the latest few testimonials"""
+    try:
+        stats_doc = await database.get_testimonial_stats()
+        if stats_doc is None:
+            return model_response(TestimonialStatsResponse(
+                success=True,
+                message="No testimonials yet",
+                data=TestimonialStats.from_document(None)
+            ))
+        rendered = response_cache.get(
+            "testimonial_stats", stats_doc, lambda: _render_testimonial_stats(stats_doc)
+        )
+        return cached_json_response(request, rendered, CATALOG_CACHE_CONTROL)
+    except Exception as e:
+        logger.error("Error getting testimonial summary: %s", e)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to retrieve testimonial summary"
+        )
+
 # Quote request endpoints
+def _new_quote_document(quote_request: QuoteRequestCreate) -> dict:
+    # Create quote request with additional fields
+    now = datetime.utcnow()
+    quote_data = quote_request.dict()
+    quote_data.update({
+        "status": "pending",
+        "estimated_price": random.randint(100, 500),  # Random estimate for demo
+        "created_at": now,
+        "updated_at": now
+    })
+    return quote_data
+
 @api_router.post("/quote-request", response_model=QuoteRequestResponse)
 async def create_quote_request(quote_request: QuoteRequestCreate):
     try:
-        # Create quote request with additional fields
-        quote_data = quote_request.dict()
-        quote_data.update({
-            "status": "pending",
-            "estimated_price": random.randint(100, 500),  # Random estimate for demo
-            "created_at": datetime.utcnow(),
-            "updated_at": datetime.utcnow()
-        })
+        quote_data = _new_quote_document(quote_request)
         
         # Save to database
         saved_quote = await database.create_quote_request(quote_data)
         
         # Convert to response model
-        quote_response = QuoteRequest(**{
-            "id": str(saved_quote.get("_id", saved_quote.get("id", ""))),
-            "name": saved_quote["name"],
-            "email": saved_quote["email"],
-            "phone": saved_quote.get("phone"),
-            "service": saved_quote["service"],
-            "message": saved_quote.get("message"),
-            "status": saved_quote["status"],
-            "estimated_price": saved_quote.get("estimated_price"),
-            "notes": saved_quote.get("notes"),
-            "created_at": saved_quote["created_at"],
-            "updated_at": saved_quote["updated_at"]
-        })
+        quote_response = QuoteRequest.from_document(saved_quote)
         
-        return QuoteRequestResponse(
+        return model_response(QuoteRequestResponse(
             success=True,
             message="Quote request submitted successfully! We'll contact you within 24 hours.",
             data=quote_response
-        )
+        ))
     except Exception as e:
-        logger.error(f"Error creating quote request: {e}")
+        logger.error("Error creating quote request: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to submit quote request"
         )
 
+@api_router.post("/quote-requests/bulk", response_model=BulkQuoteResponse, dependencies=[Depends(require_admin)])
+async def create_quote_requests_bulk(items: List[Any] = Body(...)):
+    """
+    Submit many quote requests in one round-trip (partners and the
+    call-centre tool, with the admin token). Items are validated one by
+    one, valid ones are written with a single unordered insert, and the
+    response reports the outcome of every item by its position.
+    """
+    if not items:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="At least one quote request is required"
+        )
+    if len(items) > QUOTE_BULK_MAX_ITEMS:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"At most {QUOTE_BULK_MAX_ITEMS} quote requests per batch"
+        )
+    
+    results: List[Optional[BulkQuoteItemResult]] = [None] * len(items)
+    documents = []
+    positions = []
+    for index, item in enumerate(items):
+        try:
+            quote_request = QuoteRequestCreate.model_validate(item)
+        except ValidationError as e:
+            results[index] = BulkQuoteItemResult(
+                index=index,
+                success=False,
+                errors=[
+                    f"{'.'.join(str(part) for part in error['loc']) or 'item'}: {error['msg']}"
+                    for error in e.errors()
+                ]
+            )
+            continue
+        documents.append(_new_quote_document(quote_request))
+        positions.append(index)
+    
+    write_errors = {}
+    if documents:
+        try:
+            write_errors = await database.create_quote_requests(documents)
+        except Exception as e:
+            logger.error("Error creating quote requests in bulk: %s", e)
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Failed to submit quote requests"
+            )
+    
+    for batch_index, (index, document) in enumerate(zip(positions, documents)):
+        if batch_index in write_errors:
+            results[index] = BulkQuoteItemResult(index=index, success=False, errors=[write_errors[batch_index]])
+        else:
+            results[index] = BulkQuoteItemResult(
+                index=index, success=True, id=document["_id"], estimated_price=document["estimated_price"]
+            )
+    
+    created = sum(1 for result in results if result.success)
+    logger.info("Bulk quote submission: %s created, %s failed", created, len(items) - created)
+    return model_response(BulkQuoteResponse(
+        success=created == len(items),
+        message=f"{created} of {len(items)} quote requests submitted",
+        data=BulkQuoteResult(
+            submitted=len(items),
+            created=created,
+            failed=len(items) - created,
+            results=results
+        )
+    ))
+
 # Contact form endpoint
+async def _store_photo(received: dict) -> dict:
+    """
+    Commit a received upload to the photo store and return its reference.
+    Bytes seen before are neither processed nor stored again.
+    """
+    upload_digest = received["upload_digest"]
+    digest = photo_store.resolve_alias(upload_digest)
+    if digest is None and photo_store.exists(upload_digest):
+        digest = upload_digest
+    
+    if digest is not None:
+        photo_store.discard(received["path"])
+        if digest == upload_digest:
+            content_type = received["content_type"]
+            filename = received["filename"]
+        else:
+            content_type = photo_store.content_type(digest)
+            filename = Path(received["filename"]).stem + (mimetypes.guess_extension(content_type) or "")
+        return {
+            "digest": digest,
+            "filename": filename,
+            "content_type": content_type,
+            "size": photo_store.size(digest)
+        }
+    
+    # Optionally downscale/recompress before it is stored
+    photo = await image_processor.optimize(received)
+    digest = await photo_store.commit(
+        photo["path"], upload_digest if photo is received else None
+    )
+    photo_store.add_alias(upload_digest, digest)
+    return {
+        "digest": digest,
+        "filename": photo["filename"],
+        "content_type": photo["content_type"],
+        "size": photo["size"]
+    }
+
 @api_router.post("/contact", response_model=APIResponse)
 async def create_contact_submission(
     name: str = Form(...),
@@ -223,28 +443,26 @@ async def create_contact_submission(
     photos: List[UploadFile] = File(default=[])
 ):
     try:
-        logger.info(f"Received contact form submission from {name} ({email})")
+        logger.debug("Received contact form submission from %s (%s)", name, email)
         
-        # Validate photo files if provided
-        valid_photos = []
+        # Validate photo files if provided, hashing them into the photo store as we go
+        stored_photos = []
         if photos and photos[0].filename:  # Check if actual files were uploaded
             for photo in photos:
-                # Check file size (limit to 10MB)
-                content = await photo.read()
-                if len(content) > 10 * 1024 * 1024:  # 10MB limit
-                    logger.warning(f"Photo {photo.filename} exceeds size limit")
-                    continue
-                
                 # Check file type
                 if not photo.content_type or not photo.content_type.startswith('image/'):
-                    logger.warning(f"Photo {photo.filename} is not an image")
+                    logger.warning("Photo %s is not an image", photo.filename)
                     continue
                 
-                # Reset file pointer
-                await photo.seek(0)
-                valid_photos.append(photo)
+                # Check file size while copying (limit to MAX_PHOTO_BYTES)
+                received = await photo_store.receive_upload(photo, MAX_PHOTO_BYTES)
+                if received is None:
+                    logger.warning("Photo %s exceeds size limit", photo.filename)
+                    continue
+                
+                stored_photos.append(await _store_photo(received))
         
-        # Create contact submission
+        # Create contact submission; delivery happens in the background
         contact_data = {
             "name": name,
             "email": email,
@@ -252,51 +470,82 @@ async def create_contact_submission(
             "service": service,
             "message": message,
             "status": "new",
+            "email_status": "queued",
+            "photos": stored_photos,
             "created_at": datetime.utcnow()
         }
         
         # Save to database
-        await database.create_contact_submission(contact_data)
-        logger.info("Contact submission saved to database")
+        saved_contact = await database.create_contact_submission(contact_data)
+        logger.debug("Contact submission saved to database")
         
-        # Send email notification
-        email_sent = await email_service.send_contact_email(
+        # Queue email notification
+        await email_queue.enqueue_contact_email(
+            submission_id=saved_contact["_id"],
             name=name,
             email=email,
             phone=phone,
             service=service,
             message=message,
-            photos=valid_photos
+            photos=stored_photos
         )
+        logger.debug("Email notification queued")
         
-        if email_sent:
-            logger.info("Email notification sent successfully")
-            return APIResponse(
+        if stored_photos:
+            return model_response(APIResponse(
                 success=True,
                 message="Thank you for contacting us! We've received your message and photos. We'll respond within 2 hours."
-            )
-        else:
-            logger.warning("Email notification failed, but form data was saved")
-            return APIResponse(
-                success=True,
-                message="Thank you for contacting us! We've received your message. We'll respond within 2 hours."
-            )
+            ))
+        return model_response(APIResponse(
+            success=True,
+            message="Thank you for contacting us! We've received your message. We'll respond within 2 hours."
+        ))
             
     except Exception as e:
-        logger.error(f"Error creating contact submission: {e}")
+        logger.error("Error creating contact submission: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to submit contact form"
         )
 
+# Stored photos, linked from notification emails
+@api_router.get("/photos/{digest}")
+async def get_photo(digest: str):
+    try:
+        path = photo_store.path_for(digest)
+    except ValueError:
+        path = None
+    
+    if path is None or not path.exists():
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Photo not found"
+        )
+    
+    return FileResponse(
+        path,
+        media_type=photo_store.content_type(digest),
+        headers={
+            "ETag": f'"{digest}"',
+            "Cache-Control": "public, max-age=31536000, immutable",
+            "X-Content-Type-Options": "nosniff"
+        }
+    )
+
 # Company info endpoint
+def _render_company_info(company_data: dict) -> bytes:
+    company_info = CompanyInfo.from_document(company_data)
+    
+    return CompanyInfoResponse(
+        success=True,
+        message="Company information retrieved successfully",
+        data=company_info
+    ).model_dump_json().encode()
+
 @api_router.get("/company-info", response_model=CompanyInfoResponse)
-async def get_company_info():
+async def get_company_info(request: Request):
     try:
-        company_data = await database.get_company_info()
-        
-        # Debug logging
-        logger.info(f"Retrieved company data from DB: address={company_data.get('address') if company_data else 'None'}")
+        company_data = await database.get_company_info(COMPANY_INFO_PROJECTION)
         
         if not company_data:
             raise HTTPException(
@@ -304,55 +553,242 @@ async def get_company_info():
                 detail="Company information not found"
             )
         
-        company_info = CompanyInfo(**{
-            "name": company_data["name"],
-            "tagline": company_data["tagline"],
-            "phone": company_data["phone"],
-            "email": company_data["email"],
-            "address": company_data["address"],
-            "service_radius": company_data["service_radius"],
-            "business_hours": company_data["business_hours"],
-            "features": company_data["features"],
-            "stats": company_data["stats"],
-            "social_media": company_data["social_media"]
-        })
-        
-        logger.info(f"Returning company info: address={company_info.address}")
-        
-        return CompanyInfoResponse(
-            success=True,
-            message="Company information retrieved successfully",
-            data=company_info
+        rendered = response_cache.get(
+            "company_info", company_data, lambda: _render_company_info(company_data)
         )
+        return cached_json_response(request, rendered, CATALOG_CACHE_CONTROL)
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error getting company info: {e}")
+        logger.error("Error getting company info: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to retrieve company information"
         )
 
 # Admin endpoints (for future use)
-@api_router.get("/admin/quote-requests")
-async def get_all_quote_requests():
+@api_router.get("/admin/quote-requests", dependencies=[Depends(require_admin)])
+async def get_all_quote_requests(
+    limit: int = Query(50, ge=1, le=200),
+    cursor: Optional[str] = None,
+    status_filter: Optional[str] = Query(None, alias="status"),
+    service: Optional[str] = None
+):
     try:
-        requests = await database.get_quote_requests()
-        return APIResponse(
+        requests, next_cursor = await database.get_quote_requests(
+            limit=limit, cursor=cursor, status=status_filter, service=service,
+            projection=QUOTE_PROJECTION
+        )
+        return model_response(APIResponse(
             success=True,
             message="Quote requests retrieved successfully",
-            data={"requests": requests}
+            data={
+                "requests": [QuoteRequest.from_document(quote_doc).model_dump() for quote_doc in requests],
+                "next_cursor": next_cursor
+            }
+        ))
+    except InvalidCursor as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
         )
     except Exception as e:
-        logger.error(f"Error getting quote requests: {e}")
+        logger.error("Error getting quote requests: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to retrieve quote requests"
         )
 
+@api_router.get("/admin/export/{dataset}", dependencies=[Depends(require_admin)])
+async def export_dataset(
+    dataset: str,
+    format: str = Query("ndjson", pattern="^(ndjson|csv)$"),
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    fields: Optional[str] = None
+):
+    """Stream quote requests or contact submissions as NDJSON or CSV"""
+    export = EXPORTS.get(dataset)
+    if not export:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Unknown export; choose one of: {', '.join(EXPORTS)}"
+        )
+    
+    selected = export["fields"]
+    if fields:
+        selected = [field.strip() for field in fields.split(",") if field.strip()]
+        unknown = [field for field in selected if field not in export["fields"]]
+        if unknown or not selected:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Unknown export fields: {', '.join(unknown) or '(none given)'}"
+            )
+    
+    docs = database.iter_documents(
+        export["collection"], start=start, end=end, projection=mongo_projection(selected)
+    )
+    if format == "csv":
+        body, media_type = csv_chunks(docs, selected), "text/csv"
+    else:
+        body, media_type = ndjson_chunks(docs, selected), "application/x-ndjson"
+    
+    filename = f"{dataset}-{datetime.utcnow():%Y%m%d%H%M%S}.{format}"
+    return StreamingResponse(
+        body,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
+
+@api_router.get("/admin/email-stats")
+async def get_email_stats():
+    try:
+        stats = get_email_service().send_stats()
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e)
+        )
+    return model_response(APIResponse(
+        success=True,
+        message="Email send statistics retrieved successfully",
+        data=stats
+    ))
+
+@api_router.get("/admin/db-pool-stats")
+async def get_db_pool_stats():
+    return model_response(APIResponse(
+        success=True,
+        message="Database connection pool statistics retrieved successfully",
+        data=database.pool_stats()
+    ))
+
+@api_router.post("/admin/testimonials", response_model=TestimonialResponse, dependencies=[Depends(require_admin)])
+async def create_testimonial(testimonial: TestimonialCreate):
+    try:
+        testimonial_data = testimonial.dict()
+        testimonial_data.update({
+            "verified": True,
+            "approved": True,
+            "created_at": datetime.utcnow()
+        })
+        saved_testimonial = await database.create_testimonial(testimonial_data)
+        return model_response(TestimonialResponse(
+            success=True,
+            message="Testimonial added successfully",
+            data=Testimonial.from_document(saved_testimonial)
+        ))
+    except Exception as e:
+        logger.error("Error creating testimonial: %s", e)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to add testimonial"
+        )
+
+@api_router.post("/admin/testimonials/stats/rebuild", dependencies=[Depends(require_admin)])
+async def rebuild_testimonial_stats():
+    """Recompute the testimonial summary after testimonials were edited by hand"""
+    try:
+        stats_doc = await database.rebuild_testimonial_stats()
+        await database.publish_invalidation("testimonials")
+    except Exception as e:
+        logger.error("Error rebuilding testimonial stats: %s", e)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to rebuild testimonial stats"
+        )
+    return model_response(TestimonialStatsResponse(
+        success=True,
+        message="Testimonial stats rebuilt successfully",
+        data=TestimonialStats.from_document(stats_doc)
+    ))
+
+# Catalog cache coherence across worker processes (see cache_sync)
+@api_router.get("/admin/cache", dependencies=[Depends(require_admin)])
+async def get_cache_sync_state():
+    return model_response(APIResponse(
+        success=True,
+        message="Catalog cache sync state retrieved successfully",
+        data={**cache_sync.snapshot(), "snapshot": catalog_watcher.snapshot()}
+    ))
+
+@api_router.post("/admin/cache/invalidate", dependencies=[Depends(require_admin)])
+async def invalidate_catalog_cache(dataset: Optional[str] = None):
+    """
+    Drop cached catalog data in every worker, e.g. after editing the
+    services, testimonials or company_info collections by hand
+    """
+    if dataset is not None and dataset not in CATALOG_DATASETS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown dataset; choose one of: {', '.join(CATALOG_DATASETS)}"
+        )
+    datasets = [dataset] if dataset else list(CATALOG_DATASETS)
+    try:
+        await database.publish_invalidation(*datasets)
+        versions = await database.get_cache_versions()
+    except Exception as e:
+        logger.error("Error invalidating catalog cache: %s", e)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to invalidate catalog cache"
+        )
+    return model_response(APIResponse(
+        success=True,
+        message=f"Invalidated {', '.join(datasets)} in every worker",
+        data={"versions": versions}
+    ))
+
+# Stored request profiles (PROFILING_ENABLED=true)
+def _require_profiling():
+    if not PROFILING_ENABLED:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Profiling is not enabled"
+        )
+
+@api_router.get("/admin/profiles", dependencies=[Depends(require_admin)])
+async def list_profiles():
+    _require_profiling()
+    profiles = await asyncio.to_thread(profile_store.list)
+    return model_response(APIResponse(
+        success=True,
+        message="Profiles retrieved successfully",
+        data={"profiles": profiles}
+    ))
+
+@api_router.get("/admin/profiles/{profile_id}", dependencies=[Depends(require_admin)])
+async def get_profile(
+    profile_id: str,
+    format: str = Query("pstats", pattern="^(pstats|text)$"),
+    sort: str = Query("cumulative", pattern="^(cumulative|tottime|calls|ncalls)$"),
+    limit: int = Query(50, ge=1, le=1000)
+):
+    _require_profiling()
+    if format == "text":
+        report = await asyncio.to_thread(profile_store.render_text, profile_id, sort, limit)
+        if report is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Profile not found")
+        return Response(content=report, media_type="text/plain; charset=utf-8")
+    
+    path = profile_store.path_for(profile_id)
+    if path is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Profile not found")
+    return FileResponse(path, media_type="application/octet-stream", filename=f"{profile_id}.prof")
+
+# Prometheus metrics, scraped outside the /api prefix
+metrics_registry.add_collector(lambda: database.pool_metrics.collect())
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    return Response(content=metrics_registry.render(), media_type=METRICS_CONTENT_TYPE)
+
 # Include the router in the main app
 app.include_router(api_router)
 
+# Reject oversized contact uploads before they are parsed
+app.add_middleware(RequestSizeLimitMiddleware, max_bytes=MAX_CONTACT_REQUEST_BYTES)
+
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -360,4 +796,20 @@ app.add_middleware(
     allow_origins=["*"],
     allow_methods=["*"],
     allow_headers=["*"],
-)
\ No newline at end of file
+)
+
+# gzip/brotli for everything else; precompressed catalog bodies pass through
+app.add_middleware(CompressionMiddleware, minimum_size=COMPRESSION_MIN_BYTES)
+
+# Profile selected requests; not installed at all unless enabled
+if PROFILING_ENABLED:
+    app.add_middleware(
+        ProfilingMiddleware,
+        store=profile_store,
+        header=PROFILING_HEADER,
+        token=PROFILING_TOKEN,
+        sample_rate=PROFILING_SAMPLE_RATE
+    )
+
+# Outermost, so rejected and failed requests are measured too
+app.add_middleware(MetricsMiddleware)
@@ -0,0 +1,235 @@
+import time
+import smtplib
+import logging
+import threading
+from contextlib import contextmanager
+from typing import BinaryIO, Callable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+class SMTPConnectionPool:
+    """
+    Thread-safe pool of authenticated SMTP sessions.
+
+    Sessions are reused across messages so a send costs one MAIL/RCPT/DATA
+    exchange instead of a fresh TCP, STARTTLS and AUTH handshake. Idle
+    sessions are kept warm with NOOP, closed once they have been idle for
+    max_idle seconds, and a send that hits a dropped session reconnects and
+    retries once.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        username: Optional[str],
+        password: Optional[str],
+        size: int = 2,
+        max_idle: float = 120.0,
+        keepalive_interval: float = 30.0,
+        use_starttls: bool = True,
+        timeout: float = 30.0
+    ):
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.size = size
+        self.max_idle = max_idle
+        self.keepalive_interval = keepalive_interval
+        self.use_starttls = use_starttls
+        self.timeout = timeout
+
+        self._slots = threading.BoundedSemaphore(size)
+        self._lock = threading.Lock()
+        # Idle sessions as (connection, last_used) pairs, most recently used last
+        self._idle: List[Tuple[smtplib.SMTP, float]] = []
+        self._closed = False
+        self._maintenance_thread: Optional[threading.Thread] = None
+        self._maintenance_stop = threading.Event()
+
+    def _connect(self) -> smtplib.SMTP:
+        server = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+        try:
+            if self.use_starttls:
+                server.starttls()
+            if self.username:
+                server.login(self.username, self.password)
+        except Exception:
+            self._quietly_close(server)
+            raise
+        return server
+
+    @staticmethod
+    def _quietly_close(server: smtplib.SMTP):
+        try:
+            server.quit()
+        except Exception:
+            try:
+                server.close()
+            except Exception:
+                pass
+
+    @staticmethod
+    def _is_alive(server: smtplib.SMTP) -> bool:
+        try:
+            return server.noop()[0] == 250
+        except Exception:
+            return False
+
+    def acquire(self) -> smtplib.SMTP:
+        """Check out a live session, reusing an idle one when possible"""
+        self._slots.acquire()
+        try:
+            while True:
+                with self._lock:
+                    if not self._idle:
+                        break
+                    server, last_used = self._idle.pop()
+                idle_for = time.monotonic() - last_used
+                if idle_for > self.max_idle:
+                    self._quietly_close(server)
+                    continue
+                if idle_for > self.keepalive_interval and not self._is_alive(server):
+                    self._quietly_close(server)
+                    continue
+                return server
+            return self._connect()
+        except Exception:
+            self._slots.release()
+            raise
+
+    def release(self, server: smtplib.SMTP, discard: bool = False):
+        """Return a session to the pool, or close it if it is no longer usable"""
+        try:
+            if discard or self._closed:
+                self._quietly_close(server)
+            else:
+                with self._lock:
+                    self._idle.append((server, time.monotonic()))
+                self._ensure_maintenance()
+        finally:
+            self._slots.release()
+
+    @contextmanager
+    def connection(self):
+        server = self.acquire()
+        try:
+            yield server
+        except Exception:
+            self.release(server, discard=True)
+            raise
+        else:
+            self.release(server)
+
+    def send_file(self, from_addr: str, to_addrs: List[str], fp: BinaryIO, chunk_size: int = 64 * 1024):
+        """
+        Send a pre-rendered message (CRLF line endings) straight from a file.
+
+        The DATA phase streams the file with dot-stuffing, so the message is
+        never held in memory as a whole.
+        """
+        def send(server: smtplib.SMTP):
+            fp.seek(0)
+            self._stream_data(server, from_addr, to_addrs, fp, chunk_size)
+        self._send_with_retry(send)
+
+    def _send_with_retry(self, send: Callable[[smtplib.SMTP], None]):
+        for attempt in range(2):
+            server = self.acquire()
+            try:
+                send(server)
+            except smtplib.SMTPServerDisconnected:
+                self.release(server, discard=True)
+                if attempt:
+                    raise
+                logger.info("SMTP session was disconnected, reconnecting")
+                continue
+            except Exception:
+                self.release(server, discard=True)
+                raise
+            self.release(server)
+            return
+
+    @staticmethod
+    def _stream_data(server: smtplib.SMTP, from_addr: str, to_addrs: List[str], fp: BinaryIO, chunk_size: int):
+        server.ehlo_or_helo_if_needed()
+        code, resp = server.mail(from_addr)
+        if code != 250:
+            server.rset()
+            raise smtplib.SMTPSenderRefused(code, resp, from_addr)
+
+        refused = {}
+        for addr in to_addrs:
+            code, resp = server.rcpt(addr)
+            if code not in (250, 251):
+                refused[addr] = (code, resp)
+        if len(refused) == len(to_addrs):
+            server.rset()
+            raise smtplib.SMTPRecipientsRefused(refused)
+
+        code, resp = server.docmd("data")
+        if code != 354:
+            server.rset()
+            raise smtplib.SMTPDataError(code, resp)
+
+        buffer = bytearray()
+        line = b"\r\n"
+        for line in fp:
+            if line.startswith(b"."):
+                buffer += b"."
+            buffer += line
+            if len(buffer) >= chunk_size:
+                server.send(bytes(buffer))
+                buffer.clear()
+        if not line.endswith(b"\r\n"):
+            buffer += b"\r\n"
+        buffer += b".\r\n"
+        server.send(bytes(buffer))
+
+        code, resp = server.getreply()
+        if code != 250:
+            raise smtplib.SMTPDataError(code, resp)
+
+    def maintain(self):
+        """NOOP idle sessions to keep them warm and evict ones idle past max_idle"""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        keep = []
+        now = time.monotonic()
+        for server, last_used in idle:
+            if now - last_used > self.max_idle or not self._is_alive(server):
+                self._quietly_close(server)
+            else:
+                keep.append((server, last_used))
+        with self._lock:
+            # Sessions released while we were checking are more recent; keep them last
+            self._idle = keep + self._idle
+
+    def _ensure_maintenance(self):
+        if self._maintenance_thread is not None or self.keepalive_interval <= 0:
+            return
+        with self._lock:
+            if self._maintenance_thread is not None:
+                return
+            self._maintenance_stop.clear()
+            self._maintenance_thread = threading.Thread(
+                target=self._maintenance_loop, name="smtp-pool-maintenance", daemon=True
+            )
+            self._maintenance_thread.start()
+
+    def _maintenance_loop(self):
+        while not self._maintenance_stop.wait(self.keepalive_interval):
+            try:
+                self.maintain()
+            except Exception as e:
+                logger.warning("SMTP pool maintenance failed: %s", e)
+
+    def close(self):
+        """Close every idle session and stop the keepalive thread"""
+        self._closed = True
+        self._maintenance_stop.set()
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for server, _ in idle:
+            self._quietly_close(server)
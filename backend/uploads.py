@@ -0,0 +1,119 @@
+import os
+import json
+from pathlib import Path
+from typing import Optional
+from fastapi import UploadFile
+
+# Bytes read per chunk when spooling uploads
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+def copy_upload_bounded(
+    upload: UploadFile,
+    path: Path,
+    max_bytes: int,
+    chunk_size: int = UPLOAD_CHUNK_SIZE,
+    hasher=None
+) -> Optional[int]:
+    """
+    Copy an upload to path one chunk at a time (blocking).
+
+    Stops as soon as more than max_bytes have been read and removes the
+    partial file, returning None. Otherwise returns the number of bytes
+    written. Only one chunk is held in memory at a time; if a hashlib
+    object is given it is fed the same chunks.
+    """
+    upload.file.seek(0)
+    size = 0
+    with open(path, 'wb') as f:
+        while True:
+            chunk = upload.file.read(chunk_size)
+            if not chunk:
+                break
+            size += len(chunk)
+            if size > max_bytes:
+                break
+            if hasher is not None:
+                hasher.update(chunk)
+            f.write(chunk)
+
+    if size > max_bytes:
+        os.remove(path)
+        return None
+    return size
+
+class RequestSizeLimitMiddleware:
+    """
+    Reject request bodies over a limit before they are parsed.
+
+    A declared Content-Length over the limit is answered with 413 straight
+    away. Bodies without one are counted as they stream in; once the limit is
+    passed the app sees a client disconnect, so the multipart parser stops
+    spooling, and the client gets a 413.
+    """
+
+    def __init__(self, app, max_bytes: int, path_prefixes=("/api/contact",)):
+        self.app = app
+        self.max_bytes = max_bytes
+        self.path_prefixes = tuple(path_prefixes)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not scope["path"].startswith(self.path_prefixes):
+            await self.app(scope, receive, send)
+            return
+
+        for name, value in scope["headers"]:
+            if name == b"content-length":
+                try:
+                    declared = int(value)
+                except ValueError:
+                    break
+                if declared > self.max_bytes:
+                    await self._reject(send)
+                    return
+                break
+
+        received = 0
+        exceeded = False
+        response_started = False
+
+        async def limited_receive():
+            nonlocal received, exceeded
+            if exceeded:
+                return {"type": "http.disconnect"}
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.max_bytes:
+                    exceeded = True
+                    return {"type": "http.disconnect"}
+            return message
+
+        async def tracking_send(message):
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                if exceeded:
+                    return
+                response_started = True
+            elif exceeded and not response_started:
+                return
+            await send(message)
+
+        try:
+            await self.app(scope, limited_receive, tracking_send)
+        except Exception:
+            if not exceeded:
+                raise
+        if exceeded and not response_started:
+            await self._reject(send)
+
+    async def _reject(self, send):
+        body = json.dumps({"detail": "Request body too large"}).encode()
+        await send({
+            "type": "http.response.start",
+            "status": 413,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode())
+            ]
+        })
+        await send({"type": "http.response.body", "body": body})
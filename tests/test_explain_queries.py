@@ -0,0 +1,67 @@
+"""
+Every query the API issues must be served by an index.
+
+Runs the explain checks from backend/benchmarks/explain_queries.py against a
+real MongoDB (MONGO_URL, default localhost), in a throwaway database that is
+dropped afterwards. Skipped when no server answers.
+
+    python -m pytest tests/test_explain_queries.py
+"""
+
+import asyncio
+import os
+import sys
+import uuid
+from pathlib import Path
+
+import pytest
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent / "backend"
+sys.path.insert(0, str(BACKEND_DIR))
+sys.path.insert(0, str(BACKEND_DIR / "benchmarks"))
+
+from dotenv import load_dotenv
+from pymongo import MongoClient
+from pymongo.errors import PyMongoError
+
+load_dotenv(BACKEND_DIR / '.env')
+
+MONGO_URL = os.environ.get('MONGO_URL', 'mongodb://localhost:27017')
+
+def mongod_available() -> bool:
+    client = MongoClient(MONGO_URL, serverSelectionTimeoutMS=1000)
+    try:
+        client.admin.command("ping")
+        return True
+    except PyMongoError:
+        return False
+    finally:
+        client.close()
+
+pytestmark = pytest.mark.skipif(not mongod_available(), reason=f"no MongoDB server at {MONGO_URL}")
+
+async def run_explain_checks(db_name: str):
+    from motor.motor_asyncio import AsyncIOMotorClient
+    from database import Database
+    from explain_queries import explain_plans
+
+    database = Database()
+    database.client = AsyncIOMotorClient(MONGO_URL)
+    database.db = database.client[db_name]
+    try:
+        await database.ensure_indexes()
+        return await explain_plans(database)
+    finally:
+        await database.client.drop_database(db_name)
+        database.client.close()
+
+def test_indexed_queries_avoid_collscan():
+    plans = asyncio.run(run_explain_checks(f"explain_test_{uuid.uuid4().hex[:8]}"))
+
+    assert plans
+    scans = [
+        f"{label} ({collection}): {' <- '.join(stages)}"
+        for label, collection, stages in plans
+        if "COLLSCAN" in stages
+    ]
+    assert not scans, "collection scans:\n" + "\n".join(scans)
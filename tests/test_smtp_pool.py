@@ -0,0 +1,175 @@
+"""
+SMTPConnectionPool against a local aiosmtpd server: streamed DATA with
+dot-stuffing, reconnecting after a dropped session, NOOP keepalive and
+max-idle eviction. Nothing leaves the machine.
+
+    python -m pytest tests/test_smtp_pool.py
+"""
+
+import io
+import socket
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent / "backend"
+sys.path.insert(0, str(BACKEND_DIR))
+
+pytest.importorskip("aiosmtpd")
+
+from aiosmtpd.controller import Controller
+
+from smtp_pool import SMTPConnectionPool
+
+class RecordingHandler:
+    def __init__(self):
+        self.sessions = []
+        self.noops = 0
+        self.quits = 0
+        self.messages = []
+
+    async def handle_EHLO(self, server, session, envelope, hostname, responses):
+        # A hook taking responses must record the greeting itself
+        session.host_name = hostname
+        self.sessions.append(session)
+        return responses
+
+    async def handle_NOOP(self, server, session, envelope, arg):
+        self.noops += 1
+        return "250 OK"
+
+    async def handle_QUIT(self, server, session, envelope):
+        self.quits += 1
+        return "221 Bye"
+
+    async def handle_DATA(self, server, session, envelope):
+        self.messages.append(envelope.original_content)
+        return "250 OK"
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+@pytest.fixture
+def smtp_server():
+    handler = RecordingHandler()
+    controller = Controller(handler, hostname="127.0.0.1", port=free_port())
+    controller.start()
+    yield controller, handler
+    controller.stop()
+
+def make_pool(controller, **options) -> SMTPConnectionPool:
+    options.setdefault("keepalive_interval", 0)
+    return SMTPConnectionPool(
+        controller.hostname, controller.port, None, None,
+        use_starttls=False, timeout=5, **options
+    )
+
+def message(*body_lines: str) -> bytes:
+    headers = ["From: site@example.com", "To: owner@example.com", "Subject: Test", ""]
+    return ("\r\n".join(headers + list(body_lines)) + "\r\n").encode()
+
+def send(pool: SMTPConnectionPool, data: bytes, chunk_size: int = 64 * 1024):
+    pool.send_file("site@example.com", ["owner@example.com"], io.BytesIO(data), chunk_size=chunk_size)
+
+def test_streamed_data_is_dot_stuffed(smtp_server):
+    controller, handler = smtp_server
+    pool = make_pool(controller)
+    # Lines starting with "." (including a lone "." that would end DATA early),
+    # spread over several small chunks
+    data = message("Hello", ".", ".hidden line", "..two dots", *[f"line {n} " + "x" * 60 for n in range(200)], "end")
+    try:
+        send(pool, data, chunk_size=1024)
+    finally:
+        pool.close()
+
+    assert handler.messages == [data]
+
+def test_message_without_trailing_newline(smtp_server):
+    controller, handler = smtp_server
+    pool = make_pool(controller)
+    data = message("last line").rstrip(b"\r\n")
+    try:
+        send(pool, data)
+    finally:
+        pool.close()
+
+    assert handler.messages == [data + b"\r\n"]
+
+def test_sessions_are_reused(smtp_server):
+    controller, handler = smtp_server
+    pool = make_pool(controller)
+    try:
+        for n in range(3):
+            send(pool, message(f"message {n}"))
+    finally:
+        pool.close()
+
+    assert len(handler.messages) == 3
+    assert len(handler.sessions) == 1
+
+def test_dropped_session_reconnects_and_retries(smtp_server):
+    controller, handler = smtp_server
+    pool = make_pool(controller, keepalive_interval=3600)
+    try:
+        send(pool, message("first"))
+        # Drop the pooled session's connection without the pool noticing
+        idle_server, _ = pool._idle[-1]
+        idle_server.sock.shutdown(socket.SHUT_RDWR)
+        send(pool, message("second"))
+    finally:
+        pool.close()
+
+    assert [body.endswith(b"second\r\n") for body in handler.messages] == [False, True]
+    assert len(handler.sessions) == 2
+
+def test_maintain_keeps_idle_sessions_warm_with_noop(smtp_server):
+    controller, handler = smtp_server
+    pool = make_pool(controller, max_idle=60)
+    try:
+        send(pool, message("first"))
+        pool.maintain()
+        pool.maintain()
+        assert handler.noops == 2
+        assert len(pool._idle) == 1
+        send(pool, message("second"))
+    finally:
+        pool.close()
+
+    assert len(handler.sessions) == 1
+
+def test_keepalive_thread_sends_noop(smtp_server):
+    controller, handler = smtp_server
+    pool = make_pool(controller, keepalive_interval=0.05, max_idle=60)
+    try:
+        send(pool, message("first"))
+        deadline = time.monotonic() + 5
+        while handler.noops == 0 and time.monotonic() < deadline:
+            time.sleep(0.02)
+    finally:
+        pool.close()
+
+    assert handler.noops >= 1
+
+def test_sessions_idle_past_max_idle_are_evicted(smtp_server):
+    controller, handler = smtp_server
+    pool = make_pool(controller, max_idle=0.05)
+    try:
+        send(pool, message("first"))
+        time.sleep(0.1)
+        pool.maintain()
+        assert pool._idle == []
+
+        send(pool, message("second"))
+        time.sleep(0.1)
+        # Also evicted on checkout, without waiting for maintenance
+        send(pool, message("third"))
+    finally:
+        pool.close()
+
+    assert len(handler.messages) == 3
+    assert len(handler.sessions) == 3
+    assert handler.quits >= 2
@@ -0,0 +1,44 @@
+"""
+The API must answer its first request within the startup budget.
+
+Starts the app under uvicorn on mongomock-motor (the load test's in-memory
+launcher) with the mail server pointed at a closed local port, and checks
+the time from process start to the first byte of /api/ against
+STARTUP_BUDGET_MS (default 3000). Skipped when mongomock-motor is missing.
+
+    python -m pytest tests/test_startup_budget.py
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent / "backend"
+sys.path.insert(0, str(BACKEND_DIR / "benchmarks"))
+
+pytest.importorskip("mongomock_motor")
+pytest.importorskip("aiosmtpd")
+pytest.importorskip("httpx")
+
+from startup_budget import DEFAULT_BUDGET_MS, free_port, measure_startup
+
+BUDGET_MS = float(os.environ.get('STARTUP_BUDGET_MS', DEFAULT_BUDGET_MS))
+
+def test_first_byte_within_budget(tmp_path):
+    env = os.environ.copy()
+    env.update({
+        "MONGO_URL": "mongodb://in-memory",
+        "DB_NAME": "startup_budget_test",
+        # Nothing listens here, so the SMTP probe fails fast and sends nothing
+        "SMTP_SERVER": "127.0.0.1",
+        "SMTP_PORT": str(free_port()),
+        "SMTP_STARTTLS": "false",
+        "PHOTO_STORE_DIR": str(tmp_path / "photo_store"),
+    })
+
+    first_byte, ready = measure_startup(in_memory=True, env=env, timeout=60)
+
+    assert first_byte * 1000 <= BUDGET_MS, f"first byte after {first_byte * 1000:.0f} ms (budget {BUDGET_MS:.0f} ms)"
+    assert ready is not None, "/api/ready never reported 200"
@@ -0,0 +1,105 @@
+"""
+Single-flight loading and invalidation in database.TTLCache.
+
+    python -m pytest tests/test_ttl_cache.py
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent / "backend"
+sys.path.insert(0, str(BACKEND_DIR))
+
+from database import TTLCache
+
+class GatedLoader:
+    """Loader that counts calls and blocks until released"""
+
+    def __init__(self, value):
+        self.value = value
+        self.calls = 0
+        self.release = asyncio.Event()
+
+    async def __call__(self):
+        self.calls += 1
+        await self.release.wait()
+        return self.value
+
+def test_concurrent_misses_share_one_load():
+    async def run():
+        cache = TTLCache(ttl=60, max_entries=8)
+        loader = GatedLoader(["a", "b"])
+        waiters = [asyncio.ensure_future(cache.get_or_load("services", loader)) for _ in range(5)]
+        await asyncio.sleep(0)
+        loader.release.set()
+        results = await asyncio.gather(*waiters)
+        # Served from the cache now
+        again = await cache.get_or_load("services", loader)
+        return loader.calls, results, again
+
+    calls, results, again = asyncio.run(run())
+    assert calls == 1
+    assert all(result is results[0] for result in results)
+    assert again is results[0]
+
+def test_invalidate_during_load_drops_the_result():
+    async def run():
+        cache = TTLCache(ttl=60, max_entries=8)
+        stale = GatedLoader("stale")
+        pending = asyncio.ensure_future(cache.get_or_load("services", stale))
+        await asyncio.sleep(0)
+        cache.invalidate("services")
+        stale.release.set()
+        # Waiters that joined before the invalidation still get their answer
+        first = await pending
+
+        fresh = GatedLoader("fresh")
+        fresh.release.set()
+        second = await cache.get_or_load("services", fresh)
+        return first, second, stale.calls, fresh.calls
+
+    first, second, stale_calls, fresh_calls = asyncio.run(run())
+    assert first == "stale"
+    assert second == "fresh"
+    assert (stale_calls, fresh_calls) == (1, 1)
+
+def test_load_after_invalidation_is_not_joined_to_the_stale_one():
+    async def run():
+        cache = TTLCache(ttl=60, max_entries=8)
+        stale = GatedLoader("stale")
+        fresh = GatedLoader("fresh")
+        old = asyncio.ensure_future(cache.get_or_load("services", stale))
+        await asyncio.sleep(0)
+        cache.invalidate("services")
+        new = asyncio.ensure_future(cache.get_or_load("services", fresh))
+        await asyncio.sleep(0)
+        # The stale load finishing first must not store over the fresh one
+        stale.release.set()
+        await old
+        fresh.release.set()
+        await new
+        return await cache.get_or_load("services", GatedLoader("unused"))
+
+    assert asyncio.run(run()) == "fresh"
+
+def test_cache_none_false_does_not_store_misses():
+    async def run():
+        cache = TTLCache(ttl=60, max_entries=8)
+        missing = GatedLoader(None)
+        missing.release.set()
+        waiters = [cache.get_or_load("service:x", missing, cache_none=False) for _ in range(3)]
+        results = await asyncio.gather(*waiters)
+        await cache.get_or_load("service:x", missing, cache_none=False)
+
+        cached = GatedLoader(None)
+        cached.release.set()
+        await cache.get_or_load("company_info", cached)
+        await cache.get_or_load("company_info", cached)
+        return results, missing.calls, cached.calls
+
+    results, missing_calls, cached_calls = asyncio.run(run())
+    assert results == [None, None, None]
+    # One shared load for the concurrent waiters, then a fresh one
+    assert missing_calls == 2
+    assert cached_calls == 1